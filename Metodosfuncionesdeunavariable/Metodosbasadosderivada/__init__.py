@@ -1,4 +1,6 @@
 #Metodos basados en la derivada
 from .newton_rhapson import linspace, derivada, segunda_derivada, delta_x, caja, lata, f1, f2, f3, f4, newton_method
 from .biseccion import linspace, derivada, segunda_derivada, delta_x, caja, lata, f1, f2, f3, f4, biseccion
-from .secante import linspace, derivada, segunda_derivada, delta_x, caja, lata, f1, f2, f3, f4, secante 
\ No newline at end of file
+from .secante import linspace, derivada, segunda_derivada, delta_x, caja, lata, f1, f2, f3, f4, secante 
+from .diferenciacion_automatica import Dual, como_dual, derivadas_ad
+from .oraculo_derivadas import oraculo_derivadas
\ No newline at end of file
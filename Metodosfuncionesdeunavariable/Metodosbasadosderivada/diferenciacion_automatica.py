@@ -0,0 +1,225 @@
+import numpy as np
+
+class Dual:
+    """
+    Número dual de segundo orden para diferenciación automática en modo directo.
+    Guarda el valor de una expresión junto con su primera y segunda derivada respecto
+    a la variable independiente, y propaga ambas por la regla de la cadena en cada
+    operación aritmética y en las funciones universales de NumPy más comunes. Los
+    componentes pueden ser escalares o arreglos de NumPy del mismo tamaño.
+
+    Args:
+        valor (float or np.ndarray): Valor de la expresión.
+        primera (float or np.ndarray, opcional): Primera derivada. Por defecto es 0.
+        segunda (float or np.ndarray, opcional): Segunda derivada. Por defecto es 0.
+    """
+
+    # Hace que NumPy delegue en __array_ufunc__ en operaciones como np.float64 * Dual
+    __array_priority__ = 1000
+
+    def __init__(self, valor, primera=0.0, segunda=0.0):
+        self.valor = valor
+        self.primera = primera
+        self.segunda = segunda
+
+    def __repr__(self):
+        return f'Dual({self.valor!r}, {self.primera!r}, {self.segunda!r})'
+
+    def _cadena(self, valor, d_valor, d2_valor):
+        # Regla de la cadena de segundo orden para g(self)
+        return Dual(valor,
+                    d_valor * self.primera,
+                    d2_valor * self.primera ** 2 + d_valor * self.segunda)
+
+    def __add__(self, otro):
+        otro = como_dual(otro)
+        return Dual(self.valor + otro.valor, self.primera + otro.primera, self.segunda + otro.segunda)
+
+    __radd__ = __add__
+
+    def __sub__(self, otro):
+        otro = como_dual(otro)
+        return Dual(self.valor - otro.valor, self.primera - otro.primera, self.segunda - otro.segunda)
+
+    def __rsub__(self, otro):
+        return como_dual(otro) - self
+
+    def __mul__(self, otro):
+        otro = como_dual(otro)
+        return Dual(self.valor * otro.valor,
+                    self.valor * otro.primera + self.primera * otro.valor,
+                    self.valor * otro.segunda + 2 * self.primera * otro.primera + self.segunda * otro.valor)
+
+    __rmul__ = __mul__
+
+    def reciproco(self):
+        v = self.valor
+        return self._cadena(1 / v, -1 / v ** 2, 2 / v ** 3)
+
+    def __truediv__(self, otro):
+        otro = como_dual(otro)
+        return self * otro.reciproco()
+
+    def __rtruediv__(self, otro):
+        return como_dual(otro) * self.reciproco()
+
+    def __pow__(self, otro):
+        if isinstance(otro, Dual):
+            return exp(otro * log(self))
+        if otro == 0:
+            return Dual(self.valor ** 0, 0 * self.primera, 0 * self.segunda)
+        if otro == 1:
+            return Dual(self.valor, self.primera, self.segunda)
+        v = self.valor
+        d2 = otro * (otro - 1) * v ** (otro - 2) if otro != 2 else 2 + 0 * v
+        return self._cadena(v ** otro, otro * v ** (otro - 1), d2)
+
+    def __rpow__(self, otro):
+        return exp(self * np.log(otro))
+
+    def __neg__(self):
+        return Dual(-self.valor, -self.primera, -self.segunda)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        signo = np.sign(self.valor)
+        return Dual(abs(self.valor), signo * self.primera, signo * self.segunda)
+
+    def __lt__(self, otro):
+        return self.valor < como_dual(otro).valor
+
+    def __le__(self, otro):
+        return self.valor <= como_dual(otro).valor
+
+    def __gt__(self, otro):
+        return self.valor > como_dual(otro).valor
+
+    def __ge__(self, otro):
+        return self.valor >= como_dual(otro).valor
+
+    def __getitem__(self, indice):
+        return Dual(self.valor[indice],
+                    np.broadcast_to(self.primera, np.shape(self.valor))[indice],
+                    np.broadcast_to(self.segunda, np.shape(self.valor))[indice])
+
+    def __len__(self):
+        return len(self.valor)
+
+    def sum(self, axis=None, **kwargs):
+        forma = np.shape(self.valor)
+        return Dual(np.sum(self.valor, axis=axis),
+                    np.sum(np.broadcast_to(self.primera, forma), axis=axis),
+                    np.sum(np.broadcast_to(self.segunda, forma), axis=axis))
+
+    def __array_ufunc__(self, ufunc, method, *entradas, **kwargs):
+        if method != '__call__' or kwargs.get('out') is not None:
+            return NotImplemented
+        if ufunc in _UFUNCS_BINARIAS:
+            a, b = entradas
+            return _UFUNCS_BINARIAS[ufunc](como_dual(a), b)
+        if ufunc in _UFUNCS_UNARIAS:
+            return _UFUNCS_UNARIAS[ufunc](entradas[0])
+        return NotImplemented
+
+def como_dual(x):
+    """
+    Convierte una constante (escalar o arreglo) en un Dual con derivadas nulas.
+
+    Args:
+        x (float, np.ndarray or Dual): Valor a convertir.
+
+    Returns:
+        Dual: El mismo x si ya es Dual, o la constante x como Dual.
+    """
+    if isinstance(x, Dual):
+        return x
+    return Dual(x, 0.0, 0.0)
+
+def exp(g):
+    e = np.exp(g.valor)
+    return g._cadena(e, e, e)
+
+def log(g):
+    v = g.valor
+    return g._cadena(np.log(v), 1 / v, -1 / v ** 2)
+
+def sqrt(g):
+    r = np.sqrt(g.valor)
+    return g._cadena(r, 1 / (2 * r), -1 / (4 * r ** 3))
+
+def sin(g):
+    s, c = np.sin(g.valor), np.cos(g.valor)
+    return g._cadena(s, c, -s)
+
+def cos(g):
+    s, c = np.sin(g.valor), np.cos(g.valor)
+    return g._cadena(c, -s, -c)
+
+def tan(g):
+    t = np.tan(g.valor)
+    sec2 = 1 + t ** 2
+    return g._cadena(t, sec2, 2 * t * sec2)
+
+def arctan(g):
+    v = g.valor
+    return g._cadena(np.arctan(v), 1 / (1 + v ** 2), -2 * v / (1 + v ** 2) ** 2)
+
+def sinh(g):
+    s, c = np.sinh(g.valor), np.cosh(g.valor)
+    return g._cadena(s, c, s)
+
+def cosh(g):
+    s, c = np.sinh(g.valor), np.cosh(g.valor)
+    return g._cadena(c, s, c)
+
+def tanh(g):
+    t = np.tanh(g.valor)
+    return g._cadena(t, 1 - t ** 2, -2 * t * (1 - t ** 2))
+
+_UFUNCS_UNARIAS = {
+    np.negative: lambda g: -g,
+    np.positive: lambda g: +g,
+    np.absolute: abs,
+    np.square: lambda g: g ** 2,
+    np.reciprocal: lambda g: g.reciproco(),
+    np.exp: exp,
+    np.log: log,
+    np.log10: lambda g: log(g) / np.log(10),
+    np.log2: lambda g: log(g) / np.log(2),
+    np.sqrt: sqrt,
+    np.sin: sin,
+    np.cos: cos,
+    np.tan: tan,
+    np.arctan: arctan,
+    np.sinh: sinh,
+    np.cosh: cosh,
+    np.tanh: tanh,
+}
+
+_UFUNCS_BINARIAS = {
+    np.add: lambda a, b: a + b,
+    np.subtract: lambda a, b: a - b,
+    np.multiply: lambda a, b: a * b,
+    np.true_divide: lambda a, b: a / b,
+    np.power: lambda a, b: a ** b,
+}
+
+def derivadas_ad(f, x):
+    """
+    Calcula f(x), f'(x) y f''(x) exactas en una sola evaluación de f usando números
+    duales. f debe estar escrita con aritmética de Python y funciones universales
+    de NumPy.
+
+    Args:
+        f (function): La función a derivar.
+        x (float): El punto en el cual se calculan las derivadas.
+
+    Returns:
+        tuple: (f(x), f'(x), f''(x)).
+    """
+    resultado = f(Dual(x, 1.0, 0.0))
+    if not isinstance(resultado, Dual):
+        return resultado, 0.0, 0.0
+    return resultado.valor, resultado.primera, resultado.segunda
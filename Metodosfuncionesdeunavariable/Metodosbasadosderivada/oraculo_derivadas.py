@@ -0,0 +1,59 @@
+# Basado en Central Difference Method (Scarborough, 1966)
+try:
+    from .diferenciacion_automatica import derivadas_ad
+except ImportError:
+    # Ejecutado como script: la carpeta del módulo está en sys.path
+    from diferenciacion_automatica import derivadas_ad
+
+def oraculo_derivadas(f, derivative="fd"):
+    """
+    Crea un oráculo de derivadas para la función f. Con derivative="fd" el oráculo evalúa
+    una sola vez cada punto del esténcil x - h, x, x + h y guarda los resultados por
+    (x, h), de modo que pedir f, f' y f'' en el mismo punto, o volver a pedirlas, no
+    repite evaluaciones. Con derivative="ad" las derivadas se obtienen exactas por
+    diferenciación automática (números duales) con una sola evaluación de f por punto,
+    y h se ignora.
+
+    Args:
+        f (function): La función a derivar.
+        derivative (str, opcional): "fd" para diferencias centrales o "ad" para
+        diferenciación automática. Por defecto es "fd".
+
+    Returns:
+        function: Función derivadas(x, h, segunda=True) que retorna la tupla
+        (f(x), f'(x), f''(x)). Con derivative="fd" y segunda=False sólo se evalúan
+        x - h y x + h y se retorna (None, f'(x), None). El atributo derivadas.nfev
+        cuenta las evaluaciones de f realizadas.
+    """
+    if derivative not in ("fd", "ad"):
+        raise ValueError('derivative debe ser "fd" o "ad"')
+    valores = {}
+    resultados = {}
+
+    def evaluar(x):
+        if x not in valores:
+            valores[x] = f(x)
+            derivadas.nfev += 1
+        return valores[x]
+
+    def derivadas_fd(x, h, segunda=True):
+        if (x, h) in resultados:
+            return resultados[(x, h)]
+        f_adelante = evaluar(x + h)
+        f_atras = evaluar(x - h)
+        primera = (f_adelante - f_atras) / (2 * h)
+        if not segunda:
+            return None, primera, None
+        fx = evaluar(x)
+        resultados[(x, h)] = (fx, primera, (f_adelante - 2 * fx + f_atras) / (h ** 2))
+        return resultados[(x, h)]
+
+    def derivadas_automaticas(x, h=None, segunda=True):
+        if x not in resultados:
+            resultados[x] = derivadas_ad(f, x)
+            derivadas.nfev += 1
+        return resultados[x]
+
+    derivadas = derivadas_fd if derivative == "fd" else derivadas_automaticas
+    derivadas.nfev = 0
+    return derivadas
@@ -1,4 +1,4 @@
 #Metodos de eliminación de regiones
 from .bounding_phase_method import linspace, caja, lata, f1, f2, f3, f4, bounding_p_m
-from .fibonacci import linspace, caja, lata, f1, f2, f3, f4, fibonacci_search
-from .golden_search_method import linspace, caja, lata, f1, f2, f3, f4, golden_search
\ No newline at end of file
+from .fibonacci import linspace, caja, lata, f1, f2, f3, f4, numero_fibonacci, fibonacci_search
+from .golden_search_method import linspace, caja, lata, f1, f2, f3, f4, w_to_x, iteraciones_golden, evaluaciones_golden, golden_search, golden_search_lote
\ No newline at end of file
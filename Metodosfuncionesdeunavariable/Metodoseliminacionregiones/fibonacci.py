@@ -1,5 +1,5 @@
+import bisect
 import numpy as np
-import matplotlib.pyplot as plt
 
 def linspace(start, stop, step=0.05):
     """
@@ -103,14 +103,6 @@ def f4(x):
     """
     return 3 * ((x)**4) - 8 * ((x)**3) - 6 * ((x)**2) + 12 * (x)
 
-#Arreglos con los límites generados para cada función
-lim_lata = linspace(0.5, 8)
-lim_caja = linspace(2, 3)
-lim_f1 = linspace(0, 10)
-lim_f2 = linspace(0, 5)
-lim_f3 = linspace(-2.5, 2.5)
-lim_f4 = linspace(-1.5, 3)
-
 def fibonacci(n):
     """
     Genera los primeros n números de Fibonacci.
@@ -128,6 +120,35 @@ def fibonacci(n):
         fib.append(fib[-1] + fib[-2])
     return fib
 
+# Tablas compartidas entre llamadas: los números de Fibonacci se generan una sola vez
+# y las razones F(j-1)/F(j) se guardan como flotantes para no dividir enteros grandes
+# dentro del ciclo de búsqueda. F(100) ~ 3.5e20 cubre cualquier precisión representable.
+_FIBONACCI = fibonacci(100)
+_RAZONES = [0.0] + [_FIBONACCI[j - 1] / _FIBONACCI[j] for j in range(1, len(_FIBONACCI))]
+
+def numero_fibonacci(a, b, precision):
+    """
+    Calcula el menor n tal que la búsqueda de Fibonacci reduce el intervalo [a, b] a un
+    intervalo de longitud menor o igual a precision, es decir, el menor n con
+    F(n) >= 2 * (b - a) / precision.
+
+    Parameters:
+    a : float
+        Extremo izquierdo del intervalo inicial.
+    b : float
+        Extremo derecho del intervalo inicial.
+    precision : float
+        Precisión deseada para la solución.
+
+    Returns:
+    int
+        Número de términos de Fibonacci necesarios. La búsqueda hace n - 2 evaluaciones.
+    """
+    n = bisect.bisect_left(_FIBONACCI, 2 * (b - a) / precision)
+    if n >= len(_FIBONACCI):
+        raise ValueError('La precisión es demasiado pequeña para el intervalo dado')
+    return max(n, 3)
+
 def fibonacci_search(a, b, n, precision, f):
     """
     Realiza una búsqueda utilizando el método de la búsqueda de Fibonacci para encontrar el mínimo de una función f en el intervalo [a, b].
@@ -137,8 +158,9 @@ def fibonacci_search(a, b, n, precision, f):
         Extremo izquierdo del intervalo inicial.
     b : float
         Extremo derecho del intervalo inicial.
-    n : int
-        Número de términos de Fibonacci a usar.
+    n : int or None
+        Número máximo de términos de Fibonacci a usar. Si es None se usa el mínimo
+        necesario para alcanzar la precisión, calculado con numero_fibonacci.
     precision : float
         Precisión deseada para la solución.
     f : function
@@ -148,147 +170,168 @@ def fibonacci_search(a, b, n, precision, f):
     tuple
         Tupla con los dos últimos valores calculados de x que se aproximaron al mínimo de la función f.
     """
-    fib = fibonacci(n)  # Generar los números de Fibonacci hasta n
-    k = 2
+    n_minimo = numero_fibonacci(a, b, precision)
+    n = n_minimo if n is None else max(3, min(n, n_minimo))
     L = b - a
-    x1 = a + (fib[n - k - 1] / fib[n - k + 1]) * L
-    x2 = a + (fib[n - k] / fib[n - k + 1]) * L
-    
+    x1 = a + (1 - _RAZONES[n]) * L
+    x2 = a + _RAZONES[n] * L
+    if n == 3:
+        return (x1, x2)
+
     # Evaluaciones iniciales de la función
     f1 = f(x1)
     f2 = f(x2)
-    
-    while k < n and abs(b - a) > precision:
+
+    # En la etapa j el intervalo se reduce por F(j-1)/F(j) y uno de los puntos
+    # interiores se reutiliza; en la última etapa ambos puntos coinciden.
+    for j in range(n - 1, 2, -1):
+        r = _RAZONES[j]
         if f1 > f2:
             a = x1
             x1 = x2
-            x2 = a + (fib[n - k] / fib[n - k + 1]) * L
             f1 = f2
-            f2 = f(x2)
+            L = b - a
+            x2 = a + r * L
+            if j > 3:
+                f2 = f(x2)
         else:
             b = x2
             x2 = x1
-            x1 = a + (fib[n - k - 1] / fib[n - k + 1]) * L
             f2 = f1
-            f1 = f(x1)
-        k += 1
-        L = b - a
+            L = b - a
+            x1 = a + (1 - r) * L
+            if j > 3:
+                f1 = f(x1)
     # Devolver los dos últimos valores de x calculados
     return (x1, x2)
 
-print(fibonacci_search(0.6, 7, 50, 0.5,f1))
-
-# Calcular puntos para cada función
-puntos_lata1 = fibonacci_search(0.6, 5, 50, 0.5, lata)
-puntos_lata2 = fibonacci_search(0.6, 5, 50, 0.1, lata)
-puntos_lata3 = fibonacci_search(0.6, 5, 50, 0.01, lata)
-puntos_lata4 = fibonacci_search(0.6, 5, 50, 0.0001, lata)
-
-puntos_caja1 = fibonacci_search(2, 3, 50, 0.5, caja)
-puntos_caja2 = fibonacci_search(2, 3, 50, 0.1, caja)
-puntos_caja3 = fibonacci_search(2, 3, 50, 0.01, caja)
-puntos_caja4 = fibonacci_search(2, 3, 50, 0.0001, caja)
-
-puntos_f11 = fibonacci_search(0.6, 5, 50, 0.5, f1)
-puntos_f12 = fibonacci_search(0.6, 5, 50, 0.1, f1)
-puntos_f13 = fibonacci_search(0.6, 5, 50, 0.01, f1)
-puntos_f14 = fibonacci_search(0.6, 5, 50, 0.0001, f1)
-
-puntos_f21 = fibonacci_search(0.6, 5, 50, 0.5, f2)
-puntos_f22 = fibonacci_search(0.6, 5, 50, 0.1, f2)
-puntos_f23 = fibonacci_search(0.6, 5, 50, 0.01, f2)
-puntos_f24 = fibonacci_search(0.6, 5, 50, 0.0001, f2)
-
-puntos_f31 = fibonacci_search(-2, 2.5, 50, 0.5, f3)
-puntos_f32 = fibonacci_search(-2, 2.5, 50, 0.1, f3)
-puntos_f33 = fibonacci_search(-2, 2.5, 50, 0.01, f3)
-puntos_f34 = fibonacci_search(-2, 2.5, 50, 0.0001,f3)
-
-puntos_f41 = fibonacci_search(-1.8, 2.5, 50, 0.5, f4)
-puntos_f42 = fibonacci_search(-1.8, 2.5, 50, 0.1, f4)
-puntos_f43 = fibonacci_search(-1.8, 2.5, 50, 0.01,f4)
-puntos_f44 = fibonacci_search(-1.8, 2.5, 50, 0.0001,f4)
-
-# Grafica resultados
-plt.figure(figsize=(12, 8))
-
-# Grafica función lata
-plt.subplot(231)
-plt.plot(lim_lata, lata(lim_lata), label='Función')
-plt.scatter(puntos_lata1[0], lata(puntos_lata1[0]), label='Delta=0.5', marker='o')
-plt.scatter(puntos_lata2[0], lata(puntos_lata2[0]), label='Delta=0.1', marker='o')
-plt.scatter(puntos_lata3[0], lata(puntos_lata3[0]), label='Delta=0.01', marker='o')
-plt.scatter(puntos_lata4[0], lata(puntos_lata4[0]), label='Delta=0.0001', marker='o')
-plt.xlabel('Valores de x')
-plt.ylabel('Valores de y')
-plt.title('Función Lata')
-plt.legend()
-plt.grid(True)
-
-# Grafica función caja
-plt.subplot(232)
-plt.plot(lim_caja, caja(lim_caja), label='Función')
-plt.scatter(puntos_caja1[0], caja(puntos_caja1[0]), label='Delta=0.5', marker='o')
-plt.scatter(puntos_caja2[0], caja(puntos_caja2[0]), label='Delta=0.1', marker='o')
-plt.scatter(puntos_caja3[0], caja(puntos_caja3[0]), label='Delta=0.01', marker='o')
-plt.scatter(puntos_caja4[0], caja(puntos_caja4[0]), label='Delta=0.0001', marker='o')
-plt.xlabel('Valores de x')
-plt.ylabel('Valores de y')
-plt.title('Función Caja')
-plt.legend()
-plt.grid(True)
-
-# Grafica función f1
-plt.subplot(233)
-plt.plot(lim_f1, f1(lim_f1), label='Función')
-plt.scatter(puntos_f11[1], f1(puntos_f11[1]), label='Delta=0.5', marker='o')
-plt.scatter(puntos_f12[1], f1(puntos_f12[1]), label='Delta=0.1', marker='o')
-plt.scatter(puntos_f13[1], f1(puntos_f13[1]), label='Delta=0.01', marker='o')
-plt.scatter(puntos_f14[1], f1(puntos_f14[1]), label='Delta=0.0001', marker='o')
-plt.xlabel('Valores de x')
-plt.ylabel('Valores de y')
-plt.title('Función f1')
-plt.legend()
-plt.grid(True)
-
-# Grafica función f2
-plt.subplot(234)
-plt.plot(lim_f2, f2(lim_f2), label='Función')
-plt.scatter(puntos_f21[1], puntos_f21[1], label='Delta=0.5', marker='o')
-plt.scatter(puntos_f22[1], puntos_f22[1], label='Delta=0.1', marker='o')
-plt.scatter(puntos_f23[1], puntos_f23[1], label='Delta=0.01', marker='o')
-plt.scatter(puntos_f24[1], puntos_f24[1], label='Delta=0.0001', marker='o')
-plt.xlabel('Valores de x')
-plt.ylabel('Valores de y')
-plt.title('Función f2')
-plt.legend()
-plt.grid(True)
-
-# Graficar función f3
-plt.subplot(235)
-plt.plot(lim_f3, f3(lim_f3), label='Función')
-plt.scatter(puntos_f31[1], f3(puntos_f31[1]), label='Delta=0.5', marker='o')
-plt.scatter(puntos_f32[1], f3(puntos_f32[1]), label='Delta=0.1', marker='o')
-plt.scatter(puntos_f33[0], f3(puntos_f33[0]), label='Delta=0.01', marker='o')
-plt.scatter(puntos_f34[1], f3(puntos_f34[1]), label='Delta=0.0001', marker='o')
-plt.xlabel('Valores de x')
-plt.ylabel('Valores de y')
-plt.title('Función f3')
-plt.legend()
-plt.grid(True)
-
-# Graficar función f4
-plt.subplot(236)
-plt.plot(lim_f4, f4(lim_f4), label='Función')
-plt.scatter(puntos_f41[1], f4(puntos_f41[1]), label='Delta=0.5', marker='o')
-plt.scatter(puntos_f42[1], f4(puntos_f42[1]), label='Delta=0.1', marker='o')
-plt.scatter(puntos_f43[1], f4(puntos_f43[1]), label='Delta=0.01', marker='o')
-plt.scatter(puntos_f44[1], f4(puntos_f44[1]), label='Delta=0.0001', marker='o')
-plt.xlabel('Valores de x')
-plt.ylabel('Valores de y')
-plt.title('Función f4')
-plt.legend()
-plt.grid(True)
-
-plt.tight_layout()
-plt.show()
\ No newline at end of file
+def main():
+    """Ejecuta los ejemplos del módulo y grafica los resultados."""
+    import matplotlib.pyplot as plt
+    #Arreglos con los límites generados para cada función
+    lim_lata = linspace(0.5, 8)
+    lim_caja = linspace(2, 3)
+    lim_f1 = linspace(0, 10)
+    lim_f2 = linspace(0, 5)
+    lim_f3 = linspace(-2.5, 2.5)
+    lim_f4 = linspace(-1.5, 3)
+
+    print(fibonacci_search(0.6, 7, None, 0.5,f1))
+
+    # Calcular puntos para cada función
+    puntos_lata1 = fibonacci_search(0.6, 5, None, 0.5, lata)
+    puntos_lata2 = fibonacci_search(0.6, 5, None, 0.1, lata)
+    puntos_lata3 = fibonacci_search(0.6, 5, None, 0.01, lata)
+    puntos_lata4 = fibonacci_search(0.6, 5, None, 0.0001, lata)
+
+    puntos_caja1 = fibonacci_search(2, 3, None, 0.5, caja)
+    puntos_caja2 = fibonacci_search(2, 3, None, 0.1, caja)
+    puntos_caja3 = fibonacci_search(2, 3, None, 0.01, caja)
+    puntos_caja4 = fibonacci_search(2, 3, None, 0.0001, caja)
+
+    puntos_f11 = fibonacci_search(0.6, 5, None, 0.5, f1)
+    puntos_f12 = fibonacci_search(0.6, 5, None, 0.1, f1)
+    puntos_f13 = fibonacci_search(0.6, 5, None, 0.01, f1)
+    puntos_f14 = fibonacci_search(0.6, 5, None, 0.0001, f1)
+
+    puntos_f21 = fibonacci_search(0.6, 5, None, 0.5, f2)
+    puntos_f22 = fibonacci_search(0.6, 5, None, 0.1, f2)
+    puntos_f23 = fibonacci_search(0.6, 5, None, 0.01, f2)
+    puntos_f24 = fibonacci_search(0.6, 5, None, 0.0001, f2)
+
+    puntos_f31 = fibonacci_search(-2, 2.5, None, 0.5, f3)
+    puntos_f32 = fibonacci_search(-2, 2.5, None, 0.1, f3)
+    puntos_f33 = fibonacci_search(-2, 2.5, None, 0.01, f3)
+    puntos_f34 = fibonacci_search(-2, 2.5, None, 0.0001,f3)
+
+    puntos_f41 = fibonacci_search(-1.8, 2.5, None, 0.5, f4)
+    puntos_f42 = fibonacci_search(-1.8, 2.5, None, 0.1, f4)
+    puntos_f43 = fibonacci_search(-1.8, 2.5, None, 0.01,f4)
+    puntos_f44 = fibonacci_search(-1.8, 2.5, None, 0.0001,f4)
+
+    # Grafica resultados
+    plt.figure(figsize=(12, 8))
+
+    # Grafica función lata
+    plt.subplot(231)
+    plt.plot(lim_lata, lata(lim_lata), label='Función')
+    plt.scatter(puntos_lata1[0], lata(puntos_lata1[0]), label='Delta=0.5', marker='o')
+    plt.scatter(puntos_lata2[0], lata(puntos_lata2[0]), label='Delta=0.1', marker='o')
+    plt.scatter(puntos_lata3[0], lata(puntos_lata3[0]), label='Delta=0.01', marker='o')
+    plt.scatter(puntos_lata4[0], lata(puntos_lata4[0]), label='Delta=0.0001', marker='o')
+    plt.xlabel('Valores de x')
+    plt.ylabel('Valores de y')
+    plt.title('Función Lata')
+    plt.legend()
+    plt.grid(True)
+
+    # Grafica función caja
+    plt.subplot(232)
+    plt.plot(lim_caja, caja(lim_caja), label='Función')
+    plt.scatter(puntos_caja1[0], caja(puntos_caja1[0]), label='Delta=0.5', marker='o')
+    plt.scatter(puntos_caja2[0], caja(puntos_caja2[0]), label='Delta=0.1', marker='o')
+    plt.scatter(puntos_caja3[0], caja(puntos_caja3[0]), label='Delta=0.01', marker='o')
+    plt.scatter(puntos_caja4[0], caja(puntos_caja4[0]), label='Delta=0.0001', marker='o')
+    plt.xlabel('Valores de x')
+    plt.ylabel('Valores de y')
+    plt.title('Función Caja')
+    plt.legend()
+    plt.grid(True)
+
+    # Grafica función f1
+    plt.subplot(233)
+    plt.plot(lim_f1, f1(lim_f1), label='Función')
+    plt.scatter(puntos_f11[1], f1(puntos_f11[1]), label='Delta=0.5', marker='o')
+    plt.scatter(puntos_f12[1], f1(puntos_f12[1]), label='Delta=0.1', marker='o')
+    plt.scatter(puntos_f13[1], f1(puntos_f13[1]), label='Delta=0.01', marker='o')
+    plt.scatter(puntos_f14[1], f1(puntos_f14[1]), label='Delta=0.0001', marker='o')
+    plt.xlabel('Valores de x')
+    plt.ylabel('Valores de y')
+    plt.title('Función f1')
+    plt.legend()
+    plt.grid(True)
+
+    # Grafica función f2
+    plt.subplot(234)
+    plt.plot(lim_f2, f2(lim_f2), label='Función')
+    plt.scatter(puntos_f21[1], puntos_f21[1], label='Delta=0.5', marker='o')
+    plt.scatter(puntos_f22[1], puntos_f22[1], label='Delta=0.1', marker='o')
+    plt.scatter(puntos_f23[1], puntos_f23[1], label='Delta=0.01', marker='o')
+    plt.scatter(puntos_f24[1], puntos_f24[1], label='Delta=0.0001', marker='o')
+    plt.xlabel('Valores de x')
+    plt.ylabel('Valores de y')
+    plt.title('Función f2')
+    plt.legend()
+    plt.grid(True)
+
+    # Graficar función f3
+    plt.subplot(235)
+    plt.plot(lim_f3, f3(lim_f3), label='Función')
+    plt.scatter(puntos_f31[1], f3(puntos_f31[1]), label='Delta=0.5', marker='o')
+    plt.scatter(puntos_f32[1], f3(puntos_f32[1]), label='Delta=0.1', marker='o')
+    plt.scatter(puntos_f33[0], f3(puntos_f33[0]), label='Delta=0.01', marker='o')
+    plt.scatter(puntos_f34[1], f3(puntos_f34[1]), label='Delta=0.0001', marker='o')
+    plt.xlabel('Valores de x')
+    plt.ylabel('Valores de y')
+    plt.title('Función f3')
+    plt.legend()
+    plt.grid(True)
+
+    # Graficar función f4
+    plt.subplot(236)
+    plt.plot(lim_f4, f4(lim_f4), label='Función')
+    plt.scatter(puntos_f41[1], f4(puntos_f41[1]), label='Delta=0.5', marker='o')
+    plt.scatter(puntos_f42[1], f4(puntos_f42[1]), label='Delta=0.1', marker='o')
+    plt.scatter(puntos_f43[1], f4(puntos_f43[1]), label='Delta=0.01', marker='o')
+    plt.scatter(puntos_f44[1], f4(puntos_f44[1]), label='Delta=0.0001', marker='o')
+    plt.xlabel('Valores de x')
+    plt.ylabel('Valores de y')
+    plt.title('Función f4')
+    plt.legend()
+    plt.grid(True)
+
+    plt.tight_layout()
+    plt.show()
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,5 @@
+import math
 import numpy as np
-import matplotlib.pyplot as plt
 
 def linspace(start, stop, step=0.05):
     """
@@ -103,19 +103,86 @@ def f4(x):
     """
     return (3*((x)**4)) - (8*((x)**3)) - (6*((x)**2)) + 12*(x)
 
-# Arreglos con los límites generados para cada función
-lim_lata = linspace(0.5, 8)
-lim_caja = linspace(2, 3)
-lim_f1 = linspace(0, 10)
-lim_f2 = linspace(0, 5)
-lim_f3 = linspace(-2.5, 2.5)
-lim_f4 = linspace(-1.5, 3)
+# Razón dorada exacta
+PHI = (np.sqrt(5) - 1) / 2
+
+def w_to_x(w, a, b):
+    """
+    Transforma un valor w del intervalo normalizado [0, 1] al intervalo [a, b].
+
+    Parámetros:
+    w : float
+        Valor en el intervalo [0, 1].
+    a : float
+        Extremo izquierdo del intervalo de salida.
+    b : float
+        Extremo derecho del intervalo de salida.
+
+    Retorna:
+    float
+        Valor transformado en el intervalo [a, b].
+    """
+    return w * (b - a) + a
+
+def iteraciones_golden(a, b, epsilon):
+    """
+    Calcula cuántas reducciones del intervalo necesita golden_search para que el
+    intervalo [a, b] mida a lo más epsilon. Cada reducción lo multiplica por PHI.
+
+    Parámetros:
+    a : float
+        Extremo izquierdo del intervalo de búsqueda.
+    b : float
+        Extremo derecho del intervalo de búsqueda.
+    epsilon : float
+        Precisión deseada para la aproximación del mínimo.
+
+    Retorna:
+    int
+        Número de reducciones del intervalo.
+    """
+    L = b - a
+    if L <= epsilon:
+        return 0
+    k = max(1, math.ceil(math.log(epsilon / L) / math.log(PHI)))
+    # Corrige posibles errores de redondeo del logaritmo
+    while k > 1 and L * PHI ** (k - 1) <= epsilon:
+        k -= 1
+    while L * PHI ** k > epsilon:
+        k += 1
+    return k
+
+def evaluaciones_golden(a, b, epsilon):
+    """
+    Predice el número exacto de evaluaciones de la función que hará golden_search,
+    útil para presupuestar el tiempo de cada búsqueda cuando evaluar f es costoso.
+
+    Parámetros:
+    a : float
+        Extremo izquierdo del intervalo de búsqueda.
+    b : float
+        Extremo derecho del intervalo de búsqueda.
+    epsilon : float
+        Precisión deseada para la aproximación del mínimo.
+
+    Retorna:
+    int
+        Número de evaluaciones de f.
+    """
+    k = iteraciones_golden(a, b, epsilon)
+    # Dos evaluaciones iniciales y una por reducción, salvo la última
+    return 0 if k == 0 else k + 1
 
 def golden_search(a, b, epsilon, f):
     """
     Realiza una búsqueda para encontrar el mínimo de una función f dentro del intervalo [a, b]
     usando el método de la búsqueda de sección dorada.
-    
+
+    La búsqueda se hace sobre el intervalo normalizado [0, 1] y cada punto se transforma
+    a [a, b] antes de evaluar f. En cada iteración se reutiliza el punto interior que
+    sobrevive, así que se hace una sola evaluación nueva por iteración; el total se
+    puede conocer de antemano con evaluaciones_golden.
+
     Parámetros:
     a : float
         Extremo izquierdo del intervalo de búsqueda.
@@ -130,149 +197,238 @@ def golden_search(a, b, epsilon, f):
     float, float
         Extremos del intervalo [a, b] que contienen al mínimo aproximado de la función f.
     """
+    k = iteraciones_golden(a, b, epsilon)
+    if k == 0:
+        return a, b
+
     aw = 0
     bw = 1
-    Lw = bw - aw
-    
-    # Inicializamos w1 y w2 con valores dentro del intervalo normalizado [aw, bw]
-    w1 = aw + 0.618 * Lw
-    w2 = bw - 0.618 * Lw
+
+    # Inicializamos w1 (izquierdo) y w2 (derecho) dentro del intervalo normalizado [aw, bw]
+    w1 = bw - PHI
+    w2 = aw + PHI
 
     # Evaluamos la función en los puntos iniciales w1 y w2
-    f1 = f(w1)
-    f2 = f(w2)
+    f1 = f(w_to_x(w1, a, b))
+    f2 = f(w_to_x(w2, a, b))
 
-    while Lw > epsilon:
+    for i in range(k):
+        ultima = i == k - 1
         if f1 < f2:
+            # El mínimo está en [aw, w2]
             bw = w2
             w2 = w1
-            Lw = bw - aw
-            w1 = aw + 0.618 * Lw
             f2 = f1
-            f1 = f(w1)
+            if not ultima:
+                w1 = bw - PHI * (bw - aw)
+                f1 = f(w_to_x(w1, a, b))
         else:
+            # El mínimo está en [w1, bw]
             aw = w1
             w1 = w2
-            Lw = bw - aw
-            w2 = bw - 0.618 * Lw
             f1 = f2
-            f2 = f(w2)
-    
-    return aw, bw
-
-print(golden_search(0.6, 7, 0.5,f1))
-
-# Calcular puntos para cada función
-puntos_lata1 = golden_search(0.6, 5, 0.5, lata)
-puntos_lata2 = golden_search(0.6, 5, 0.1, lata)
-puntos_lata3 = golden_search(0.6, 5, 0.01, lata)
-puntos_lata4 = golden_search(0.6, 5, 0.0001, lata)
-
-puntos_caja1 = golden_search(2, 3, 0.5, caja)
-puntos_caja2 = golden_search(2, 3, 0.1, caja)
-puntos_caja3 = golden_search(2, 3, 0.01, caja)
-puntos_caja4 = golden_search(2, 3, 0.0001, caja)
-
-puntos_f11 = golden_search(0.6, 5, 0.5, f1)
-puntos_f12 = golden_search(0.6, 5, 0.1, f1)
-puntos_f13 = golden_search(0.6, 5, 0.01, f1)
-puntos_f14 = golden_search(0.6, 5, 0.0001, f1)
-
-puntos_f21 = golden_search(0.6, 5, 0.5, f2)
-puntos_f22 = golden_search(0.6, 5, 0.1, f2)
-puntos_f23 = golden_search(0.6, 5, 0.01, f2)
-puntos_f24 = golden_search(0.6, 5, 0.0001, f2)
-
-puntos_f31 = golden_search(-2, 2.5, 0.5, f3)
-puntos_f32 = golden_search(-2, 2.5, 0.1, f3)
-puntos_f33 = golden_search(-2, 2.5, 0.01, f3)
-puntos_f34 = golden_search(-2, 2.5, 0.0001,f3)
-
-puntos_f41 = golden_search(-1.8, 2.5, 0.5, f4)
-puntos_f42 = golden_search(-1.8, 2.5, 0.1, f4)
-puntos_f43 = golden_search(-1.8, 2.5, 0.01,f4)
-puntos_f44 = golden_search(-1.8, 2.5, 0.0001,f4)
-
-# Grafica resultados
-plt.figure(figsize=(12, 8))
-
-# Grafica función lata
-plt.subplot(231)
-plt.plot(lim_lata, lata(lim_lata), label='Función')
-plt.scatter(puntos_lata1[0], lata(puntos_lata1[0]), label='Delta=0.5', marker='o')
-plt.scatter(puntos_lata2[0], lata(puntos_lata2[0]), label='Delta=0.1', marker='o')
-plt.scatter(puntos_lata3[0], lata(puntos_lata3[0]), label='Delta=0.01', marker='o')
-plt.scatter(puntos_lata4[0], lata(puntos_lata4[0]), label='Delta=0.0001', marker='o')
-plt.xlabel('Valores de x')
-plt.ylabel('Valores de y')
-plt.title('Función Lata')
-plt.legend()
-plt.grid(True)
-
-# Grafica función caja
-plt.subplot(232)
-plt.plot(lim_caja, caja(lim_caja), label='Función')
-plt.scatter(puntos_caja1[0], caja(puntos_caja1[0]), label='Delta=0.5', marker='o')
-plt.scatter(puntos_caja2[0], caja(puntos_caja2[0]), label='Delta=0.1', marker='o')
-plt.scatter(puntos_caja3[0], caja(puntos_caja3[0]), label='Delta=0.01', marker='o')
-plt.scatter(puntos_caja4[0], caja(puntos_caja4[0]), label='Delta=0.0001', marker='o')
-plt.xlabel('Valores de x')
-plt.ylabel('Valores de y')
-plt.title('Función Caja')
-plt.legend()
-plt.grid(True)
-
-# Grafica función f1
-plt.subplot(233)
-plt.plot(lim_f1, f1(lim_f1), label='Función')
-plt.scatter(puntos_f11[1], f1(puntos_f11[1]), label='Delta=0.5', marker='o')
-plt.scatter(puntos_f12[1], f1(puntos_f12[1]), label='Delta=0.1', marker='o')
-plt.scatter(puntos_f13[1], f1(puntos_f13[1]), label='Delta=0.01', marker='o')
-plt.scatter(puntos_f14[1], f1(puntos_f14[1]), label='Delta=0.0001', marker='o')
-plt.xlabel('Valores de x')
-plt.ylabel('Valores de y')
-plt.title('Función f1')
-plt.legend()
-plt.grid(True)
-
-# Grafica función f2
-plt.subplot(234)
-plt.plot(lim_f2, f2(lim_f2), label='Función')
-plt.scatter(puntos_f21[0], puntos_f21[0], label='Delta=0.5', marker='o')
-plt.scatter(puntos_f22[0], puntos_f22[0], label='Delta=0.1', marker='o')
-plt.scatter(puntos_f23[0], puntos_f23[0], label='Delta=0.01', marker='o')
-plt.scatter(puntos_f24[0], puntos_f24[0], label='Delta=0.0001', marker='o')
-plt.xlabel('Valores de x')
-plt.ylabel('Valores de y')
-plt.title('Función f2')
-plt.legend()
-plt.grid(True)
-
-# Graficar función f3
-plt.subplot(235)
-plt.plot(lim_f3, f3(lim_f3), label='Función')
-plt.scatter(puntos_f31[1], f3(puntos_f31[1]), label='Delta=0.5', marker='o')
-plt.scatter(puntos_f32[1], f3(puntos_f32[1]), label='Delta=0.1', marker='o')
-plt.scatter(puntos_f33[0], f3(puntos_f33[0]), label='Delta=0.01', marker='o')
-plt.scatter(puntos_f34[1], f3(puntos_f34[1]), label='Delta=0.0001', marker='o')
-plt.xlabel('Valores de x')
-plt.ylabel('Valores de y')
-plt.title('Función f3')
-plt.legend()
-plt.grid(True)
-
-# Graficar función f4
-plt.subplot(236)
-plt.plot(lim_f4, f4(lim_f4), label='Función')
-plt.scatter(puntos_f41[1], f4(puntos_f41[1]), label='Delta=0.5', marker='o')
-plt.scatter(puntos_f42[1], f4(puntos_f42[1]), label='Delta=0.1', marker='o')
-plt.scatter(puntos_f43[1], f4(puntos_f43[1]), label='Delta=0.01', marker='o')
-plt.scatter(puntos_f44[1], f4(puntos_f44[1]), label='Delta=0.0001', marker='o')
-plt.xlabel('Valores de x')
-plt.ylabel('Valores de y')
-plt.title('Función f4')
-plt.legend()
-plt.grid(True)
-
-plt.tight_layout()
-plt.show()
\ No newline at end of file
+            if not ultima:
+                w2 = aw + PHI * (bw - aw)
+                f2 = f(w_to_x(w2, a, b))
+
+    return w_to_x(aw, a, b), w_to_x(bw, a, b)
+
+def golden_search_lote(a, b, epsilon, f, max_iter=1000):
+    """
+    Resuelve por búsqueda de sección dorada muchos problemas independientes a la vez.
+    Todos los intervalos avanzan juntos con actualizaciones enmascaradas de NumPy y
+    cada problema se retira en cuanto su intervalo es menor que epsilon, de modo que
+    cada iteración hace una sola llamada vectorizada a f para todo el lote.
+
+    Parámetros:
+    a : array_like
+        Extremos izquierdos de los intervalos de búsqueda.
+    b : array_like
+        Extremos derechos de los intervalos de búsqueda.
+    epsilon : float or array_like
+        Precisión deseada para cada problema.
+    f : function
+        Función objetivo vectorizada f(x, indices). Recibe un arreglo x con un punto
+        por problema y el arreglo indices con el número de problema de cada punto, y
+        retorna un arreglo con los valores de la función.
+    max_iter : int, opcional
+        Número máximo de iteraciones (por defecto 1000).
+
+    Retorna:
+    numpy.ndarray, numpy.ndarray
+        Extremos de los intervalos [a, b] que contienen al mínimo de cada problema.
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    a = a.ravel().copy()
+    b = b.ravel().copy()
+    K = a.size
+    epsilon = np.broadcast_to(np.asarray(epsilon, dtype=float), (K,))
+    indices = np.arange(K)
+
+    # Puntos interiores de cada intervalo: x1 a la izquierda y x2 a la derecha
+    x1 = b - PHI * (b - a)
+    x2 = a + PHI * (b - a)
+    fx = np.asarray(f(np.concatenate((x1, x2)), np.concatenate((indices, indices))), dtype=float)
+    f1 = fx[:K].copy()
+    f2 = fx[K:].copy()
+
+    izquierda = np.zeros(K, dtype=bool)
+    activos = indices[(b - a) > epsilon]
+    k = 0
+    while activos.size > 0 and k < max_iter:
+        izquierda[activos] = f1[activos] < f2[activos]
+        il = activos[izquierda[activos]]
+        ir = activos[~izquierda[activos]]
+
+        # El mínimo está en [a, x2]: x1 pasa a ser el nuevo x2
+        b[il] = x2[il]
+        x2[il] = x1[il]
+        f2[il] = f1[il]
+        x1[il] = b[il] - PHI * (b[il] - a[il])
+
+        # El mínimo está en [x1, b]: x2 pasa a ser el nuevo x1
+        a[ir] = x1[ir]
+        x1[ir] = x2[ir]
+        f1[ir] = f2[ir]
+        x2[ir] = a[ir] + PHI * (b[ir] - a[ir])
+
+        activos = activos[(b[activos] - a[activos]) > epsilon[activos]]
+        if activos.size > 0:
+            lado = izquierda[activos]
+            f_nuevo = np.asarray(f(np.where(lado, x1[activos], x2[activos]), activos), dtype=float)
+            f1[activos[lado]] = f_nuevo[lado]
+            f2[activos[~lado]] = f_nuevo[~lado]
+        k += 1
+
+    return a, b
+
+def main():
+    """Ejecuta los ejemplos del módulo y grafica los resultados."""
+    import matplotlib.pyplot as plt
+    # Arreglos con los límites generados para cada función
+    lim_lata = linspace(0.5, 8)
+    lim_caja = linspace(2, 3)
+    lim_f1 = linspace(0, 10)
+    lim_f2 = linspace(0, 5)
+    lim_f3 = linspace(-2.5, 2.5)
+    lim_f4 = linspace(-1.5, 3)
+
+    print(golden_search(0.6, 7, 0.5,f1))
+
+    # Calcular puntos para cada función
+    puntos_lata1 = golden_search(0.6, 5, 0.5, lata)
+    puntos_lata2 = golden_search(0.6, 5, 0.1, lata)
+    puntos_lata3 = golden_search(0.6, 5, 0.01, lata)
+    puntos_lata4 = golden_search(0.6, 5, 0.0001, lata)
+
+    puntos_caja1 = golden_search(2, 3, 0.5, caja)
+    puntos_caja2 = golden_search(2, 3, 0.1, caja)
+    puntos_caja3 = golden_search(2, 3, 0.01, caja)
+    puntos_caja4 = golden_search(2, 3, 0.0001, caja)
+
+    puntos_f11 = golden_search(0.6, 5, 0.5, f1)
+    puntos_f12 = golden_search(0.6, 5, 0.1, f1)
+    puntos_f13 = golden_search(0.6, 5, 0.01, f1)
+    puntos_f14 = golden_search(0.6, 5, 0.0001, f1)
+
+    puntos_f21 = golden_search(0.6, 5, 0.5, f2)
+    puntos_f22 = golden_search(0.6, 5, 0.1, f2)
+    puntos_f23 = golden_search(0.6, 5, 0.01, f2)
+    puntos_f24 = golden_search(0.6, 5, 0.0001, f2)
+
+    puntos_f31 = golden_search(-2, 2.5, 0.5, f3)
+    puntos_f32 = golden_search(-2, 2.5, 0.1, f3)
+    puntos_f33 = golden_search(-2, 2.5, 0.01, f3)
+    puntos_f34 = golden_search(-2, 2.5, 0.0001,f3)
+
+    puntos_f41 = golden_search(-1.8, 2.5, 0.5, f4)
+    puntos_f42 = golden_search(-1.8, 2.5, 0.1, f4)
+    puntos_f43 = golden_search(-1.8, 2.5, 0.01,f4)
+    puntos_f44 = golden_search(-1.8, 2.5, 0.0001,f4)
+
+    # Grafica resultados
+    plt.figure(figsize=(12, 8))
+
+    # Grafica función lata
+    plt.subplot(231)
+    plt.plot(lim_lata, lata(lim_lata), label='Función')
+    plt.scatter(puntos_lata1[0], lata(puntos_lata1[0]), label='Delta=0.5', marker='o')
+    plt.scatter(puntos_lata2[0], lata(puntos_lata2[0]), label='Delta=0.1', marker='o')
+    plt.scatter(puntos_lata3[0], lata(puntos_lata3[0]), label='Delta=0.01', marker='o')
+    plt.scatter(puntos_lata4[0], lata(puntos_lata4[0]), label='Delta=0.0001', marker='o')
+    plt.xlabel('Valores de x')
+    plt.ylabel('Valores de y')
+    plt.title('Función Lata')
+    plt.legend()
+    plt.grid(True)
+
+    # Grafica función caja
+    plt.subplot(232)
+    plt.plot(lim_caja, caja(lim_caja), label='Función')
+    plt.scatter(puntos_caja1[0], caja(puntos_caja1[0]), label='Delta=0.5', marker='o')
+    plt.scatter(puntos_caja2[0], caja(puntos_caja2[0]), label='Delta=0.1', marker='o')
+    plt.scatter(puntos_caja3[0], caja(puntos_caja3[0]), label='Delta=0.01', marker='o')
+    plt.scatter(puntos_caja4[0], caja(puntos_caja4[0]), label='Delta=0.0001', marker='o')
+    plt.xlabel('Valores de x')
+    plt.ylabel('Valores de y')
+    plt.title('Función Caja')
+    plt.legend()
+    plt.grid(True)
+
+    # Grafica función f1
+    plt.subplot(233)
+    plt.plot(lim_f1, f1(lim_f1), label='Función')
+    plt.scatter(puntos_f11[1], f1(puntos_f11[1]), label='Delta=0.5', marker='o')
+    plt.scatter(puntos_f12[1], f1(puntos_f12[1]), label='Delta=0.1', marker='o')
+    plt.scatter(puntos_f13[1], f1(puntos_f13[1]), label='Delta=0.01', marker='o')
+    plt.scatter(puntos_f14[1], f1(puntos_f14[1]), label='Delta=0.0001', marker='o')
+    plt.xlabel('Valores de x')
+    plt.ylabel('Valores de y')
+    plt.title('Función f1')
+    plt.legend()
+    plt.grid(True)
+
+    # Grafica función f2
+    plt.subplot(234)
+    plt.plot(lim_f2, f2(lim_f2), label='Función')
+    plt.scatter(puntos_f21[0], puntos_f21[0], label='Delta=0.5', marker='o')
+    plt.scatter(puntos_f22[0], puntos_f22[0], label='Delta=0.1', marker='o')
+    plt.scatter(puntos_f23[0], puntos_f23[0], label='Delta=0.01', marker='o')
+    plt.scatter(puntos_f24[0], puntos_f24[0], label='Delta=0.0001', marker='o')
+    plt.xlabel('Valores de x')
+    plt.ylabel('Valores de y')
+    plt.title('Función f2')
+    plt.legend()
+    plt.grid(True)
+
+    # Graficar función f3
+    plt.subplot(235)
+    plt.plot(lim_f3, f3(lim_f3), label='Función')
+    plt.scatter(puntos_f31[1], f3(puntos_f31[1]), label='Delta=0.5', marker='o')
+    plt.scatter(puntos_f32[1], f3(puntos_f32[1]), label='Delta=0.1', marker='o')
+    plt.scatter(puntos_f33[0], f3(puntos_f33[0]), label='Delta=0.01', marker='o')
+    plt.scatter(puntos_f34[1], f3(puntos_f34[1]), label='Delta=0.0001', marker='o')
+    plt.xlabel('Valores de x')
+    plt.ylabel('Valores de y')
+    plt.title('Función f3')
+    plt.legend()
+    plt.grid(True)
+
+    # Graficar función f4
+    plt.subplot(236)
+    plt.plot(lim_f4, f4(lim_f4), label='Función')
+    plt.scatter(puntos_f41[1], f4(puntos_f41[1]), label='Delta=0.5', marker='o')
+    plt.scatter(puntos_f42[1], f4(puntos_f42[1]), label='Delta=0.1', marker='o')
+    plt.scatter(puntos_f43[1], f4(puntos_f43[1]), label='Delta=0.01', marker='o')
+    plt.scatter(puntos_f44[1], f4(puntos_f44[1]), label='Delta=0.0001', marker='o')
+    plt.xlabel('Valores de x')
+    plt.ylabel('Valores de y')
+    plt.title('Función f4')
+    plt.legend()
+    plt.grid(True)
+
+    plt.tight_layout()
+    plt.show()
+
+if __name__ == '__main__':
+    main()
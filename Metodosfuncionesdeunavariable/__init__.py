@@ -1,2 +1,3 @@
-from .busqueda_exhaustiva import caja, lata, fun1, fun2, fun3, fun4, calcular_n, exhaustive_search, graficar
-from .interval_halving_method import linspace, caja, lata, f1, f2, f3, f4, interval_halving
\ No newline at end of file
+from .busqueda_exhaustiva import caja, lata, fun1, fun2, fun3, fun4, calcular_n, exhaustive_search, exhaustive_search_bloques, exhaustive_search_vectorizado, exhaustive_search_npy, exhaustive_search_multiresolucion, graficar
+from .interval_halving_method import linspace, caja, lata, f1, f2, f3, f4, interval_halving
+from .brent_method import brent
\ No newline at end of file
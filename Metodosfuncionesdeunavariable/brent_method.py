@@ -0,0 +1,113 @@
+import math
+
+# Fracción dorada usada en los pasos de respaldo: (3 - sqrt(5)) / 2
+RAZON_DORADA = (3 - math.sqrt(5)) / 2
+
+def brent(a, b, epsilon, f, max_iter=500):
+    """
+    Implementa el método de Brent para encontrar el mínimo de una función en el intervalo [a, b].
+    Combina pasos de interpolación parabólica, que convergen rápido en funciones suaves, con
+    pasos de sección dorada que garantizan la reducción del intervalo cuando la parábola no
+    es confiable.
+
+    Parámetros:
+    a (float): El límite inferior del intervalo.
+    b (float): El límite superior del intervalo.
+    epsilon (float): La precisión deseada para la ubicación del mínimo.
+    f (function): La función a minimizar.
+    max_iter (int): Número máximo de iteraciones. Por defecto es 500.
+
+    Retorna:
+    tuple: Una tupla (x, fx, nfev, nit) con el punto estimado del mínimo, el valor de la
+    función en ese punto, el número de evaluaciones de f y el número de iteraciones.
+    """
+    raiz_eps = math.sqrt(2.2e-16)
+
+    # x: mejor punto, w: segundo mejor, v: valor anterior de w
+    x = w = v = a + RAZON_DORADA * (b - a)
+    fx = fw = fv = f(x)
+    nfev = 1
+    nit = 0
+
+    d = e = 0.0
+    xm = (a + b) / 2
+    tol1 = raiz_eps * abs(x) + epsilon / 3
+    tol2 = 2 * tol1
+
+    while abs(x - xm) > tol2 - (b - a) / 2 and nit < max_iter:
+        dorado = True
+        if abs(e) > tol1:
+            # Intenta un paso parabólico con x, w y v
+            dorado = False
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2 * (q - r)
+            if q > 0:
+                p = -p
+            q = abs(q)
+            r = e
+            e = d
+            if abs(p) < abs(q * r / 2) and q * (a - x) < p < q * (b - x):
+                d = p / q
+                u = x + d
+                # No evaluar demasiado cerca de los extremos
+                if u - a < tol2 or b - u < tol2:
+                    d = tol1 if xm >= x else -tol1
+            else:
+                dorado = True
+
+        if dorado:
+            # Paso de sección dorada hacia el lado más grande del intervalo
+            e = a - x if x >= xm else b - x
+            d = RAZON_DORADA * e
+
+        # Nunca se evalúa a menos de tol1 del mejor punto
+        if abs(d) >= tol1:
+            u = x + d
+        else:
+            u = x + (tol1 if d >= 0 else -tol1)
+        fu = f(u)
+        nfev += 1
+
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, fv = w, fw
+            w, fw = x, fx
+            x, fx = u, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, fv = w, fw
+                w, fw = u, fu
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+
+        xm = (a + b) / 2
+        tol1 = raiz_eps * abs(x) + epsilon / 3
+        tol2 = 2 * tol1
+        nit += 1
+
+    return x, fx, nfev, nit
+
+def main():
+    """Ejecuta el ejemplo de uso del módulo."""
+    try:
+        from .Metodoseliminacionregiones.golden_search_method import lata, evaluaciones_golden
+    except ImportError:
+        # Ejecutado como script (python brent_method.py): la carpeta del módulo está en sys.path
+        from Metodoseliminacionregiones.golden_search_method import lata, evaluaciones_golden
+
+    for epsilon in [0.5, 0.1, 0.01, 0.0001]:
+        x, fx, nfev, nit = brent(0.6, 5, epsilon, lata)
+        print(f'epsilon={epsilon}: x={x}, f(x)={fx}, nfev={nfev} '
+              f'(sección dorada: {evaluaciones_golden(0.6, 5, epsilon)})')
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,5 @@
+import os
 import numpy as np
-import matplotlib.pyplot as plt
 
 # --------------------------------- FUNCIONES ---------------------------------
 
@@ -117,9 +117,169 @@ def exhaustive_search(a, b, precision, funcion):
             x1 = x2
             x2 = x3
             x3 = x2 + delta_x
-            puntos.append((x2, funcion(x2))) 
+            puntos.append((x2, funcion(x2)))
     return None, puntos
 
+def exhaustive_search_bloques(a, b, precision, funcion, tam_bloque=100000):
+    """
+    Generador de la búsqueda exhaustiva por bloques. Evalúa la malla con una
+    sola llamada a la función por bloque y entrega los puntos evaluados como
+    arreglos de NumPy, de modo que la memoria usada depende de tam_bloque y no
+    del número de intervalos que pide calcular_n.
+
+    Args:
+        a (float): Límite inferior del rango.
+        b (float): Límite superior del rango.
+        precision (float): Precisión deseada.
+        funcion (callable): Función a evaluar. Debe aceptar arreglos de NumPy.
+        tam_bloque (int, opcional): Número de tripletes evaluados por bloque.
+            Por defecto es 100000.
+
+    Yields:
+        tuple: (x, fx, intervalo) con los puntos evaluados del bloque, en el
+        mismo orden en que exhaustive_search los agrega a puntos. intervalo es
+        None salvo en el último bloque cuando se encontró el mínimo.
+    """
+    n = calcular_n(a, b, precision)
+    delta_x = (b - a) / n
+    for inicio in range(0, n - 1, tam_bloque):
+        fin = min(inicio + tam_bloque, n - 1)
+        # Los bloques se traslapan dos puntos para no perder tripletes en la frontera
+        x = a + np.arange(inicio, fin + 2) * delta_x
+        fx = np.broadcast_to(np.asarray(funcion(x), dtype=float), x.shape)
+        minimos = np.flatnonzero((fx[:-2] >= fx[1:-1]) & (fx[1:-1] <= fx[2:]))
+        if minimos.size > 0:
+            i = minimos[0]
+            yield x[2:i + 2], fx[2:i + 2], (float(x[i]), float(x[i + 2]))
+            return
+        yield x[2:], fx[2:], None
+
+def exhaustive_search_vectorizado(a, b, precision, funcion, tam_bloque=100000):
+    """
+    Versión vectorizada de exhaustive_search. Evalúa la malla por bloques de
+    tam_bloque puntos con una sola llamada a la función por bloque y busca el
+    primer triplete f(x1) >= f(x2) <= f(x3) con comparaciones de arreglos.
+
+    Args:
+        a (float): Límite inferior del rango.
+        b (float): Límite superior del rango.
+        precision (float): Precisión deseada.
+        funcion (callable): Función a evaluar. Debe aceptar arreglos de NumPy.
+        tam_bloque (int, opcional): Número de tripletes evaluados por bloque.
+            Por defecto es 100000.
+
+    Returns:
+        tuple: El intervalo que contiene el mínimo y los puntos evaluados.
+    """
+    intervalo = None
+    puntos = []  # puntos evaluados
+    for x, fx, intervalo in exhaustive_search_bloques(a, b, precision, funcion, tam_bloque):
+        puntos.extend(zip(x.tolist(), fx.tolist()))
+    return intervalo, puntos
+
+def exhaustive_search_npy(a, b, precision, funcion, ruta, tam_bloque=100000):
+    """
+    Búsqueda exhaustiva que escribe los puntos evaluados en un archivo .npy en
+    lugar de acumularlos en una lista. El archivo se llena bloque por bloque,
+    así que la memoria usada es constante sin importar la precisión.
+
+    Args:
+        a (float): Límite inferior del rango.
+        b (float): Límite superior del rango.
+        precision (float): Precisión deseada.
+        funcion (callable): Función a evaluar. Debe aceptar arreglos de NumPy.
+        ruta (str): Ruta del archivo .npy donde se guardan los puntos.
+        tam_bloque (int, opcional): Número de tripletes evaluados por bloque.
+            Por defecto es 100000.
+
+    Returns:
+        tuple: El intervalo que contiene el mínimo y los puntos evaluados como
+        un arreglo de NumPy mapeado en memoria de forma (m, 2).
+    """
+    intervalo = None
+    m = 0
+    ruta_tmp = ruta + '.tmp'
+    # Primero se escriben las parejas (x, f(x)) en crudo, porque el número de
+    # puntos sólo se conoce al terminar y el encabezado .npy lo necesita.
+    with open(ruta_tmp, 'wb') as archivo:
+        for x, fx, intervalo in exhaustive_search_bloques(a, b, precision, funcion, tam_bloque):
+            np.column_stack((x, fx)).tofile(archivo)
+            m += x.size
+    puntos = np.lib.format.open_memmap(ruta, mode='w+', dtype=float, shape=(m, 2))
+    if m > 0:
+        crudo = np.memmap(ruta_tmp, dtype=float, mode='r', shape=(m, 2))
+        for inicio in range(0, m, tam_bloque):
+            puntos[inicio:inicio + tam_bloque] = crudo[inicio:inicio + tam_bloque]
+        puntos.flush()
+        del crudo
+    os.remove(ruta_tmp)
+    return intervalo, puntos
+
+def exhaustive_search_multiresolucion(a, b, precisiones, funcion, razon=10):
+    """
+    Realiza la búsqueda exhaustiva para varias precisiones en una sola llamada.
+    Las precisiones se recorren de la más gruesa a la más fina y cada búsqueda
+    sólo refina dentro del intervalo encontrado por la anterior, reutilizando
+    los puntos ya evaluados. Entre dos precisiones consecutivas se agregan
+    niveles intermedios geométricos para que ninguna sea más de razon veces
+    más fina que la anterior; así cada nivel cuesta unas 2 * razon
+    evaluaciones y el total, después del barrido inicial de [a, b] con la
+    precisión más gruesa, crece con log(1 / precision). Si un nivel no
+    encuentra intervalo dentro del anterior, éste se amplía unos pasos del
+    nivel anterior a cada lado en lugar de volver a recorrer [a, b]; si aun
+    así no lo encuentra (por ejemplo, una función monótona), los niveles más
+    finos no se buscan y se retorna (None, []) para ellos.
+
+    Se supone que la función es unimodal dentro de cada intervalo encontrado.
+
+    Args:
+        a (float): Límite inferior del rango.
+        b (float): Límite superior del rango.
+        precisiones (list): Lista de precisiones deseadas.
+        funcion (callable): Función a evaluar.
+        razon (float, opcional): Razón máxima entre dos niveles consecutivos.
+            Por defecto es 10.
+
+    Returns:
+        list: Para cada precisión, en el mismo orden que precisiones, una
+        tupla con el intervalo que contiene el mínimo y los puntos evaluados.
+    """
+    evaluados = {}
+
+    def funcion_cache(x):
+        clave = round(x, 12)
+        if clave not in evaluados:
+            evaluados[clave] = funcion(x)
+        return evaluados[clave]
+
+    # Niveles de la más gruesa a la más fina, con intermedios geométricos
+    pedidas = sorted(set(precisiones), reverse=True)
+    niveles = [pedidas[0]]
+    for precision in pedidas[1:]:
+        pasos = int(np.ceil(np.log(niveles[-1] / precision) / np.log(razon) - 1e-9))
+        gruesa = niveles[-1]
+        niveles.extend(gruesa * (precision / gruesa) ** (k / pasos) for k in range(1, pasos))
+        niveles.append(precision)
+
+    resultados = {}
+    izquierda, derecha = a, b
+    anterior = None
+    for precision in niveles:
+        intervalo, puntos = exhaustive_search(izquierda, derecha, precision, funcion_cache)
+        # Sin intervalo se amplía el anterior unos pasos del nivel previo, hasta [a, b]
+        for ampliacion in (2, 4, 8):
+            if intervalo is not None or anterior is None or (izquierda, derecha) == (a, b):
+                break
+            izquierda = max(a, izquierda - ampliacion * anterior)
+            derecha = min(b, derecha + ampliacion * anterior)
+            intervalo, puntos = exhaustive_search(izquierda, derecha, precision, funcion_cache)
+        resultados[precision] = (intervalo, puntos)
+        if intervalo is None:
+            break
+        izquierda, derecha = intervalo
+        anterior = precision
+    return [resultados.get(precision, (None, [])) for precision in precisiones]
+
 def graficar(precisiones, x, y, a, b, nombre_funcion, funcion):
     """
     Grafica una función en un rango [a, b] y los puntos evaluados en una 
@@ -137,11 +297,12 @@ def graficar(precisiones, x, y, a, b, nombre_funcion, funcion):
     Returns:
         None
     """
+    import matplotlib.pyplot as plt
     plt.plot(x, y, label='Función {}'.format(nombre_funcion))
 
     # Graficar los puntos devueltos por exhaustive_search para cada precisión
-    for i, precision in enumerate(precisiones):
-        punto_final, _ = exhaustive_search(a, b, precision, funcion)
+    resultados = exhaustive_search_multiresolucion(a, b, precisiones, funcion)
+    for i, (precision, (punto_final, _)) in enumerate(zip(precisiones, resultados)):
         if punto_final is not None:
             x_punto, _ = punto_final
             plt.scatter(x_punto, funcion(x_punto), label=f'Precision {precision}', c=f'C{i}')
@@ -154,53 +315,58 @@ def graficar(precisiones, x, y, a, b, nombre_funcion, funcion):
     plt.grid(True)
     plt.show()
 
-# --------------------------- PARAMETROS -------------------------------
+def main():
+    """Ejecuta los ejemplos del módulo y grafica los resultados."""
+    # --------------------------- PARAMETROS -------------------------------
+
+    # ---- Función Lata                   0.5 < x <= 10
+    a = 0.5
+    b = 10
+    precisiones = [0.5, 0.1, 0.01, 0.0001]
+    x = np.linspace(a, b, 200)
+    y = lata(x) 
 
-# ---- Función Lata                   0.5 < x <= 10
-a = 0.5
-b = 10
-precisiones = [0.5, 0.1, 0.01, 0.0001]
-x = np.linspace(a, b, 200)
-y = lata(x) 
+    graficar(precisiones, x, y, a, b, 'Lata', lata)
 
-graficar(precisiones, x, y, a, b, 'Lata', lata)
+    # --- Función Caja                   2 < x <= 3.5
+    a = 2
+    b = 10
+    precisiones = [0.5, 0.1, 0.01, 0.0001]
+    y = caja(x) 
 
-# --- Función Caja                   2 < x <= 3.5
-a = 2
-b = 10
-precisiones = [0.5, 0.1, 0.01, 0.0001]
-y = caja(x) 
+    graficar(precisiones, x, y, a, b, 'Caja', caja)
 
-graficar(precisiones, x, y, a, b, 'Caja', caja)
+    # --- Función (x^2 + 54) / x         0 < x <= 10
+    a = 0.1
+    b = 10
+    precisiones = [0.5, 0.1, 0.01, 0.0001]
+    y = fun1(x) 
 
-# --- Función (x^2 + 54) / x         0 < x <= 10
-a = 0.1
-b = 10
-precisiones = [0.5, 0.1, 0.01, 0.0001]
-y = fun1(x) 
+    graficar(precisiones, x, y, a, b, '(x^2+54)/x', fun1)
 
-graficar(precisiones, x, y, a, b, '(x^2+54)/x', fun1)
+    # --- Función x^3 + 2x - 3           -5 < x <= 5  
+    a = -5
+    b = 5
+    precisiones = [0.5, 0.1, 0.01, 0.0001]
+    y = fun2(x) 
 
-# --- Función x^3 + 2x - 3           -5 < x <= 5  
-a = -5
-b = 5
-precisiones = [0.5, 0.1, 0.01, 0.0001]
-y = fun2(x) 
+    graficar(precisiones, x, y, a, b, 'x^3+2x-3', fun2)
 
-graficar(precisiones, x, y, a, b, 'x^3+2x-3', fun2)
+    # --- Función x^4 + x^2 - 33         -2.5 <= x <= 2.5
+    a = -2.5
+    b = 2.5
+    precisiones = [0.5, 0.1, 0.01, 0.0001]
+    y = fun3(x) 
 
-# --- Función x^4 + x^2 - 33         -2.5 <= x <= 2.5
-a = -2.5
-b = 2.5
-precisiones = [0.5, 0.1, 0.01, 0.0001]
-y = fun3(x) 
+    graficar(precisiones, x, y, a, b, 'x^4+x^2-33 ', fun3)
 
-graficar(precisiones, x, y, a, b, 'x^4+x^2-33 ', fun3)
+    # --- Función 3x^4 - 8x^3 -6x^2 + 12x          -1.5 <= x <= 3
+    a = -1.5
+    b = 3
+    precisiones = [0.5, 0.1, 0.01, 0.0001]
+    y = fun4(x) 
 
-# --- Función 3x^4 - 8x^3 -6x^2 + 12x          -1.5 <= x <= 3
-a = -1.5
-b = 3
-precisiones = [0.5, 0.1, 0.01, 0.0001]
-y = fun4(x) 
+    graficar(precisiones, x, y, a, b, '3x^4-8x^3-6x^2+12x', fun4)
 
-graficar(precisiones, x, y, a, b, '3x^4-8x^3-6x^2+12x', fun4)
\ No newline at end of file
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,4 @@
 #Metodos directos | Funciones objetivo
-from .busqueda_unidireccional import derivada, segunda_derivada, delta_x, funcioon, newton_method, evaluar, busqueda_unidireccional
+from .busqueda_unidireccional import derivada, segunda_derivada, derivadas_centrales, delta_x, funcioon, newton_method, evaluar, busqueda_unidireccional
 from .funciones_objetivo import rastrigin, rosenbrock, ackley, beale, booth, easom
 from .funciones_objetivo_restriccion import rosenbrock_constrained, rosenbrock_disk, mishra_bird, townsend, gomez_levy, simionescu
\ No newline at end of file
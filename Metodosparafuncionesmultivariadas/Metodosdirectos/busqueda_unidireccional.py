@@ -1,4 +1,5 @@
-import matplotlib.pyplot as plt
+import os
+import sys
 import numpy as np
 
 alpha = 0.5
@@ -35,6 +36,24 @@ def segunda_derivada(f, x, deltaa_x):
     """
     return (f(x + deltaa_x) - 2 * f(x) + f(x - deltaa_x)) / (deltaa_x ** 2)
 
+def derivadas_centrales(f, x, deltaa_x):
+    """
+    Calcula la primera y la segunda derivada de f en x con diferencias centrales,
+    evaluando una sola vez cada punto x - deltaa_x, x y x + deltaa_x.
+
+    Args:
+    - f: Función a derivar.
+    - x: Punto en el cual evaluar las derivadas.
+    - deltaa_x: Tamaño del paso para calcular las derivadas.
+
+    Returns:
+    - La tupla (primera derivada, segunda derivada) de f en x.
+    """
+    f_adelante = f(x + deltaa_x)
+    f_atras = f(x - deltaa_x)
+    fx = f(x)
+    return (f_adelante - f_atras) / (2 * deltaa_x), (f_adelante - 2 * fx + f_atras) / (deltaa_x ** 2)
+
 def delta_x(x):
     """
     Determina el tamaño del paso delta_x basado en el valor de x.
@@ -63,7 +82,7 @@ def funcioon(x1, x2):
     """
     return ((x1 - 10) ** 2) + ((x2 - 10) ** 2)
 
-def newton_method(x0, epsilon, f):
+def newton_method(x0, epsilon, f, derivative="fd"):
     """
     Implementa el método de Newton para encontrar el mínimo de una función f(x).
 
@@ -71,16 +90,31 @@ def newton_method(x0, epsilon, f):
     - x0: Punto inicial para iniciar la búsqueda.
     - epsilon: Precisión deseada para la convergencia del método.
     - f: Función a minimizar.
+    - derivative: "fd" para diferencias centrales o "ad" para diferenciación automática. Por defecto es "fd".
 
     Returns:
     - El valor x donde se encuentra el mínimo local aproximado de la función f.
     """
+    if derivative not in ("fd", "ad"):
+        raise ValueError('derivative debe ser "fd" o "ad"')
+    if derivative == "ad":
+        # Los números duales viven en el paquete de una variable y sólo se cargan aquí
+        try:
+            from Metodosfuncionesdeunavariable.Metodosbasadosderivada.diferenciacion_automatica import derivadas_ad
+        except ModuleNotFoundError:
+            # Ejecutado como script: se agrega la raíz del repositorio a sys.path
+            sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+            from Metodosfuncionesdeunavariable.Metodosbasadosderivada.diferenciacion_automatica import derivadas_ad
+        derivadas = lambda x: derivadas_ad(f, x)[1:]
+    else:
+        derivadas = lambda x: derivadas_centrales(f, x, delta_x(x))
     x = x0
-    while abs(derivada(f, x, delta_x(x))) > epsilon:
-        segunda_deriv = segunda_derivada(f, x, delta_x(x))
-        if segunda_deriv == 0:
+    primera, segunda = derivadas(x)
+    while abs(primera) > epsilon:
+        if segunda == 0:
             return x
-        x = x - derivada(f, x, delta_x(x)) / segunda_deriv
+        x = x - primera / segunda
+        primera, segunda = derivadas(x)
     return x
 
 def evaluar(alpha):
@@ -120,4 +154,9 @@ def busqueda_unidireccional(xt, xs, metodo_optimizacion, funcion_evaluacion):
 
     return resultado
 
-print(busqueda_unidireccional(xt, xs, newton_method, evaluar))
+def main():
+    """Ejecuta el ejemplo de uso del módulo."""
+    print(busqueda_unidireccional(xt, xs, newton_method, evaluar))
+
+if __name__ == '__main__':
+    main()
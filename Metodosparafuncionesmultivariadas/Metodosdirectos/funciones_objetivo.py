@@ -1,545 +1,1048 @@
 import numpy as np
-import matplotlib.pyplot as plt
+
+# Todas las funciones reciben un punto de forma (n,) o un arreglo de puntos de forma
+# (..., n) con las coordenadas en el último eje, y retornan un valor por punto. Así una
+# sola llamada evalúa una población completa, una malla o un esténcil de diferencias.
+
+def _coordenadas(x):
+    # Separa las dos coordenadas de las funciones definidas sólo en el plano
+    x = np.asarray(x, dtype=float)
+    return x[..., 0], x[..., 1]
 
 # Funciones ya definidas
-def rastrigin(x, y, A=10, n=2):
+def rastrigin(x, A=10):
     """
-    Función Rastrigin para dos variables.
+    Función Rastrigin para n variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (n,) o arreglo de puntos de forma (..., n).
     - A (float, opcional): Parámetro A de la función. Por defecto es 10.
-    - n (float, opcional): Parámetro n de la función. Por defecto es 2.
     
     Returns:
-    - float: Valor de la función Rastrigin evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función Rastrigin evaluada en cada punto.
     """
-    return A * n + (x**2 - A * np.cos(2 * np.pi * x)) + (y**2 - A * np.cos(2 * np.pi * y))
+    x = np.asarray(x, dtype=float)
+    return A * x.shape[-1] + np.sum(x**2 - A * np.cos(2 * np.pi * x), axis=-1)
 
-def ackley(x, y, a=20, b=0.2, c=2*np.pi):
+def ackley(x, a=20, b=0.2, c=2*np.pi):
     """
-    Función Ackley para dos variables.
+    Función Ackley para n variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (n,) o arreglo de puntos de forma (..., n).
     - a (float, opcional): Parámetro a de la función. Por defecto es 20.
     - b (float, opcional): Parámetro b de la función. Por defecto es 0.2.
     - c (float, opcional): Parámetro c de la función. Por defecto es 2*pi.
     
     Returns:
-    - float: Valor de la función Ackley evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función Ackley evaluada en cada punto.
     """
-    sum_sq_term = -b * np.sqrt(0.5 * (x**2 + y**2))
-    cos_term = 0.5 * (np.cos(c * x) + np.cos(c * y))
+    x = np.asarray(x, dtype=float)
+    sum_sq_term = -b * np.sqrt(np.mean(x**2, axis=-1))
+    cos_term = np.mean(np.cos(c * x), axis=-1)
     return -a * np.exp(sum_sq_term) - np.exp(cos_term) + a + np.exp(1)
 
-def sphere(x, y):
+def sphere(x):
     """
-    Función esférica para dos variables.
+    Función esférica para n variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (n,) o arreglo de puntos de forma (..., n).
     
     Returns:
-    - float: Valor de la función esférica evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función esférica evaluada en cada punto.
     """
-    return x**2 + y**2
+    x = np.asarray(x, dtype=float)
+    return np.sum(x**2, axis=-1)
 
-def rosenbrock(x, y, a=1, b=100):
+def rosenbrock(x, a=1, b=100):
     """
-    Función de Rosenbrock para dos variables.
+    Función de Rosenbrock para n variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (n,) o arreglo de puntos de forma (..., n).
     - a (float, opcional): Parámetro a de la función. Por defecto es 1.
     - b (float, opcional): Parámetro b de la función. Por defecto es 100.
     
     Returns:
-    - float: Valor de la función de Rosenbrock evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función de Rosenbrock evaluada en cada punto.
     """
-    return (a - x)**2 + b * (y - x**2)**2
+    x = np.asarray(x, dtype=float)
+    return np.sum((a - x[..., :-1])**2 + b * (x[..., 1:] - x[..., :-1]**2)**2, axis=-1)
 
-def beale(x, y):
+def beale(x):
     """
     Función de Beale para dos variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
     
     Returns:
-    - float: Valor de la función de Beale evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función de Beale evaluada en cada punto.
     """
-    return (1.5 - x + x*y)**2 + (2.25 - x + x*y**2)**2 + (2.625 - x + x*y**3)**2
+    x1, x2 = _coordenadas(x)
+    return (1.5 - x1 + x1*x2)**2 + (2.25 - x1 + x1*x2**2)**2 + (2.625 - x1 + x1*x2**3)**2
 
-def goldstein_price(x, y):
+def goldstein_price(x):
     """
     Función de Goldstein-Price para dos variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
     
     Returns:
-    - float: Valor de la función de Goldstein-Price evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función de Goldstein-Price evaluada en cada punto.
     """
-    part1 = (1 + (x + y + 1)**2 * (19 - 14*x + 3*x**2 - 14*y + 6*x*y + 3*y**2))
-    part2 = (30 + (2*x - 3*y)**2 * (18 - 32*x + 12*x**2 + 48*y - 36*x*y + 27*y**2))
+    x1, x2 = _coordenadas(x)
+    part1 = (1 + (x1 + x2 + 1)**2 * (19 - 14*x1 + 3*x1**2 - 14*x2 + 6*x1*x2 + 3*x2**2))
+    part2 = (30 + (2*x1 - 3*x2)**2 * (18 - 32*x1 + 12*x1**2 + 48*x2 - 36*x1*x2 + 27*x2**2))
     return part1 * part2
 
-def booth(x, y):
+def booth(x):
     """
     Función de Booth para dos variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
     
     Returns:
-    - float: Valor de la función de Booth evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función de Booth evaluada en cada punto.
     """
-    return (x + 2*y - 7)**2 + (2*x + y - 5)**2
+    x1, x2 = _coordenadas(x)
+    return (x1 + 2*x2 - 7)**2 + (2*x1 + x2 - 5)**2
 
-def bukin_n6(x, y):
+def bukin_n6(x):
     """
     Función de Bukin N.6 para dos variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
     
     Returns:
-    - float: Valor de la función de Bukin N.6 evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función de Bukin N.6 evaluada en cada punto.
     """
-    return 100 * np.sqrt(np.abs(y - 0.01*x**2)) + 0.01 * np.abs(x + 10)
+    x1, x2 = _coordenadas(x)
+    return 100 * np.sqrt(np.abs(x2 - 0.01*x1**2)) + 0.01 * np.abs(x1 + 10)
 
-def matyas(x, y):
+def matyas(x):
     """
     Función de Matyas para dos variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
     
     Returns:
-    - float: Valor de la función de Matyas evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función de Matyas evaluada en cada punto.
     """
-    return 0.26 * (x**2 + y**2) - 0.48 * x * y
+    x1, x2 = _coordenadas(x)
+    return 0.26 * (x1**2 + x2**2) - 0.48 * x1 * x2
 
-def levi_n13(x, y):
+def levi_n13(x):
     """
     Función de Levi N.13 para dos variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
     
     Returns:
-    - float: Valor de la función de Levi N.13 evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función de Levi N.13 evaluada en cada punto.
     """
-    return np.sin(3 * np.pi * x)**2 + ((x - 1)**2) * (1 + np.sin(3 * np.pi * y)**2) + ((y - 1)**2) * (1 + np.sin(2 * np.pi * y)**2)
+    x1, x2 = _coordenadas(x)
+    return np.sin(3 * np.pi * x1)**2 + ((x1 - 1)**2) * (1 + np.sin(3 * np.pi * x2)**2) + ((x2 - 1)**2) * (1 + np.sin(2 * np.pi * x2)**2)
 
-def himmelblau(x, y):
+def himmelblau(x):
     """
     Función de Himmelblau para dos variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
     
     Returns:
-    - float: Valor de la función de Himmelblau evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función de Himmelblau evaluada en cada punto.
     """
-    return (x**2 + y - 11)**2 + (x + y**2 - 7)**2
+    x1, x2 = _coordenadas(x)
+    return (x1**2 + x2 - 11)**2 + (x1 + x2**2 - 7)**2
 
-def three_hump_camel(x, y):
+def three_hump_camel(x):
     """
     Función Three-Hump Camel para dos variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
     
     Returns:
-    - float: Valor de la Three-Hump Camel evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la Three-Hump Camel evaluada en cada punto.
     """
-    return 2*x**2 - 1.05*x**4 + (x**6) / 6 + x*y + y**2
+    x1, x2 = _coordenadas(x)
+    return 2*x1**2 - 1.05*x1**4 + (x1**6) / 6 + x1*x2 + x2**2
 
 # Nuevas funciones
-def easom(x, y):
+def easom(x):
     """
     Función de Easom para dos variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
     
     Returns:
-    - float: Valor de la función de Easom evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función de Easom evaluada en cada punto.
     """
-    return -np.cos(x) * np.cos(y) * np.exp(-((x - np.pi)**2 + (y - np.pi)**2))
+    x1, x2 = _coordenadas(x)
+    return -np.cos(x1) * np.cos(x2) * np.exp(-((x1 - np.pi)**2 + (x2 - np.pi)**2))
 
-def cross_in_tray(x, y):
+def cross_in_tray(x):
     """
     Función Cross-in-Tray para dos variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
     
     Returns:
-    - float: Valor de la función Cross-in-Tray evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función Cross-in-Tray evaluada en cada punto.
     """
-    return -0.0001 * (np.abs(np.sin(x) * np.sin(y) * np.exp(np.abs(100 - np.sqrt(x**2 + y**2) / np.pi))) + 1) ** 0.1
+    x1, x2 = _coordenadas(x)
+    return -0.0001 * (np.abs(np.sin(x1) * np.sin(x2) * np.exp(np.abs(100 - np.sqrt(x1**2 + x2**2) / np.pi))) + 1) ** 0.1
 
-def eggholder(x, y):
+def eggholder(x):
     """
     Función Eggholder para dos variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
     
     Returns:
-    - float: Valor de la función Eggholder evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función Eggholder evaluada en cada punto.
     """
-    return -(y + 47) * np.sin(np.sqrt(np.abs(x / 2 + (y + 47)))) - x * np.sin(np.sqrt(np.abs(x - (y + 47))))
+    x1, x2 = _coordenadas(x)
+    return -(x2 + 47) * np.sin(np.sqrt(np.abs(x1 / 2 + (x2 + 47)))) - x1 * np.sin(np.sqrt(np.abs(x1 - (x2 + 47))))
 
-def holder_table(x, y):
+def holder_table(x):
     """
     Función Holder Table para dos variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
     
     Returns:
-    - float: Valor de la función Holder Table evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función Holder Table evaluada en cada punto.
     """
-    return -np.abs(np.sin(x) * np.cos(y) * np.exp(np.abs(1 - np.sqrt(x**2 + y**2) / np.pi)))
+    x1, x2 = _coordenadas(x)
+    return -np.abs(np.sin(x1) * np.cos(x2) * np.exp(np.abs(1 - np.sqrt(x1**2 + x2**2) / np.pi)))
 
-def mccormick(x, y):
+def mccormick(x):
     """
     Función McCormick para dos variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
     
     Returns:
-    - float: Valor de la función McCormick evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función McCormick evaluada en cada punto.
     """
-    return np.sin(x + y) + (x - y)**2 - 1.5 * x + 2.5 * y + 1
+    x1, x2 = _coordenadas(x)
+    return np.sin(x1 + x2) + (x1 - x2)**2 - 1.5 * x1 + 2.5 * x2 + 1
 
-def schaffer_n2(x, y):
+def schaffer_n2(x):
     """
     Función Schaffer N.2 para dos variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
     
     Returns:
-    - float: Valor de la función Schaffer N.2 evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función Schaffer N.2 evaluada en cada punto.
     """
-    return 0.5 + (np.sin(x**2 - y**2)**2 - 0.5) / (1 + 0.001 * (x**2 + y**2))**2
+    x1, x2 = _coordenadas(x)
+    return 0.5 + (np.sin(x1**2 - x2**2)**2 - 0.5) / (1 + 0.001 * (x1**2 + x2**2))**2
 
-def schaffer_n4(x, y):
+def schaffer_n4(x):
     """
     Función Schaffer N.4 para dos variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
     
     Returns:
-    - float: Valor de la función Schaffer N.4 evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función Schaffer N.4 evaluada en cada punto.
     """
-    return 0.5 + (np.cos(np.sin(np.abs(x**2 - y**2))))**2 - 0.5 / (1 + 0.001 * (x**2 + y**2))**2
+    x1, x2 = _coordenadas(x)
+    return 0.5 + (np.cos(np.sin(np.abs(x1**2 - x2**2))))**2 - 0.5 / (1 + 0.001 * (x1**2 + x2**2))**2
 
-def styblinski_tang(x, y):
+def styblinski_tang(x):
     """
-    Función Styblinski-Tang para dos variables.
+    Función Styblinski-Tang para n variables.
     
     Args:
-    - x (float): Valor de la primera variable.
-    - y (float): Valor de la segunda variable.
+    - x (numpy.ndarray): Punto de forma (n,) o arreglo de puntos de forma (..., n).
     
     Returns:
-    - float: Valor de la función Styblinski-Tang evaluada en (x, y).
+    - float or numpy.ndarray: Valor de la función Styblinski-Tang evaluada en cada punto.
+    """
+    x = np.asarray(x, dtype=float)
+    return np.sum(x**4 - 16 * x**2 + 5 * x, axis=-1) / 2
+
+# Derivadas analíticas
+def _diagonal(d):
+    # Matriz diagonal (..., n, n) con los elementos d de forma (..., n)
+    return d[..., :, None] * np.eye(d.shape[-1])
+
+def _vector(d1, d2):
+    # Gradiente de una función del plano con las componentes en el último eje
+    return np.stack(np.broadcast_arrays(d1, d2), axis=-1).astype(float)
+
+def _matriz(d11, d12, d22):
+    # Hessiana simétrica 2 x 2 en los dos últimos ejes
+    d11, d12, d22 = np.broadcast_arrays(d11, d12, d22)
+    return np.stack((np.stack((d11, d12), axis=-1), np.stack((d12, d22), axis=-1)), axis=-2).astype(float)
+
+def gradiente_rastrigin(x, A=10):
+    """
+    Gradiente analítico de la función Rastrigin.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (n,) o arreglo de puntos de forma (..., n).
+    - A (float, opcional): Parámetro A de la función. Por defecto es 10.
+
+    Returns:
+    - numpy.ndarray: Gradiente en cada punto, de forma (..., n).
+    """
+    x = np.asarray(x, dtype=float)
+    return 2 * x + 2 * np.pi * A * np.sin(2 * np.pi * x)
+
+def hessiana_rastrigin(x, A=10):
+    """
+    Hessiana analítica de la función Rastrigin.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (n,) o arreglo de puntos de forma (..., n).
+    - A (float, opcional): Parámetro A de la función. Por defecto es 10.
+
+    Returns:
+    - numpy.ndarray: Matriz Hessiana en cada punto, de forma (..., n, n).
+    """
+    x = np.asarray(x, dtype=float)
+    return _diagonal(2 + 4 * np.pi**2 * A * np.cos(2 * np.pi * x))
+
+def _ackley_partes(x, a, b, c):
+    # Derivadas de r = sqrt(mean(x^2)) y de s = mean(cos(cx)); en el origen, donde la
+    # función no es diferenciable, se toma r = 1 para evitar dividir entre 0
+    n = x.shape[-1]
+    r = np.sqrt(np.mean(x**2, axis=-1, keepdims=True))
+    exp_r = a * b * np.exp(-b * r)
+    exp_s = np.exp(np.mean(np.cos(c * x), axis=-1, keepdims=True))
+    r = np.where(r > 0, r, 1.0)
+    return n, r, exp_r, exp_s
+
+def gradiente_ackley(x, a=20, b=0.2, c=2*np.pi):
+    """
+    Gradiente analítico de la función Ackley. En el origen se toma el gradiente nulo.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (n,) o arreglo de puntos de forma (..., n).
+    - a (float, opcional): Parámetro a de la función. Por defecto es 20.
+    - b (float, opcional): Parámetro b de la función. Por defecto es 0.2.
+    - c (float, opcional): Parámetro c de la función. Por defecto es 2*pi.
+
+    Returns:
+    - numpy.ndarray: Gradiente en cada punto, de forma (..., n).
+    """
+    x = np.asarray(x, dtype=float)
+    n, r, exp_r, exp_s = _ackley_partes(x, a, b, c)
+    return exp_r * x / (n * r) + exp_s * c * np.sin(c * x) / n
+
+def hessiana_ackley(x, a=20, b=0.2, c=2*np.pi):
+    """
+    Hessiana analítica de la función Ackley fuera del origen.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (n,) o arreglo de puntos de forma (..., n).
+    - a (float, opcional): Parámetro a de la función. Por defecto es 20.
+    - b (float, opcional): Parámetro b de la función. Por defecto es 0.2.
+    - c (float, opcional): Parámetro c de la función. Por defecto es 2*pi.
+
+    Returns:
+    - numpy.ndarray: Matriz Hessiana en cada punto, de forma (..., n, n).
+    """
+    x = np.asarray(x, dtype=float)
+    n, r, exp_r, exp_s = _ackley_partes(x, a, b, c)
+    r_i = x / (n * r)
+    s_i = -c * np.sin(c * x) / n
+    r_ij = _diagonal(np.broadcast_to(1 / (n * r), x.shape)) - x[..., :, None] * x[..., None, :] / (n**2 * r[..., None]**3)
+    s_ij = _diagonal(-c**2 * np.cos(c * x) / n)
+    return (exp_r[..., None] * (-b * r_i[..., :, None] * r_i[..., None, :] + r_ij)
+            - exp_s[..., None] * (s_i[..., :, None] * s_i[..., None, :] + s_ij))
+
+def gradiente_sphere(x):
+    """
+    Gradiente analítico de la función esférica.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (n,) o arreglo de puntos de forma (..., n).
+
+    Returns:
+    - numpy.ndarray: Gradiente en cada punto, de forma (..., n).
+    """
+    return 2 * np.asarray(x, dtype=float)
+
+def hessiana_sphere(x):
+    """
+    Hessiana analítica de la función esférica.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (n,) o arreglo de puntos de forma (..., n).
+
+    Returns:
+    - numpy.ndarray: Matriz Hessiana en cada punto, de forma (..., n, n).
+    """
+    return _diagonal(np.full(np.shape(x), 2.0))
+
+def gradiente_rosenbrock(x, a=1, b=100):
+    """
+    Gradiente analítico de la función de Rosenbrock.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (n,) o arreglo de puntos de forma (..., n).
+    - a (float, opcional): Parámetro a de la función. Por defecto es 1.
+    - b (float, opcional): Parámetro b de la función. Por defecto es 100.
+
+    Returns:
+    - numpy.ndarray: Gradiente en cada punto, de forma (..., n).
+    """
+    x = np.asarray(x, dtype=float)
+    r = x[..., 1:] - x[..., :-1]**2
+    gradiente = np.zeros_like(x)
+    gradiente[..., :-1] = -2 * (a - x[..., :-1]) - 4 * b * x[..., :-1] * r
+    gradiente[..., 1:] += 2 * b * r
+    return gradiente
+
+def hessiana_rosenbrock(x, a=1, b=100):
+    """
+    Hessiana analítica (tridiagonal) de la función de Rosenbrock.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (n,) o arreglo de puntos de forma (..., n).
+    - a (float, opcional): Parámetro a de la función. Por defecto es 1.
+    - b (float, opcional): Parámetro b de la función. Por defecto es 100.
+
+    Returns:
+    - numpy.ndarray: Matriz Hessiana en cada punto, de forma (..., n, n).
+    """
+    x = np.asarray(x, dtype=float)
+    diagonal = np.zeros_like(x)
+    diagonal[..., :-1] = 2 - 4 * b * (x[..., 1:] - x[..., :-1]**2) + 8 * b * x[..., :-1]**2
+    diagonal[..., 1:] += 2 * b
+    hessiana = _diagonal(diagonal)
+    i = np.arange(x.shape[-1] - 1)
+    hessiana[..., i, i + 1] = hessiana[..., i + 1, i] = -4 * b * x[..., :-1]
+    return hessiana
+
+def gradiente_beale(x):
+    """
+    Gradiente analítico de la función de Beale.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Gradiente en cada punto, de forma (..., 2).
+    """
+    x1, x2 = _coordenadas(x)
+    d1 = d2 = 0
+    for i, c in enumerate((1.5, 2.25, 2.625), start=1):
+        t = c - x1 + x1 * x2**i
+        d1 = d1 + 2 * t * (x2**i - 1)
+        d2 = d2 + 2 * t * i * x1 * x2**(i - 1)
+    return _vector(d1, d2)
+
+def hessiana_beale(x):
+    """
+    Hessiana analítica de la función de Beale.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Matriz Hessiana en cada punto, de forma (..., 2, 2).
+    """
+    x1, x2 = _coordenadas(x)
+    d11 = d12 = d22 = 0
+    for i, c in enumerate((1.5, 2.25, 2.625), start=1):
+        t = c - x1 + x1 * x2**i
+        t_1, t_2 = x2**i - 1, i * x1 * x2**(i - 1)
+        d11 = d11 + 2 * t_1**2
+        d12 = d12 + 2 * (t_1 * t_2 + t * i * x2**(i - 1))
+        d22 = d22 + 2 * (t_2**2 + t * i * (i - 1) * x1 * x2**max(i - 2, 0))
+    return _matriz(d11, d12, d22)
+
+def _goldstein_price_partes(x1, x2):
+    # f = P * Q; retorna P, Q y sus primeras y segundas derivadas parciales
+    u, v = x1 + x2 + 1, 2*x1 - 3*x2
+    p = 19 - 14*x1 + 3*x1**2 - 14*x2 + 6*x1*x2 + 3*x2**2
+    q = 18 - 32*x1 + 12*x1**2 + 48*x2 - 36*x1*x2 + 27*x2**2
+    p_1 = p_2 = -14 + 6*x1 + 6*x2
+    q_1, q_2 = -32 + 24*x1 - 36*x2, 48 - 36*x1 + 54*x2
+    P, Q = 1 + u**2 * p, 30 + v**2 * q
+    P_1, P_2 = 2*u*p + u**2 * p_1, 2*u*p + u**2 * p_2
+    Q_1, Q_2 = 4*v*q + v**2 * q_1, -6*v*q + v**2 * q_2
+    P_11 = 2*p + 4*u*p_1 + 6*u**2
+    P_12 = 2*p + 2*u*(p_1 + p_2) + 6*u**2
+    P_22 = 2*p + 4*u*p_2 + 6*u**2
+    Q_11 = 8*q + 8*v*q_1 + 24*v**2
+    Q_12 = -12*q + 4*v*q_2 - 6*v*q_1 - 36*v**2
+    Q_22 = 18*q - 12*v*q_2 + 54*v**2
+    return P, Q, P_1, P_2, Q_1, Q_2, P_11, P_12, P_22, Q_11, Q_12, Q_22
+
+def gradiente_goldstein_price(x):
+    """
+    Gradiente analítico de la función de Goldstein-Price.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Gradiente en cada punto, de forma (..., 2).
+    """
+    P, Q, P_1, P_2, Q_1, Q_2 = _goldstein_price_partes(*_coordenadas(x))[:6]
+    return _vector(P_1 * Q + P * Q_1, P_2 * Q + P * Q_2)
+
+def hessiana_goldstein_price(x):
+    """
+    Hessiana analítica de la función de Goldstein-Price.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Matriz Hessiana en cada punto, de forma (..., 2, 2).
+    """
+    P, Q, P_1, P_2, Q_1, Q_2, P_11, P_12, P_22, Q_11, Q_12, Q_22 = _goldstein_price_partes(*_coordenadas(x))
+    return _matriz(P_11 * Q + 2 * P_1 * Q_1 + P * Q_11,
+                   P_12 * Q + P_1 * Q_2 + P_2 * Q_1 + P * Q_12,
+                   P_22 * Q + 2 * P_2 * Q_2 + P * Q_22)
+
+def gradiente_booth(x):
+    """
+    Gradiente analítico de la función de Booth.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Gradiente en cada punto, de forma (..., 2).
+    """
+    x1, x2 = _coordenadas(x)
+    r1, r2 = x1 + 2*x2 - 7, 2*x1 + x2 - 5
+    return _vector(2 * r1 + 4 * r2, 4 * r1 + 2 * r2)
+
+def hessiana_booth(x):
+    """
+    Hessiana analítica de la función de Booth.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Matriz Hessiana en cada punto, de forma (..., 2, 2).
+    """
+    x1, _ = _coordenadas(x)
+    return _matriz(10 + 0 * x1, 8 + 0 * x1, 10 + 0 * x1)
+
+def gradiente_matyas(x):
+    """
+    Gradiente analítico de la función de Matyas.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Gradiente en cada punto, de forma (..., 2).
+    """
+    x1, x2 = _coordenadas(x)
+    return _vector(0.52 * x1 - 0.48 * x2, 0.52 * x2 - 0.48 * x1)
+
+def hessiana_matyas(x):
+    """
+    Hessiana analítica de la función de Matyas.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Matriz Hessiana en cada punto, de forma (..., 2, 2).
+    """
+    x1, _ = _coordenadas(x)
+    return _matriz(0.52 + 0 * x1, -0.48 + 0 * x1, 0.52 + 0 * x1)
+
+def gradiente_levi_n13(x):
+    """
+    Gradiente analítico de la función de Levi N.13.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Gradiente en cada punto, de forma (..., 2).
+    """
+    x1, x2 = _coordenadas(x)
+    return _vector(3 * np.pi * np.sin(6 * np.pi * x1) + 2 * (x1 - 1) * (1 + np.sin(3 * np.pi * x2)**2),
+                   3 * np.pi * (x1 - 1)**2 * np.sin(6 * np.pi * x2)
+                   + 2 * (x2 - 1) * (1 + np.sin(2 * np.pi * x2)**2)
+                   + 2 * np.pi * (x2 - 1)**2 * np.sin(4 * np.pi * x2))
+
+def hessiana_levi_n13(x):
+    """
+    Hessiana analítica de la función de Levi N.13.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Matriz Hessiana en cada punto, de forma (..., 2, 2).
+    """
+    x1, x2 = _coordenadas(x)
+    d11 = 18 * np.pi**2 * np.cos(6 * np.pi * x1) + 2 * (1 + np.sin(3 * np.pi * x2)**2)
+    d12 = 6 * np.pi * (x1 - 1) * np.sin(6 * np.pi * x2)
+    d22 = (18 * np.pi**2 * (x1 - 1)**2 * np.cos(6 * np.pi * x2)
+           + 2 * (1 + np.sin(2 * np.pi * x2)**2)
+           + 8 * np.pi * (x2 - 1) * np.sin(4 * np.pi * x2)
+           + 8 * np.pi**2 * (x2 - 1)**2 * np.cos(4 * np.pi * x2))
+    return _matriz(d11, d12, d22)
+
+def gradiente_himmelblau(x):
+    """
+    Gradiente analítico de la función de Himmelblau.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Gradiente en cada punto, de forma (..., 2).
+    """
+    x1, x2 = _coordenadas(x)
+    r1, r2 = x1**2 + x2 - 11, x1 + x2**2 - 7
+    return _vector(4 * x1 * r1 + 2 * r2, 2 * r1 + 4 * x2 * r2)
+
+def hessiana_himmelblau(x):
+    """
+    Hessiana analítica de la función de Himmelblau.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Matriz Hessiana en cada punto, de forma (..., 2, 2).
+    """
+    x1, x2 = _coordenadas(x)
+    return _matriz(12 * x1**2 + 4 * x2 - 42, 4 * x1 + 4 * x2, 4 * x1 + 12 * x2**2 - 26)
+
+def gradiente_three_hump_camel(x):
+    """
+    Gradiente analítico de la función Three-Hump Camel.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Gradiente en cada punto, de forma (..., 2).
+    """
+    x1, x2 = _coordenadas(x)
+    return _vector(4*x1 - 4.2*x1**3 + x1**5 + x2, x1 + 2*x2)
+
+def hessiana_three_hump_camel(x):
+    """
+    Hessiana analítica de la función Three-Hump Camel.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Matriz Hessiana en cada punto, de forma (..., 2, 2).
+    """
+    x1, _ = _coordenadas(x)
+    return _matriz(4 - 12.6*x1**2 + 5*x1**4, 1 + 0 * x1, 2 + 0 * x1)
+
+def _easom_partes(x1, x2):
+    # f = -C * E con C = cos(x1) cos(x2) y E = exp(-((x1 - pi)^2 + (x2 - pi)^2))
+    C = np.cos(x1) * np.cos(x2)
+    C_1, C_2 = -np.sin(x1) * np.cos(x2), -np.cos(x1) * np.sin(x2)
+    E = np.exp(-((x1 - np.pi)**2 + (x2 - np.pi)**2))
+    E_1, E_2 = -2 * (x1 - np.pi) * E, -2 * (x2 - np.pi) * E
+    return C, C_1, C_2, E, E_1, E_2
+
+def gradiente_easom(x):
+    """
+    Gradiente analítico de la función de Easom.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Gradiente en cada punto, de forma (..., 2).
+    """
+    C, C_1, C_2, E, E_1, E_2 = _easom_partes(*_coordenadas(x))
+    return _vector(-(C_1 * E + C * E_1), -(C_2 * E + C * E_2))
+
+def hessiana_easom(x):
+    """
+    Hessiana analítica de la función de Easom.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Matriz Hessiana en cada punto, de forma (..., 2, 2).
+    """
+    x1, x2 = _coordenadas(x)
+    C, C_1, C_2, E, E_1, E_2 = _easom_partes(x1, x2)
+    C_12 = np.sin(x1) * np.sin(x2)
+    E_11 = (4 * (x1 - np.pi)**2 - 2) * E
+    E_22 = (4 * (x2 - np.pi)**2 - 2) * E
+    E_12 = 4 * (x1 - np.pi) * (x2 - np.pi) * E
+    return _matriz(-(-C * E + 2 * C_1 * E_1 + C * E_11),
+                   -(C_12 * E + C_1 * E_2 + C_2 * E_1 + C * E_12),
+                   -(-C * E + 2 * C_2 * E_2 + C * E_22))
+
+def gradiente_mccormick(x):
+    """
+    Gradiente analítico de la función McCormick.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Gradiente en cada punto, de forma (..., 2).
+    """
+    x1, x2 = _coordenadas(x)
+    return _vector(np.cos(x1 + x2) + 2 * (x1 - x2) - 1.5, np.cos(x1 + x2) - 2 * (x1 - x2) + 2.5)
+
+def hessiana_mccormick(x):
+    """
+    Hessiana analítica de la función McCormick.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (2,) o arreglo de puntos de forma (..., 2).
+
+    Returns:
+    - numpy.ndarray: Matriz Hessiana en cada punto, de forma (..., 2, 2).
+    """
+    x1, x2 = _coordenadas(x)
+    s = np.sin(x1 + x2)
+    return _matriz(2 - s, -2 - s, 2 - s)
+
+def gradiente_styblinski_tang(x):
+    """
+    Gradiente analítico de la función Styblinski-Tang.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (n,) o arreglo de puntos de forma (..., n).
+
+    Returns:
+    - numpy.ndarray: Gradiente en cada punto, de forma (..., n).
+    """
+    x = np.asarray(x, dtype=float)
+    return (4 * x**3 - 32 * x + 5) / 2
+
+def hessiana_styblinski_tang(x):
+    """
+    Hessiana analítica de la función Styblinski-Tang.
+
+    Args:
+    - x (numpy.ndarray): Punto de forma (n,) o arreglo de puntos de forma (..., n).
+
+    Returns:
+    - numpy.ndarray: Matriz Hessiana en cada punto, de forma (..., n, n).
     """
-    return (x**4 - 16 * x**2 + 5 * x + y**4 - 16 * y**2 + 5 * y) / 2
+    x = np.asarray(x, dtype=float)
+    return _diagonal((12 * x**2 - 32) / 2)
+
+# Derivadas analíticas de cada función: el paquete Metodosgradiente las registra al
+# importarse y sus métodos las usan en lugar de diferencias finitas
+DERIVADAS_ANALITICAS = {
+    rastrigin: (gradiente_rastrigin, hessiana_rastrigin),
+    ackley: (gradiente_ackley, hessiana_ackley),
+    sphere: (gradiente_sphere, hessiana_sphere),
+    rosenbrock: (gradiente_rosenbrock, hessiana_rosenbrock),
+    beale: (gradiente_beale, hessiana_beale),
+    goldstein_price: (gradiente_goldstein_price, hessiana_goldstein_price),
+    booth: (gradiente_booth, hessiana_booth),
+    matyas: (gradiente_matyas, hessiana_matyas),
+    levi_n13: (gradiente_levi_n13, hessiana_levi_n13),
+    himmelblau: (gradiente_himmelblau, hessiana_himmelblau),
+    three_hump_camel: (gradiente_three_hump_camel, hessiana_three_hump_camel),
+    easom: (gradiente_easom, hessiana_easom),
+    mccormick: (gradiente_mccormick, hessiana_mccormick),
+    styblinski_tang: (gradiente_styblinski_tang, hessiana_styblinski_tang),
+}
 
 # Cálculo de Z 
 def calculo_z(func, x, y):
     """
-    Calcula la matriz Z para una función dada sobre una malla de coordenadas X, Y.
+    Calcula la matriz Z para una función dada sobre una malla de coordenadas X, Y. Los
+    puntos de la malla se apilan en un arreglo (..., 2) y se evalúan en una sola llamada.
     
     Args:
-    - func (function): Función de dos variables a evaluar.
+    - func (function): Función a evaluar, que recibe puntos de forma (..., 2).
     - x (numpy.ndarray): Matriz de coordenadas X.
     - y (numpy.ndarray): Matriz de coordenadas Y.
     
     Returns:
     - numpy.ndarray: Matriz Z con los valores calculados de la función para cada par de coordenadas (x, y).
     """
-    z = np.zeros(x.shape)
-    for i in range(x.shape[0]):
-        for j in range(x.shape[1]):
-            z[i, j] = func(x[i, j], y[i, j])
-    return z
-
-# Arreglos con los límites generados para cada función
-x_r = np.linspace(-5.12, 5.12, 100)
-y_r = np.linspace(-5.12, 5.12, 100)
-x_rm, y_rm = np.meshgrid(x_r, y_r)
-
-x_a = np.linspace(-5, 5, 100)
-y_a = np.linspace(-5, 5, 100)
-x_am, y_am = np.meshgrid(x_a, y_a)
-
-x_s = np.linspace(-5, 5, 100)
-y_s = np.linspace(-5, 5, 100)
-x_sm, y_sm = np.meshgrid(x_s, y_s)
-
-x_rs = np.linspace(-2, 2, 100)
-y_rs = np.linspace(-2, 2, 100)
-x_rsm, y_rsm = np.meshgrid(x_rs, y_rs)
-
-x_b = np.linspace(-4.5, 4.5, 100)
-y_b = np.linspace(-4.5, 4.5, 100)
-x_bm, y_bm = np.meshgrid(x_b, y_b)
-
-x_g = np.linspace(-2, 2, 100)
-y_g = np.linspace(-2, 2, 100)
-x_gm, y_gm = np.meshgrid(x_g, y_g)
-
-x_bo = np.linspace(-10, 10, 100)
-y_bo = np.linspace(-10, 10, 100)
-x_bom, y_bom = np.meshgrid(x_bo, y_bo)
-
-x_bn = np.linspace(-15, -5, 100)
-y_bn = np.linspace(-3, 3, 100)
-x_bnm, y_bnm = np.meshgrid(x_bn, y_bn)
-
-x_m = np.linspace(-10, 10, 100)
-y_m = np.linspace(-10, 10, 100)
-x_mm, y_mm = np.meshgrid(x_m, y_m)
-
-x_l = np.linspace(-10, 10, 100)
-y_l = np.linspace(-10, 10, 100)
-x_lm, y_lm = np.meshgrid(x_l, y_l)
-
-x_h = np.linspace(-5, 5, 100)
-y_h = np.linspace(-5, 5, 100)
-x_hm, y_hm = np.meshgrid(x_h, y_h)
-
-x_th = np.linspace(-5, 5, 100)
-y_th = np.linspace(-5, 5, 100)
-x_thm, y_thm = np.meshgrid(x_th, y_th)
-
-x_e = np.linspace(-100, 100, 100)
-y_e = np.linspace(-100, 100, 100)
-x_em, y_em = np.meshgrid(x_e, y_e)
-
-x_c = np.linspace(-10, 10, 100)
-y_c = np.linspace(-10, 10, 100)
-x_cm, y_cm = np.meshgrid(x_c, y_c)
-
-x_eg = np.linspace(-512, 512, 100)
-y_eg = np.linspace(-512, 512, 100)
-x_egm, y_egm = np.meshgrid(x_eg, y_eg)
-
-x_ho = np.linspace(-10, 10, 100)
-y_ho = np.linspace(-10, 10, 100)
-x_hom, y_hom = np.meshgrid(x_ho, y_ho)
-
-x_mc = np.linspace(-1.5, 4, 100)
-y_mc = np.linspace(-3, 4, 100)
-x_mcm, y_mcm = np.meshgrid(x_mc, y_mc)
-
-x_s2 = np.linspace(-100, 100, 100)
-y_s2 = np.linspace(-100, 100, 100)
-x_s2m, y_s2m = np.meshgrid(x_s2, y_s2)
-
-x_schaffer4 = np.linspace(-100, 100, 400)
-y_schaffer4 = np.linspace(-100, 100, 400)
-x_s4m, y_s4m = np.meshgrid(x_schaffer4, y_schaffer4)
-
-x_styblinski = np.linspace(-5, 5, 400)
-y_styblinski = np.linspace(-5, 5, 400)
-x_stm, y_stm = np.meshgrid(x_styblinski, y_styblinski)
-
-# Calcular Z para cada función
-Z_rastrigin = calculo_z(rastrigin, x_rm, y_rm)
-Z_ackley = calculo_z(ackley, x_am, y_am)
-Z_sphere = calculo_z(sphere, x_sm, y_sm)
-Z_rosenbrock = calculo_z(rosenbrock, x_rsm, y_rsm)
-Z_beale = calculo_z(beale, x_bm, y_bm)
-Z_goldstein = calculo_z(goldstein_price, x_gm, y_gm)
-Z_booth = calculo_z(booth, x_bom, y_bom)
-Z_bukin_n6 = calculo_z(bukin_n6, x_bnm, y_bnm)
-Z_matyas = calculo_z(matyas, x_mm, y_mm)
-Z_levi_n13 = calculo_z(levi_n13, x_lm, y_lm)
-Z_himmelblau = calculo_z(himmelblau, x_hm, y_hm)
-Z_three_hump_camel = calculo_z(three_hump_camel, x_thm, y_thm)
-Z_easom = calculo_z(easom, x_em, y_em)
-Z_cross_in_tray = calculo_z(cross_in_tray, x_cm, y_cm)
-Z_eggholder = calculo_z(eggholder, x_egm, y_egm)
-Z_holder_table = calculo_z(holder_table, x_hom, y_hom)
-Z_mccormick = calculo_z(mccormick, x_mcm, y_mcm)
-Z_schaffer_n2 = calculo_z(schaffer_n2, x_s2m, y_s2m)
-Z_schaffer_n4 = schaffer_n4(x_s4m, y_s4m)
-Z_styblinski_tang = styblinski_tang(x_stm, y_stm)
-
-# Crear subplots
-fig, axs = plt.subplots(7, 3, figsize=(15, 20))
-
-# Graficar la función Rastrigin
-cp = axs[0, 0].contourf(x_rm, y_rm, Z_rastrigin, cmap='viridis')
-fig.colorbar(cp, ax=axs[0, 0])
-axs[0, 0].set_title('Función de Rastrigin')
-axs[0, 0].set_xlabel('X')
-axs[0, 0].set_ylabel('Y')
-
-# Graficar la función Ackley
-cp = axs[0, 1].contourf(x_am, y_am, Z_ackley, cmap='viridis')
-fig.colorbar(cp, ax=axs[0, 1])
-axs[0, 1].set_title('Función de Ackley')
-axs[0, 1].set_xlabel('X')
-axs[0, 1].set_ylabel('Y')
-
-# Graficar la función Sphere
-cp = axs[0, 2].contourf(x_sm, y_sm, Z_sphere, cmap='viridis')
-fig.colorbar(cp, ax=axs[0, 2])
-axs[0, 2].set_title('Función de Sphere')
-axs[0, 2].set_xlabel('X')
-axs[0, 2].set_ylabel('Y')
-
-# Graficar la función Rosenbrock
-cp = axs[1, 0].contourf(x_rsm, y_rsm, Z_rosenbrock, cmap='viridis')
-fig.colorbar(cp, ax=axs[1, 0])
-axs[1, 0].set_title('Función de Rosenbrock')
-axs[1, 0].set_xlabel('X')
-axs[1, 0].set_ylabel('Y')
-
-# Graficar la función Beale
-cp = axs[1, 1].contourf(x_bm, y_bm, Z_beale, cmap='viridis')
-fig.colorbar(cp, ax=axs[1, 1])
-axs[1, 1].set_title('Función de Beale')
-axs[1, 1].set_xlabel('X')
-axs[1, 1].set_ylabel('Y')
-
-# Graficar la función Goldstein-Price
-cp = axs[1, 2].contourf(x_gm, y_gm, Z_goldstein, cmap='viridis')
-fig.colorbar(cp, ax=axs[1, 2])
-axs[1, 2].set_title('Función de Goldstein-Price')
-axs[1, 2].set_xlabel('X')
-axs[1, 2].set_ylabel('Y')
-
-# Graficar la función Booth
-cp = axs[2, 0].contourf(x_bom, y_bom, Z_booth, cmap='viridis')
-fig.colorbar(cp, ax=axs[2, 0])
-axs[2, 0].set_title('Función de Booth')
-axs[2, 0].set_xlabel('X')
-axs[2, 0].set_ylabel('Y')
-
-# Graficar la función Bukin N.6
-cp = axs[2, 1].contourf(x_bnm, y_bnm, Z_bukin_n6, cmap='viridis')
-fig.colorbar(cp, ax=axs[2, 1])
-axs[2, 1].set_title('Función de Bukin N.6')
-axs[2, 1].set_xlabel('X')
-axs[2, 1].set_ylabel('Y')
-
-# Graficar la función Matyas
-cp = axs[2, 2].contourf(x_mm, y_mm, Z_matyas, cmap='viridis')
-fig.colorbar(cp, ax=axs[2, 2])
-axs[2, 2].set_title('Función de Matyas')
-axs[2, 2].set_xlabel('X')
-axs[2, 2].set_ylabel('Y')
-
-# Graficar la función Lévi N.13
-cp = axs[3, 0].contourf(x_lm, y_lm, Z_levi_n13, cmap='viridis')
-fig.colorbar(cp, ax=axs[3, 0])
-axs[3, 0].set_title('Función de Lévi N.13')
-axs[3, 0].set_xlabel('X')
-axs[3, 0].set_ylabel('Y')
-
-# Graficar la función Himmelblau
-cp = axs[3, 1].contourf(x_hm, y_hm, Z_himmelblau, cmap='viridis')
-fig.colorbar(cp, ax=axs[3, 1])
-axs[3, 1].set_title('Función de Himmelblau')
-axs[3, 1].set_xlabel('X')
-axs[3, 1].set_ylabel('Y')
-
-# Graficar la función Three-hump Camel
-cp = axs[3, 2].contourf(x_thm, y_thm, Z_three_hump_camel, cmap='viridis')
-fig.colorbar(cp, ax=axs[3, 2])
-axs[3, 2].set_title('Función de Three-hump Camel')
-axs[3, 2].set_xlabel('X')
-axs[3, 2].set_ylabel('Y')
-
-# Graficar la función Easom
-cp = axs[4, 0].contourf(x_em, y_em, Z_easom, cmap='viridis')
-fig.colorbar(cp, ax=axs[4, 0])
-axs[4, 0].set_title('Función de Easom')
-axs[4, 0].set_xlabel('X')
-axs[4, 0].set_ylabel('Y')
-
-# Graficar la función Cross-in-tray
-cp = axs[4, 1].contourf(x_cm, y_cm, Z_cross_in_tray, cmap='viridis')
-fig.colorbar(cp, ax=axs[4, 1])
-axs[4, 1].set_title('Función de Cross-in-tray')
-axs[4, 1].set_xlabel('X')
-axs[4, 1].set_ylabel('Y')
-
-# Graficar la función Eggholder
-cp = axs[4, 2].contourf(x_egm, y_egm, Z_eggholder, cmap='viridis')
-fig.colorbar(cp, ax=axs[4, 2])
-axs[4, 2].set_title('Función de Eggholder')
-axs[4, 2].set_xlabel('X')
-axs[4, 2].set_ylabel('Y')
-
-# Graficar la función Hölder Table
-cp = axs[5, 0].contourf(x_hom, y_hom, Z_holder_table, cmap='viridis')
-fig.colorbar(cp, ax=axs[5, 0])
-axs[5, 0].set_title('Función de Hölder Table')
-axs[5, 0].set_xlabel('X')
-axs[5, 0].set_ylabel('Y')
-
-# Graficar la función McCormick
-cp = axs[5, 1].contourf(x_mcm, y_mcm, Z_mccormick, cmap='viridis')
-fig.colorbar(cp, ax=axs[5, 1])
-axs[5, 1].set_title('Función de McCormick')
-axs[5, 1].set_xlabel('X')
-axs[5, 1].set_ylabel('Y')
-
-# Graficar la función Schaffer N.2
-cp = axs[5, 2].contourf(x_s2m, y_s2m, Z_schaffer_n2, cmap='viridis')
-fig.colorbar(cp, ax=axs[5, 2])
-axs[5, 2].set_title('Función de Schaffer N.2')
-axs[5, 2].set_xlabel('X')
-axs[5, 2].set_ylabel('Y')
-
-# Graficar la función Schaffer N.4
-cp = axs[6, 0].contourf(x_s4m, y_s4m, Z_schaffer_n4, cmap='viridis')
-fig.colorbar(cp, ax=axs[6, 0])
-axs[6, 0].set_title('Función de Schaffer N.4')
-axs[6, 0].set_xlabel('X')
-axs[6, 0].set_ylabel('Y')
-
-# Graficar la función Styblinski-Tang
-cp = axs[6, 1].contourf(x_stm, y_stm, Z_styblinski_tang, cmap='viridis')
-fig.colorbar(cp, ax=axs[6, 1])
-axs[6, 1].set_title('Función de Styblinski-Tang')
-axs[6, 1].set_xlabel('X')
-axs[6, 1].set_ylabel('Y')
-
-
-# Ajustar el layout
-plt.tight_layout()
-plt.show()
+    return func(np.stack((x, y), axis=-1))
+
+def main():
+    """Ejecuta los ejemplos del módulo y grafica los resultados."""
+    import matplotlib.pyplot as plt
+    # Arreglos con los límites generados para cada función
+    x_r = np.linspace(-5.12, 5.12, 100)
+    y_r = np.linspace(-5.12, 5.12, 100)
+    x_rm, y_rm = np.meshgrid(x_r, y_r)
+
+    x_a = np.linspace(-5, 5, 100)
+    y_a = np.linspace(-5, 5, 100)
+    x_am, y_am = np.meshgrid(x_a, y_a)
+
+    x_s = np.linspace(-5, 5, 100)
+    y_s = np.linspace(-5, 5, 100)
+    x_sm, y_sm = np.meshgrid(x_s, y_s)
+
+    x_rs = np.linspace(-2, 2, 100)
+    y_rs = np.linspace(-2, 2, 100)
+    x_rsm, y_rsm = np.meshgrid(x_rs, y_rs)
+
+    x_b = np.linspace(-4.5, 4.5, 100)
+    y_b = np.linspace(-4.5, 4.5, 100)
+    x_bm, y_bm = np.meshgrid(x_b, y_b)
+
+    x_g = np.linspace(-2, 2, 100)
+    y_g = np.linspace(-2, 2, 100)
+    x_gm, y_gm = np.meshgrid(x_g, y_g)
+
+    x_bo = np.linspace(-10, 10, 100)
+    y_bo = np.linspace(-10, 10, 100)
+    x_bom, y_bom = np.meshgrid(x_bo, y_bo)
+
+    x_bn = np.linspace(-15, -5, 100)
+    y_bn = np.linspace(-3, 3, 100)
+    x_bnm, y_bnm = np.meshgrid(x_bn, y_bn)
+
+    x_m = np.linspace(-10, 10, 100)
+    y_m = np.linspace(-10, 10, 100)
+    x_mm, y_mm = np.meshgrid(x_m, y_m)
+
+    x_l = np.linspace(-10, 10, 100)
+    y_l = np.linspace(-10, 10, 100)
+    x_lm, y_lm = np.meshgrid(x_l, y_l)
+
+    x_h = np.linspace(-5, 5, 100)
+    y_h = np.linspace(-5, 5, 100)
+    x_hm, y_hm = np.meshgrid(x_h, y_h)
+
+    x_th = np.linspace(-5, 5, 100)
+    y_th = np.linspace(-5, 5, 100)
+    x_thm, y_thm = np.meshgrid(x_th, y_th)
+
+    x_e = np.linspace(-100, 100, 100)
+    y_e = np.linspace(-100, 100, 100)
+    x_em, y_em = np.meshgrid(x_e, y_e)
+
+    x_c = np.linspace(-10, 10, 100)
+    y_c = np.linspace(-10, 10, 100)
+    x_cm, y_cm = np.meshgrid(x_c, y_c)
+
+    x_eg = np.linspace(-512, 512, 100)
+    y_eg = np.linspace(-512, 512, 100)
+    x_egm, y_egm = np.meshgrid(x_eg, y_eg)
+
+    x_ho = np.linspace(-10, 10, 100)
+    y_ho = np.linspace(-10, 10, 100)
+    x_hom, y_hom = np.meshgrid(x_ho, y_ho)
+
+    x_mc = np.linspace(-1.5, 4, 100)
+    y_mc = np.linspace(-3, 4, 100)
+    x_mcm, y_mcm = np.meshgrid(x_mc, y_mc)
+
+    x_s2 = np.linspace(-100, 100, 100)
+    y_s2 = np.linspace(-100, 100, 100)
+    x_s2m, y_s2m = np.meshgrid(x_s2, y_s2)
+
+    x_schaffer4 = np.linspace(-100, 100, 400)
+    y_schaffer4 = np.linspace(-100, 100, 400)
+    x_s4m, y_s4m = np.meshgrid(x_schaffer4, y_schaffer4)
+
+    x_styblinski = np.linspace(-5, 5, 400)
+    y_styblinski = np.linspace(-5, 5, 400)
+    x_stm, y_stm = np.meshgrid(x_styblinski, y_styblinski)
+
+    # Calcular Z para cada función
+    Z_rastrigin = calculo_z(rastrigin, x_rm, y_rm)
+    Z_ackley = calculo_z(ackley, x_am, y_am)
+    Z_sphere = calculo_z(sphere, x_sm, y_sm)
+    Z_rosenbrock = calculo_z(rosenbrock, x_rsm, y_rsm)
+    Z_beale = calculo_z(beale, x_bm, y_bm)
+    Z_goldstein = calculo_z(goldstein_price, x_gm, y_gm)
+    Z_booth = calculo_z(booth, x_bom, y_bom)
+    Z_bukin_n6 = calculo_z(bukin_n6, x_bnm, y_bnm)
+    Z_matyas = calculo_z(matyas, x_mm, y_mm)
+    Z_levi_n13 = calculo_z(levi_n13, x_lm, y_lm)
+    Z_himmelblau = calculo_z(himmelblau, x_hm, y_hm)
+    Z_three_hump_camel = calculo_z(three_hump_camel, x_thm, y_thm)
+    Z_easom = calculo_z(easom, x_em, y_em)
+    Z_cross_in_tray = calculo_z(cross_in_tray, x_cm, y_cm)
+    Z_eggholder = calculo_z(eggholder, x_egm, y_egm)
+    Z_holder_table = calculo_z(holder_table, x_hom, y_hom)
+    Z_mccormick = calculo_z(mccormick, x_mcm, y_mcm)
+    Z_schaffer_n2 = calculo_z(schaffer_n2, x_s2m, y_s2m)
+    Z_schaffer_n4 = calculo_z(schaffer_n4, x_s4m, y_s4m)
+    Z_styblinski_tang = calculo_z(styblinski_tang, x_stm, y_stm)
+
+    # Crear subplots
+    fig, axs = plt.subplots(7, 3, figsize=(15, 20))
+
+    # Graficar la función Rastrigin
+    cp = axs[0, 0].contourf(x_rm, y_rm, Z_rastrigin, cmap='viridis')
+    fig.colorbar(cp, ax=axs[0, 0])
+    axs[0, 0].set_title('Función de Rastrigin')
+    axs[0, 0].set_xlabel('X')
+    axs[0, 0].set_ylabel('Y')
+
+    # Graficar la función Ackley
+    cp = axs[0, 1].contourf(x_am, y_am, Z_ackley, cmap='viridis')
+    fig.colorbar(cp, ax=axs[0, 1])
+    axs[0, 1].set_title('Función de Ackley')
+    axs[0, 1].set_xlabel('X')
+    axs[0, 1].set_ylabel('Y')
+
+    # Graficar la función Sphere
+    cp = axs[0, 2].contourf(x_sm, y_sm, Z_sphere, cmap='viridis')
+    fig.colorbar(cp, ax=axs[0, 2])
+    axs[0, 2].set_title('Función de Sphere')
+    axs[0, 2].set_xlabel('X')
+    axs[0, 2].set_ylabel('Y')
+
+    # Graficar la función Rosenbrock
+    cp = axs[1, 0].contourf(x_rsm, y_rsm, Z_rosenbrock, cmap='viridis')
+    fig.colorbar(cp, ax=axs[1, 0])
+    axs[1, 0].set_title('Función de Rosenbrock')
+    axs[1, 0].set_xlabel('X')
+    axs[1, 0].set_ylabel('Y')
+
+    # Graficar la función Beale
+    cp = axs[1, 1].contourf(x_bm, y_bm, Z_beale, cmap='viridis')
+    fig.colorbar(cp, ax=axs[1, 1])
+    axs[1, 1].set_title('Función de Beale')
+    axs[1, 1].set_xlabel('X')
+    axs[1, 1].set_ylabel('Y')
+
+    # Graficar la función Goldstein-Price
+    cp = axs[1, 2].contourf(x_gm, y_gm, Z_goldstein, cmap='viridis')
+    fig.colorbar(cp, ax=axs[1, 2])
+    axs[1, 2].set_title('Función de Goldstein-Price')
+    axs[1, 2].set_xlabel('X')
+    axs[1, 2].set_ylabel('Y')
+
+    # Graficar la función Booth
+    cp = axs[2, 0].contourf(x_bom, y_bom, Z_booth, cmap='viridis')
+    fig.colorbar(cp, ax=axs[2, 0])
+    axs[2, 0].set_title('Función de Booth')
+    axs[2, 0].set_xlabel('X')
+    axs[2, 0].set_ylabel('Y')
+
+    # Graficar la función Bukin N.6
+    cp = axs[2, 1].contourf(x_bnm, y_bnm, Z_bukin_n6, cmap='viridis')
+    fig.colorbar(cp, ax=axs[2, 1])
+    axs[2, 1].set_title('Función de Bukin N.6')
+    axs[2, 1].set_xlabel('X')
+    axs[2, 1].set_ylabel('Y')
+
+    # Graficar la función Matyas
+    cp = axs[2, 2].contourf(x_mm, y_mm, Z_matyas, cmap='viridis')
+    fig.colorbar(cp, ax=axs[2, 2])
+    axs[2, 2].set_title('Función de Matyas')
+    axs[2, 2].set_xlabel('X')
+    axs[2, 2].set_ylabel('Y')
+
+    # Graficar la función Lévi N.13
+    cp = axs[3, 0].contourf(x_lm, y_lm, Z_levi_n13, cmap='viridis')
+    fig.colorbar(cp, ax=axs[3, 0])
+    axs[3, 0].set_title('Función de Lévi N.13')
+    axs[3, 0].set_xlabel('X')
+    axs[3, 0].set_ylabel('Y')
+
+    # Graficar la función Himmelblau
+    cp = axs[3, 1].contourf(x_hm, y_hm, Z_himmelblau, cmap='viridis')
+    fig.colorbar(cp, ax=axs[3, 1])
+    axs[3, 1].set_title('Función de Himmelblau')
+    axs[3, 1].set_xlabel('X')
+    axs[3, 1].set_ylabel('Y')
+
+    # Graficar la función Three-hump Camel
+    cp = axs[3, 2].contourf(x_thm, y_thm, Z_three_hump_camel, cmap='viridis')
+    fig.colorbar(cp, ax=axs[3, 2])
+    axs[3, 2].set_title('Función de Three-hump Camel')
+    axs[3, 2].set_xlabel('X')
+    axs[3, 2].set_ylabel('Y')
+
+    # Graficar la función Easom
+    cp = axs[4, 0].contourf(x_em, y_em, Z_easom, cmap='viridis')
+    fig.colorbar(cp, ax=axs[4, 0])
+    axs[4, 0].set_title('Función de Easom')
+    axs[4, 0].set_xlabel('X')
+    axs[4, 0].set_ylabel('Y')
+
+    # Graficar la función Cross-in-tray
+    cp = axs[4, 1].contourf(x_cm, y_cm, Z_cross_in_tray, cmap='viridis')
+    fig.colorbar(cp, ax=axs[4, 1])
+    axs[4, 1].set_title('Función de Cross-in-tray')
+    axs[4, 1].set_xlabel('X')
+    axs[4, 1].set_ylabel('Y')
+
+    # Graficar la función Eggholder
+    cp = axs[4, 2].contourf(x_egm, y_egm, Z_eggholder, cmap='viridis')
+    fig.colorbar(cp, ax=axs[4, 2])
+    axs[4, 2].set_title('Función de Eggholder')
+    axs[4, 2].set_xlabel('X')
+    axs[4, 2].set_ylabel('Y')
+
+    # Graficar la función Hölder Table
+    cp = axs[5, 0].contourf(x_hom, y_hom, Z_holder_table, cmap='viridis')
+    fig.colorbar(cp, ax=axs[5, 0])
+    axs[5, 0].set_title('Función de Hölder Table')
+    axs[5, 0].set_xlabel('X')
+    axs[5, 0].set_ylabel('Y')
+
+    # Graficar la función McCormick
+    cp = axs[5, 1].contourf(x_mcm, y_mcm, Z_mccormick, cmap='viridis')
+    fig.colorbar(cp, ax=axs[5, 1])
+    axs[5, 1].set_title('Función de McCormick')
+    axs[5, 1].set_xlabel('X')
+    axs[5, 1].set_ylabel('Y')
+
+    # Graficar la función Schaffer N.2
+    cp = axs[5, 2].contourf(x_s2m, y_s2m, Z_schaffer_n2, cmap='viridis')
+    fig.colorbar(cp, ax=axs[5, 2])
+    axs[5, 2].set_title('Función de Schaffer N.2')
+    axs[5, 2].set_xlabel('X')
+    axs[5, 2].set_ylabel('Y')
+
+    # Graficar la función Schaffer N.4
+    cp = axs[6, 0].contourf(x_s4m, y_s4m, Z_schaffer_n4, cmap='viridis')
+    fig.colorbar(cp, ax=axs[6, 0])
+    axs[6, 0].set_title('Función de Schaffer N.4')
+    axs[6, 0].set_xlabel('X')
+    axs[6, 0].set_ylabel('Y')
+
+    # Graficar la función Styblinski-Tang
+    cp = axs[6, 1].contourf(x_stm, y_stm, Z_styblinski_tang, cmap='viridis')
+    fig.colorbar(cp, ax=axs[6, 1])
+    axs[6, 1].set_title('Función de Styblinski-Tang')
+    axs[6, 1].set_xlabel('X')
+    axs[6, 1].set_ylabel('Y')
+
+
+    # Ajustar el layout
+    plt.tight_layout()
+    plt.show()
+
+if __name__ == '__main__':
+    main()
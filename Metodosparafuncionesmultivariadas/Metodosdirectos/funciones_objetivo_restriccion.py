@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 # Funciones de prueba
 
@@ -145,51 +144,57 @@ townsend_vec = np.vectorize(townsend)
 gomez_levy_vec = np.vectorize(gomez_levy)
 simionescu_vec = np.vectorize(simionescu)
 
-# Rangos de las variables
-x = np.linspace(-2.5, 2.5, 500)
-y = np.linspace(-2.5, 2.5, 500)
-X, Y = np.meshgrid(x, y)
-
-# Evaluar las funciones en la malla
-Z1 = rosenbrock_constrained_vec(X, Y)
-Z2 = rosenbrock_disk_vec(X, Y)
-Z3 = mishra_bird_vec(X, Y)
-Z4 = townsend_vec(X, Y)
-Z5 = gomez_levy_vec(X, Y)
-Z6 = simionescu_vec(X, Y)
-
-# Graficar las funciones
-plt.figure(figsize=(18, 12))
-
-plt.subplot(231)
-plt.contourf(X, Y, Z1, levels=50, cmap='viridis')
-plt.title('Rosenbrock constrained')
-plt.colorbar()
-
-plt.subplot(232)
-plt.contourf(X, Y, Z2, levels=50, cmap='plasma')
-plt.title('Rosenbrock disk constrained')
-plt.colorbar()
-
-plt.subplot(233)
-plt.contourf(X, Y, Z3, levels=50, cmap='inferno')
-plt.title("Mishra's Bird constrained")
-plt.colorbar()
-
-plt.subplot(234)
-plt.contourf(X, Y, Z4, levels=50, cmap='magma')
-plt.title('Townsend function constrained')
-plt.colorbar()
-
-plt.subplot(235)
-plt.contourf(X, Y, Z5, levels=50, cmap='cividis')
-plt.title('Gomez and Levy function constrained')
-plt.colorbar()
-
-plt.subplot(236)
-plt.contourf(X, Y, Z6, levels=50, cmap='twilight')
-plt.title('Simionescu function constrained')
-plt.colorbar()
-
-plt.tight_layout()
-plt.show()
+def main():
+    """Ejecuta los ejemplos del módulo y grafica los resultados."""
+    import matplotlib.pyplot as plt
+    # Rangos de las variables
+    x = np.linspace(-2.5, 2.5, 500)
+    y = np.linspace(-2.5, 2.5, 500)
+    X, Y = np.meshgrid(x, y)
+
+    # Evaluar las funciones en la malla
+    Z1 = rosenbrock_constrained_vec(X, Y)
+    Z2 = rosenbrock_disk_vec(X, Y)
+    Z3 = mishra_bird_vec(X, Y)
+    Z4 = townsend_vec(X, Y)
+    Z5 = gomez_levy_vec(X, Y)
+    Z6 = simionescu_vec(X, Y)
+
+    # Graficar las funciones
+    plt.figure(figsize=(18, 12))
+
+    plt.subplot(231)
+    plt.contourf(X, Y, Z1, levels=50, cmap='viridis')
+    plt.title('Rosenbrock constrained')
+    plt.colorbar()
+
+    plt.subplot(232)
+    plt.contourf(X, Y, Z2, levels=50, cmap='plasma')
+    plt.title('Rosenbrock disk constrained')
+    plt.colorbar()
+
+    plt.subplot(233)
+    plt.contourf(X, Y, Z3, levels=50, cmap='inferno')
+    plt.title("Mishra's Bird constrained")
+    plt.colorbar()
+
+    plt.subplot(234)
+    plt.contourf(X, Y, Z4, levels=50, cmap='magma')
+    plt.title('Townsend function constrained')
+    plt.colorbar()
+
+    plt.subplot(235)
+    plt.contourf(X, Y, Z5, levels=50, cmap='cividis')
+    plt.title('Gomez and Levy function constrained')
+    plt.colorbar()
+
+    plt.subplot(236)
+    plt.contourf(X, Y, Z6, levels=50, cmap='twilight')
+    plt.title('Simionescu function constrained')
+    plt.colorbar()
+
+    plt.tight_layout()
+    plt.show()
+
+if __name__ == '__main__':
+    main()
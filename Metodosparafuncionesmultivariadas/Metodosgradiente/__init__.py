@@ -1,5 +1,12 @@
 #Metodos de gradiente
+from .busqueda_linea import PHI, regla_eliminacion, w_to_x, iteraciones_dorada, busquedaDorada, armijo, wolfe, longitud_paso
 from .cauchy import regla_eliminacion, w_to_x, busquedaDorada, gradiente, cauchy
-from diferenciacentralgradiente import f, primera_derivada, segunda_derivada
-from .gradiente_conjugado import gradiente, regla_eliminacion, w_to_x, busquedaDorada, gradiente_conjugado
-from .newton import regla_eliminacion, w_to_x, busquedaDorada, gradiente, hessian_matrix, newton
\ No newline at end of file
+from .diferenciacentralgradiente import f, registrar_derivadas, derivadas_registradas, evaluar_puntos, gradiente_lote, derivadas_lote, hessiana_lote, primera_derivada, segunda_derivada
+from .gradiente_conjugado import gradiente, regla_eliminacion, w_to_x, busquedaDorada, beta_conjugado, gradiente_conjugado
+from .newton import regla_eliminacion, w_to_x, busquedaDorada, gradiente, hessian_matrix, cholesky_modificado, direccion_newton, newton
+from .bfgs import actualizar_bfgs, dos_ciclos, bfgs, lbfgs
+
+# Derivadas analíticas de la biblioteca de funciones objetivo
+from Metodosparafuncionesmultivariadas.Metodosdirectos.funciones_objetivo import DERIVADAS_ANALITICAS
+for _funcion, (_gradiente, _hessiana) in DERIVADAS_ANALITICAS.items():
+    registrar_derivadas(_funcion, _gradiente, _hessiana)
\ No newline at end of file
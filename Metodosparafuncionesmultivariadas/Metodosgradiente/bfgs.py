@@ -0,0 +1,193 @@
+from collections import deque
+import numpy as np
+try:
+    from .busqueda_linea import longitud_paso
+    from .diferenciacentralgradiente import gradiente_lote
+except ImportError:
+    # Ejecutado como script: la carpeta del módulo está en sys.path
+    from busqueda_linea import longitud_paso
+    from diferenciacentralgradiente import gradiente_lote
+
+def gradiente(f, x, deltaX=0.00001, vectorizada=None):
+    """
+    Calcula el gradiente de una función multivariable en un punto dado.
+
+    Args:
+        f (function): Función a derivar.
+        x (list): Punto de evaluación.
+        deltaX (float, optional): Paso de diferencia finita. Por defecto 0.00001.
+        vectorizada (bool, optional): Si f evalúa una matriz de puntos en una sola llamada.
+            Por defecto None (se detecta automáticamente).
+
+    Returns:
+        np.ndarray: Gradientes parciales en el punto x.
+    """
+    return gradiente_lote(f, x, deltaX, vectorizada)
+
+def actualizar_bfgs(H, s, y, escalar=False):
+    """
+    Actualiza la aproximación de la inversa de la Hessiana con la fórmula BFGS. Si la
+    condición de curvatura s^T y > 0 no se cumple la actualización se omite para que H
+    siga siendo definida positiva.
+
+    Args:
+        H (np.ndarray): Aproximación actual de la inversa de la Hessiana (N x N).
+        s (np.ndarray): Paso x_{k+1} - x_k.
+        y (np.ndarray): Cambio del gradiente g_{k+1} - g_k.
+        escalar (bool, optional): Si es True H se reemplaza antes por (s^T y / y^T y) I,
+            como se recomienda tras el primer paso. Por defecto False.
+
+    Returns:
+        np.ndarray: Nueva aproximación de la inversa de la Hessiana.
+    """
+    sy = np.dot(s, y)
+    if sy <= 1e-10 * np.linalg.norm(s) * np.linalg.norm(y):
+        return H
+    if escalar:
+        H = (sy / np.dot(y, y)) * np.eye(len(s))
+    rho = 1.0 / sy
+    Hy = np.dot(H, y)
+    return (H - rho * (np.outer(s, Hy) + np.outer(Hy, s))
+            + (rho ** 2 * np.dot(y, Hy) + rho) * np.outer(s, s))
+
+def dos_ciclos(grad, historial):
+    """
+    Calcula la dirección de L-BFGS -H_k grad con la recursión de dos ciclos, usando sólo
+    los pares (s, y) guardados, sin formar ninguna matriz N x N.
+
+    Args:
+        grad (np.ndarray): Gradiente en el punto actual.
+        historial (deque): Tripletas (s, y, 1 / s^T y) de las últimas iteraciones, de la
+            más antigua a la más reciente.
+
+    Returns:
+        np.ndarray: Dirección de búsqueda.
+    """
+    q = np.array(grad, dtype=float)
+    alphas = []
+    for s, y, rho in reversed(historial):
+        a = rho * np.dot(s, q)
+        q -= a * y
+        alphas.append(a)
+    if historial:
+        s, y, _ = historial[-1]
+        q *= np.dot(s, y) / np.dot(y, y)
+    for (s, y, rho), a in zip(historial, reversed(alphas)):
+        b = rho * np.dot(y, q)
+        q += (a - b) * s
+    return -q
+
+def bfgs(funcion, x0, epsilon1, epsilon2, M, intervalo=(0.0, 1.0), line_search="wolfe"):
+    """
+    Método cuasi-Newton BFGS. Mantiene una aproximación de la inversa de la Hessiana que
+    se actualiza con los cambios del gradiente, así que cada iteración sólo necesita
+    gradientes (2N evaluaciones) en lugar de la Hessiana por diferencias finitas.
+
+    Args:
+        funcion (function): Función a optimizar.
+        x0 (array): Punto inicial.
+        epsilon1 (float): Tolerancia para norma del gradiente.
+        epsilon2 (float): Tolerancia para cambio relativo en la solución.
+        M (int): Máximo número de iteraciones.
+        intervalo (tuple, optional): Intervalo (a, b) en el que se busca el tamaño de paso
+            con la búsqueda dorada. Por defecto (0, 1).
+        line_search (str, optional): Búsqueda de línea: "golden" (búsqueda dorada), "armijo"
+            o "wolfe". Por defecto "wolfe", que garantiza la condición de curvatura.
+
+    Returns:
+        array: Punto óptimo encontrado.
+    """
+    terminar = False
+    xk = np.asarray(x0, dtype=float)
+    k = 0
+    grad = gradiente(funcion, xk)
+    fx = None
+    H = np.eye(xk.size)
+
+    while not terminar:
+        if np.linalg.norm(grad) < epsilon1 or k >= M:
+            terminar = True
+        else:
+            direccion = -np.dot(H, grad)
+            alpha, fx_k1, grad_k1 = longitud_paso(funcion, gradiente, xk, direccion, grad, fx,
+                                                  line_search, epsilon2, intervalo)
+            x_k1 = xk + alpha * direccion
+
+            if np.linalg.norm(x_k1 - xk) / (np.linalg.norm(xk) + 0.00001) <= epsilon2:
+                terminar = True
+            else:
+                if grad_k1 is None:
+                    grad_k1 = gradiente(funcion, x_k1)
+                H = actualizar_bfgs(H, x_k1 - xk, grad_k1 - grad, escalar=k == 0)
+                k += 1
+                xk = x_k1
+                fx = fx_k1
+                grad = grad_k1
+
+    return xk
+
+def lbfgs(funcion, x0, epsilon1, epsilon2, M, m=10, intervalo=(0.0, 1.0), line_search="wolfe"):
+    """
+    Método L-BFGS (BFGS de memoria limitada). Guarda sólo los últimos m pares (s, y) y
+    obtiene la dirección con la recursión de dos ciclos, por lo que usa memoria O(mN) y
+    sirve para problemas con miles de variables.
+
+    Args:
+        funcion (function): Función a optimizar.
+        x0 (array): Punto inicial.
+        epsilon1 (float): Tolerancia para norma del gradiente.
+        epsilon2 (float): Tolerancia para cambio relativo en la solución.
+        M (int): Máximo número de iteraciones.
+        m (int, optional): Número de pares (s, y) que se guardan. Por defecto 10.
+        intervalo (tuple, optional): Intervalo (a, b) en el que se busca el tamaño de paso
+            con la búsqueda dorada. Por defecto (0, 1).
+        line_search (str, optional): Búsqueda de línea: "golden" (búsqueda dorada), "armijo"
+            o "wolfe". Por defecto "wolfe", que garantiza la condición de curvatura.
+
+    Returns:
+        array: Punto óptimo encontrado.
+    """
+    if m < 1:
+        raise ValueError("m debe ser un entero mayor o igual a 1")
+    terminar = False
+    xk = np.asarray(x0, dtype=float)
+    k = 0
+    grad = gradiente(funcion, xk)
+    fx = None
+    historial = deque(maxlen=m)
+
+    while not terminar:
+        if np.linalg.norm(grad) < epsilon1 or k >= M:
+            terminar = True
+        else:
+            direccion = dos_ciclos(grad, historial)
+            alpha, fx_k1, grad_k1 = longitud_paso(funcion, gradiente, xk, direccion, grad, fx,
+                                                  line_search, epsilon2, intervalo)
+            x_k1 = xk + alpha * direccion
+
+            if np.linalg.norm(x_k1 - xk) / (np.linalg.norm(xk) + 0.00001) <= epsilon2:
+                terminar = True
+            else:
+                if grad_k1 is None:
+                    grad_k1 = gradiente(funcion, x_k1)
+                s, y = x_k1 - xk, grad_k1 - grad
+                sy = np.dot(s, y)
+                # Sin curvatura positiva el par se descarta para conservar el descenso
+                if sy > 1e-10 * np.linalg.norm(s) * np.linalg.norm(y):
+                    historial.append((s, y, 1.0 / sy))
+                k += 1
+                xk = x_k1
+                fx = fx_k1
+                grad = grad_k1
+
+    return xk
+
+def main():
+    """Ejecuta el ejemplo de uso del módulo."""
+    # Ejemplo de uso con la función de Himmenblau
+    himmenblau = lambda x: (((x[0]**2) + x[1] - 11)**2) + ((x[0] + (x[1]**2) - 7)**2)
+    print("BFGS:", bfgs(himmenblau, np.array([0.0, 0.0]), 0.001, 0.001, 100))
+    print("L-BFGS:", lbfgs(himmenblau, np.array([0.0, 0.0]), 0.001, 0.001, 100))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+import numpy as np
+import math
+
+# Razón dorada (sqrt(5) - 1) / 2: fracción del intervalo que conserva cada iteración
+PHI = (math.sqrt(5) - 1) / 2
+
+def regla_eliminacion(x1, x2, fx1, fx2, a, b) -> tuple[float, float]:
+    """
+    Regla de eliminación para la búsqueda unidimensional.
+
+    Args:
+        x1 (float): Punto 1 de evaluación.
+        x2 (float): Punto 2 de evaluación.
+        fx1 (float): Valor de la función en x1.
+        fx2 (float): Valor de la función en x2.
+        a (float): Extremo izquierdo del intervalo.
+        b (float): Extremo derecho del intervalo.
+
+    Returns:
+        tuple[float, float]: Retorna los extremos ajustados del intervalo después de la eliminación.
+    """
+    if fx1 > fx2:
+        return x1, b
+
+    if fx1 < fx2:
+        return a, x2
+
+    return x1, x2
+
+def w_to_x(w: float, a, b) -> float:
+    """
+    Transforma un valor w en el intervalo [0, 1] a un valor en el intervalo [a, b].
+
+    Args:
+        w (float): Valor en el intervalo [0, 1].
+        a (float): Extremo izquierdo del intervalo de salida.
+        b (float): Extremo derecho del intervalo de salida.
+
+    Returns:
+        float: Valor transformado en el intervalo [a, b].
+    """
+    return w * (b - a) + a
+
+def iteraciones_dorada(epsilon: float) -> int:
+    """
+    Número de iteraciones de la búsqueda dorada para reducir el intervalo a una fracción
+    epsilon de su longitud inicial.
+
+    Args:
+        epsilon (float): Tolerancia relativa a la longitud del intervalo inicial.
+
+    Returns:
+        int: Menor k tal que PHI^k <= epsilon.
+    """
+    if epsilon >= 1:
+        return 0
+    return math.ceil(math.log(epsilon) / math.log(PHI))
+
+def busquedaDorada(funcion, epsilon: float, a: float = 0.0, b: float = 1.0) -> float:
+    """
+    Búsqueda dorada para optimización unidimensional en el intervalo [a, b]. En cada
+    iteración se conserva el punto interior que sobrevive a la eliminación junto con su
+    valor, por lo que sólo se evalúa la función en un punto nuevo.
+
+    Args:
+        funcion (function): Función objetivo a minimizar.
+        epsilon (float): Tolerancia de convergencia, relativa a la longitud de [a, b].
+        a (float, optional): Extremo izquierdo del intervalo inicial. Por defecto 0.
+        b (float, optional): Extremo derecho del intervalo inicial. Por defecto 1.
+
+    Returns:
+        float: Punto óptimo encontrado dentro del intervalo [a, b].
+    """
+    x1 = b - PHI * (b - a)
+    x2 = a + PHI * (b - a)
+    fx1, fx2 = funcion(x1), funcion(x2)
+
+    for _ in range(iteraciones_dorada(epsilon)):
+        if fx1 > fx2:
+            a, x1, fx1 = x1, x2, fx2
+            x2 = a + PHI * (b - a)
+            fx2 = funcion(x2)
+        elif fx1 < fx2:
+            b, x2, fx2 = x2, x1, fx1
+            x1 = b - PHI * (b - a)
+            fx1 = funcion(x1)
+        else:
+            a, b = x1, x2
+            x1 = b - PHI * (b - a)
+            x2 = a + PHI * (b - a)
+            fx1, fx2 = funcion(x1), funcion(x2)
+
+    return (a + b) / 2
+
+def _cuadratica(a0, f0, g0, a1, f1):
+    # Minimizador de la parábola con valor f0 y pendiente g0 en a0 y valor f1 en a1
+    return a0 - g0 * (a1 - a0) ** 2 / (2 * (f1 - f0 - g0 * (a1 - a0)))
+
+def _cubica(a0, f0, g0, a1, f1, g1):
+    # Minimizador del polinomio cúbico de Hermite que interpola valores y pendientes en a0 y a1
+    d1 = g0 + g1 - 3 * (f0 - f1) / (a0 - a1)
+    d2 = math.copysign(math.sqrt(d1 ** 2 - g0 * g1), a1 - a0)
+    return a1 - (a1 - a0) * (g1 + d2 - d1) / (g1 - g0 + 2 * d2)
+
+def _salvaguarda(alpha, a, b, margen=0.1):
+    # Mantiene alpha dentro de [a, b] lejos de los extremos; si no, usa el punto medio
+    lo, hi = min(a, b), max(a, b)
+    if not math.isfinite(alpha) or alpha < lo + margen * (hi - lo) or alpha > hi - margen * (hi - lo):
+        return (lo + hi) / 2
+    return alpha
+
+def armijo(phi, phi0: float, dphi0: float, alpha: float = 1.0, c1: float = 1e-4, max_iter: int = 30,
+           phi_alpha: float = None):
+    """
+    Búsqueda de línea con retroceso que satisface la condición de Armijo
+    phi(alpha) <= phi(0) + c1 * alpha * phi'(0). El primer retroceso interpola una
+    parábola y los siguientes un polinomio cúbico con los dos últimos valores probados.
+
+    Args:
+        phi (function): Función del tamaño de paso, phi(alpha) = f(x + alpha * d).
+        phi0 (float): Valor phi(0).
+        dphi0 (float): Derivada phi'(0), negativa si d es dirección de descenso.
+        alpha (float, optional): Paso inicial. Por defecto 1.
+        c1 (float, optional): Constante de decrecimiento suficiente. Por defecto 1e-4.
+        max_iter (int, optional): Máximo número de retrocesos. Por defecto 30.
+        phi_alpha (float, optional): Valor phi(alpha) del paso inicial, si ya se conoce.
+
+    Returns:
+        tuple: (alpha, phi(alpha)). Si no se encuentra un paso aceptable retorna (0, phi0).
+    """
+    phi_a = phi(alpha) if phi_alpha is None else phi_alpha
+    alpha_prev = phi_prev = None
+    for _ in range(max_iter):
+        if phi_a <= phi0 + c1 * alpha * dphi0:
+            return alpha, phi_a
+        if alpha_prev is None or not math.isfinite(phi_prev):
+            nuevo = -dphi0 * alpha ** 2 / (2 * (phi_a - phi0 - dphi0 * alpha))
+        else:
+            r1 = phi_a - phi0 - dphi0 * alpha
+            r0 = phi_prev - phi0 - dphi0 * alpha_prev
+            den = alpha_prev ** 2 * alpha ** 2 * (alpha - alpha_prev)
+            a = (alpha_prev ** 2 * r1 - alpha ** 2 * r0) / den
+            b = (-alpha_prev ** 3 * r1 + alpha ** 3 * r0) / den
+            disc = b ** 2 - 3 * a * dphi0
+            nuevo = (-b + math.sqrt(disc)) / (3 * a) if a != 0 and disc >= 0 else alpha / 2
+        if not math.isfinite(nuevo):
+            nuevo = alpha / 2
+        alpha_prev, phi_prev = alpha, phi_a
+        alpha = min(max(nuevo, 0.1 * alpha), 0.5 * alpha)
+        phi_a = phi(alpha)
+    if phi_a <= phi0 + c1 * alpha * dphi0:
+        return alpha, phi_a
+    return 0.0, phi0
+
+def _zoom(phi, dphi, phi0, dphi0, lo, hi, phi_lo, phi_hi, dphi_lo, dphi_hi, c1, c2, max_iter):
+    for _ in range(max_iter):
+        if dphi_hi is not None:
+            alpha = _cubica(lo, phi_lo, dphi_lo, hi, phi_hi, dphi_hi)
+        else:
+            alpha = _cuadratica(lo, phi_lo, dphi_lo, hi, phi_hi)
+        alpha = _salvaguarda(alpha, lo, hi)
+        phi_a = phi(alpha)
+        if phi_a > phi0 + c1 * alpha * dphi0 or phi_a >= phi_lo:
+            hi, phi_hi, dphi_hi = alpha, phi_a, None
+        else:
+            dphi_a = dphi(alpha)
+            if abs(dphi_a) <= -c2 * dphi0:
+                return alpha, phi_a, dphi_a
+            if dphi_a * (hi - lo) >= 0:
+                hi, phi_hi, dphi_hi = lo, phi_lo, dphi_lo
+            lo, phi_lo, dphi_lo = alpha, phi_a, dphi_a
+    return lo, phi_lo, dphi_lo
+
+def wolfe(phi, dphi, phi0: float, dphi0: float, alpha: float = 1.0, c1: float = 1e-4,
+          c2: float = 0.9, alpha_max: float = 1e10, max_iter: int = 20):
+    """
+    Búsqueda de línea que satisface las condiciones fuertes de Wolfe:
+    phi(alpha) <= phi(0) + c1 * alpha * phi'(0) y |phi'(alpha)| <= c2 * |phi'(0)|.
+    Duplica el paso hasta acotar un intervalo aceptable y luego lo reduce interpolando
+    con polinomios cúbicos (o parábolas cuando falta la pendiente en un extremo).
+
+    Args:
+        phi (function): Función del tamaño de paso, phi(alpha) = f(x + alpha * d).
+        dphi (function): Derivada phi'(alpha) = grad f(x + alpha * d) · d.
+        phi0 (float): Valor phi(0).
+        dphi0 (float): Derivada phi'(0), negativa si d es dirección de descenso.
+        alpha (float, optional): Paso inicial. Por defecto 1.
+        c1 (float, optional): Constante de decrecimiento suficiente. Por defecto 1e-4.
+        c2 (float, optional): Constante de curvatura. Por defecto 0.9.
+        alpha_max (float, optional): Paso máximo permitido. Por defecto 1e10.
+        max_iter (int, optional): Máximo número de iteraciones de cada fase. Por defecto 20.
+
+    Returns:
+        tuple: (alpha, phi(alpha), phi'(alpha)). Si no se cumplen las condiciones retorna
+        el mejor paso encontrado que satisface la condición de Armijo (0 si ninguno).
+    """
+    alpha_prev, phi_prev, dphi_prev = 0.0, phi0, dphi0
+    for i in range(max_iter):
+        phi_a = phi(alpha)
+        if phi_a > phi0 + c1 * alpha * dphi0 or (i > 0 and phi_a >= phi_prev):
+            return _zoom(phi, dphi, phi0, dphi0, alpha_prev, alpha, phi_prev, phi_a,
+                         dphi_prev, None, c1, c2, max_iter)
+        dphi_a = dphi(alpha)
+        if abs(dphi_a) <= -c2 * dphi0:
+            return alpha, phi_a, dphi_a
+        if dphi_a >= 0:
+            return _zoom(phi, dphi, phi0, dphi0, alpha, alpha_prev, phi_a, phi_prev,
+                         dphi_a, dphi_prev, c1, c2, max_iter)
+        alpha_prev, phi_prev, dphi_prev = alpha, phi_a, dphi_a
+        if alpha >= alpha_max:
+            break
+        alpha = min(2 * alpha, alpha_max)
+    return alpha_prev, phi_prev, dphi_prev
+
+def longitud_paso(funcion, gradiente, x, d, grad, fx=None, line_search="golden",
+                  epsilon=1e-3, intervalo=(0.0, 1.0), c2=0.9):
+    """
+    Calcula el tamaño de paso a lo largo de la dirección d con el método indicado. Es el
+    punto común de los métodos de gradiente para elegir la búsqueda de línea.
+
+    Args:
+        funcion (function): Función objetivo.
+        gradiente (function): Función gradiente(f, x) usada por el método.
+        x (np.ndarray): Punto actual.
+        d (np.ndarray): Dirección de búsqueda.
+        grad (np.ndarray): Gradiente de la función en x.
+        fx (float, optional): Valor de la función en x, si ya se conoce.
+        line_search (str, optional): "golden" (búsqueda dorada en intervalo), "armijo"
+            o "wolfe". Por defecto "golden".
+        epsilon (float, optional): Tolerancia de la búsqueda dorada. Por defecto 1e-3.
+        intervalo (tuple, optional): Intervalo del paso para la búsqueda dorada. Por defecto (0, 1).
+        c2 (float, optional): Constante de curvatura de Wolfe. Por defecto 0.9.
+
+    Returns:
+        tuple: (alpha, f(x + alpha * d), gradiente en x + alpha * d). Los dos últimos son
+        None cuando el método no los calcula. Si d no es dirección de descenso se usa la
+        búsqueda dorada sin más comprobaciones.
+    """
+    if line_search not in ("golden", "armijo", "wolfe"):
+        raise ValueError('line_search debe ser "golden", "armijo" o "wolfe"')
+
+    def phi(alpha):
+        return funcion(x + alpha * d)
+
+    dphi0 = float(np.dot(grad, d))
+    if not dphi0 < 0:
+        return busquedaDorada(phi, epsilon, *intervalo), None, None
+
+    if fx is None:
+        fx = funcion(x)
+    if line_search == "golden":
+        alpha = busquedaDorada(phi, epsilon, *intervalo)
+        f_alpha = phi(alpha)
+        # La búsqueda dorada supone phi unimodal en el intervalo; si el paso que encuentra
+        # aumenta la función se retrocede desde él con la condición de Armijo
+        if f_alpha > fx:
+            alpha, f_alpha = armijo(phi, fx, dphi0, alpha, phi_alpha=f_alpha)
+        return alpha, f_alpha, None
+    if line_search == "armijo":
+        alpha, f_alpha = armijo(phi, fx, dphi0)
+        return alpha, f_alpha, None
+
+    gradientes = {}
+
+    def dphi(alpha):
+        gradientes[alpha] = np.asarray(gradiente(funcion, x + alpha * d), dtype=float)
+        return float(np.dot(gradientes[alpha], d))
+
+    alpha, f_alpha, _ = wolfe(phi, dphi, fx, dphi0, c2=c2)
+    return alpha, f_alpha, gradientes.get(alpha)
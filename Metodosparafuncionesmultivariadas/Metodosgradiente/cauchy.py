@@ -1,72 +1,13 @@
 import numpy as np
-import math
-
-def regla_eliminacion(x1, x2, fx1, fx2, a, b) -> tuple[float, float]:
-    """
-    Regla de eliminación para la búsqueda unidimensional.
-
-    Args:
-        x1 (float): Punto 1 de evaluación.
-        x2 (float): Punto 2 de evaluación.
-        fx1 (float): Valor de la función en x1.
-        fx2 (float): Valor de la función en x2.
-        a (float): Extremo izquierdo del intervalo.
-        b (float): Extremo derecho del intervalo.
-
-    Returns:
-        tuple[float, float]: Retorna los extremos ajustados del intervalo después de la eliminación.
-    """
-    if fx1 > fx2:
-        return x1, b
-
-    if fx1 < fx2:
-        return a, x2
-    
-    return x1, x2
-
-def w_to_x(w: float, a, b) -> float:
-    """
-    Transforma un valor w en el intervalo [0, 1] a un valor en el intervalo [a, b].
-
-    Args:
-        w (float): Valor en el intervalo [0, 1].
-        a (float): Extremo izquierdo del intervalo de salida.
-        b (float): Extremo derecho del intervalo de salida.
-
-    Returns:
-        float: Valor transformado en el intervalo [a, b].
-    """
-    return w * (b - a) + a
-
-def busquedaDorada(funcion, epsilon: float, a: float = None, b: float = None) -> float:
-    """
-    Implementación del método de búsqueda dorada para optimización unidimensional.
-
-    Args:
-        funcion (function): Función objetivo a minimizar.
-        epsilon (float): Tolerancia de convergencia.
-        a (float, optional): Extremo izquierdo del intervalo inicial. Por defecto None.
-        b (float, optional): Extremo derecho del intervalo inicial. Por defecto None.
-
-    Returns:
-        float: Punto óptimo encontrado dentro del intervalo [a, b].
-    """
-    PHI = (1 + math.sqrt(5)) / 2 - 1
-    aw, bw = 0, 1
-    Lw = 1
-    k = 1
-
-    while Lw > epsilon:
-        w2 = aw + PHI * Lw
-        w1 = bw - PHI * Lw
-        aw, bw = regla_eliminacion(w1, w2, funcion(w_to_x(w1, a, b)),
-                                   funcion(w_to_x(w2, a, b)), aw, bw)
-        k += 1
-        Lw = bw - aw
-
-    return (w_to_x(aw, a, b) + w_to_x(bw, a, b)) / 2
-
-def gradiente(f, x, deltaX=0.001):
+try:
+    from .busqueda_linea import regla_eliminacion, w_to_x, busquedaDorada, longitud_paso
+    from .diferenciacentralgradiente import gradiente_lote
+except ImportError:
+    # Ejecutado como script: la carpeta del módulo está en sys.path
+    from busqueda_linea import regla_eliminacion, w_to_x, busquedaDorada, longitud_paso
+    from diferenciacentralgradiente import gradiente_lote
+
+def gradiente(f, x, deltaX=0.001, vectorizada=None):
     """
     Calcula el gradiente de una función multivariable en un punto dado.
 
@@ -74,20 +15,15 @@ def gradiente(f, x, deltaX=0.001):
         f (function): Función a derivar.
         x (list): Punto de evaluación.
         deltaX (float, optional): Paso de diferencia finita. Por defecto 0.001.
+        vectorizada (bool, optional): Si f evalúa una matriz de puntos en una sola llamada.
+            Por defecto None (se detecta automáticamente).
 
     Returns:
-        list: Lista de gradientes parciales en el punto x.
+        np.ndarray: Gradientes parciales en el punto x.
     """
-    grad = []
-    for i in range(len(x)):
-        xp = x.copy()
-        xn = x.copy()
-        xp[i] += deltaX
-        xn[i] -= deltaX
-        grad.append((f(xp) - f(xn)) / (2 * deltaX))
-    return grad
+    return gradiente_lote(f, x, deltaX, vectorizada)
 
-def cauchy(funcion, x0, epsilon1, epsilon2, M):
+def cauchy(funcion, x0, epsilon1, epsilon2, M, intervalo=(0.0, 1.0), line_search="golden"):
     """
     Método de Cauchy para optimización basada en gradiente.
 
@@ -97,6 +33,8 @@ def cauchy(funcion, x0, epsilon1, epsilon2, M):
         epsilon1 (float): Tolerancia para norma del gradiente.
         epsilon2 (float): Tolerancia para cambio relativo en la solución.
         M (int): Máximo número de iteraciones.
+        intervalo (tuple, optional): Intervalo (a, b) en el que se busca el tamaño de paso. Por defecto (0, 1).
+        line_search (str, optional): Búsqueda de línea: "golden" (búsqueda dorada), "armijo" o "wolfe". Por defecto "golden".
 
     Returns:
         array: Punto óptimo encontrado.
@@ -104,17 +42,15 @@ def cauchy(funcion, x0, epsilon1, epsilon2, M):
     terminar = False
     xk = x0
     k = 0
+    grad = np.array(gradiente(funcion, xk))
+    fx = None
 
     while not terminar:
-        grad = np.array(gradiente(funcion, xk))
-
         if np.linalg.norm(grad) < epsilon1 or k >= M:
             terminar = True
         else:
-            def alpha_funcion(alpha):
-                return funcion(xk - alpha * grad)
-
-            alpha = busquedaDorada(alpha_funcion, epsilon=epsilon2, a=0.0, b=1.0)
+            alpha, fx_k1, grad_k1 = longitud_paso(funcion, gradiente, xk, -grad, grad, fx,
+                                                  line_search, epsilon2, intervalo)
             x_k1 = xk - alpha * grad
 
             if np.linalg.norm(x_k1 - xk) / (np.linalg.norm(xk) + 0.00001) <= epsilon2:
@@ -122,9 +58,16 @@ def cauchy(funcion, x0, epsilon1, epsilon2, M):
             else:
                 k += 1
                 xk = x_k1
+                fx = fx_k1
+                grad = grad_k1 if grad_k1 is not None else np.array(gradiente(funcion, xk))
 
     return xk
 
-# Ejemplo de uso con la función de Himmenblau
-himmenblau = lambda x: (((x[0]**2) + x[1] - 11)**2) + ((x[0] + (x[1]**2) - 7)**2)
-print(cauchy(himmenblau, np.array([0.0, 0.0]), 0.001, 0.001, 100))
\ No newline at end of file
+def main():
+    """Ejecuta el ejemplo de uso del módulo."""
+    # Ejemplo de uso con la función de Himmenblau
+    himmenblau = lambda x: (((x[0]**2) + x[1] - 11)**2) + ((x[0] + (x[1]**2) - 7)**2)
+    print(cauchy(himmenblau, np.array([0.0, 0.0]), 0.001, 0.001, 100))
+
+if __name__ == '__main__':
+    main()
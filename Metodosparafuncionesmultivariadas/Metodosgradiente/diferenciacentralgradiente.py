@@ -1,5 +1,15 @@
+import weakref
 import numpy as np
 
+# Recuerda, por función objetivo, si acepta una matriz de puntos en una sola llamada
+_SOPORTA_LOTE = weakref.WeakKeyDictionary()
+
+# Gradiente y Hessiana analíticos registrados por función objetivo
+_DERIVADAS = weakref.WeakKeyDictionary()
+
+# Máximo de elementos (filas x coordenadas) de cada lote de puntos del gradiente y la Hessiana
+_MAX_ELEMENTOS_LOTE = 2 ** 22
+
 def f(x1, x2):
     """
     Función objetivo de prueba.
@@ -16,34 +26,256 @@ def f(x1, x2):
     """
     return ((x1**2 + x2 - 11)**2) + ((x1 + x2**2 - 7)**2)
 
-def primera_derivada(f, x, h):
+def _llamar(f, puntos, desempaquetar):
+    # Con desempaquetar=True f recibe cada coordenada como un argumento, f(x1, x2, ...)
+    if desempaquetar:
+        return f(*np.moveaxis(puntos, -1, 0))
+    return f(puntos)
+
+def _acepta_lote(f, puntos, desempaquetar):
+    # Prueba una llamada con la matriz y la compara con la evaluación de la primera y la
+    # última fila. Con m == n se prueba sin la última fila, porque una f que indexa
+    # componentes (x[0], x[1], ...) retornaría n valores por columnas con la forma (m,).
+    # Retorna (acepta, valores en todos los puntos), reutilizando las evaluaciones hechas.
+    m = len(puntos)
+    prueba = puntos[:-1] if m > 1 and m == puntos.shape[-1] else puntos
+    individuales = {i: float(_llamar(f, puntos[i], desempaquetar)) for i in {0, len(prueba) - 1}}
+    try:
+        valores = np.asarray(_llamar(f, prueba, desempaquetar), dtype=float)
+        acepta = valores.shape == (len(prueba),) and all(
+            np.allclose(valores[i], valor, rtol=1e-9, atol=0, equal_nan=True)
+            for i, valor in individuales.items())
+    except Exception:
+        acepta = False
+    if acepta:
+        if len(prueba) < m:
+            valores = np.append(valores, _llamar(f, puntos[-1], desempaquetar))
+        return True, valores
+    return False, np.array([individuales[i] if i in individuales else _llamar(f, p, desempaquetar)
+                            for i, p in enumerate(puntos)], dtype=float)
+
+def registrar_derivadas(f, gradiente, hessiana=None):
+    """
+    Registra el gradiente y la Hessiana analíticos de f. A partir de entonces
+    gradiente_lote, derivadas_lote y hessiana_lote (y con ellas todos los métodos de
+    gradiente) los usan en lugar de las diferencias finitas cuando reciben f.
+
+    Parámetros:
+    f : función
+        Función objetivo.
+    gradiente : función
+        Recibe los mismos argumentos que f y retorna el gradiente, con las componentes
+        en el último eje.
+    hessiana : función o None
+        Recibe los mismos argumentos que f y retorna la matriz Hessiana en los dos
+        últimos ejes. Si es None la Hessiana se sigue calculando por diferencias finitas.
+
+    Retorna:
+    función
+        La misma f, para poder usarse como decorador.
+    """
+    _DERIVADAS[f] = (gradiente, hessiana)
+    return f
+
+def derivadas_registradas(f):
+    """
+    Busca las derivadas analíticas registradas para f.
+
+    Parámetros:
+    f : función
+        Función objetivo.
+
+    Retorna:
+    tuple o None
+        (gradiente, hessiana) registrados con registrar_derivadas, o None si f no tiene.
+    """
+    try:
+        return _DERIVADAS.get(f)
+    except TypeError:
+        return None
+
+def evaluar_puntos(f, puntos, vectorizada=None, desempaquetar=False):
+    """
+    Evalúa f en cada fila de una matriz de puntos.
+
+    Parámetros:
+    f : función
+        Función escalar. Si acepta lotes, f(puntos) con puntos de forma (m, n) debe
+        retornar un arreglo de forma (m,).
+    puntos : array_like
+        Matriz (m, n) con un punto por fila.
+    vectorizada : bool o None
+        True evalúa todos los puntos en una sola llamada, False llama a f por cada
+        punto y None (por defecto) lo detecta la primera vez que se usa f y lo recuerda.
+    desempaquetar : bool
+        Si es True f recibe las coordenadas como argumentos separados, f(x1, x2, ...).
+
+    Retorna:
+    numpy.ndarray
+        Arreglo (m,) con los valores de f en cada punto.
+    """
+    puntos = np.asarray(puntos, dtype=float)
+    if vectorizada is None:
+        try:
+            modos = _SOPORTA_LOTE.setdefault(f, {})
+        except TypeError:
+            modos = {}
+        vectorizada = modos.get(desempaquetar)
+        if vectorizada is None:
+            vectorizada, valores = _acepta_lote(f, puntos, desempaquetar)
+            modos[desempaquetar] = vectorizada
+            return valores
+    if vectorizada:
+        return np.asarray(_llamar(f, puntos, desempaquetar), dtype=float)
+    return np.array([_llamar(f, p, desempaquetar) for p in puntos], dtype=float)
+
+def gradiente_lote(f, x, h=0.00001, vectorizada=None, desempaquetar=False):
+    """
+    Calcula el gradiente de f en x por diferencias centrales. Construye la matriz (2N, N)
+    con los puntos x + h*e_i y x - h*e_i y la evalúa con evaluar_puntos, en una sola
+    llamada si f acepta lotes. Con N grande la matriz se arma por bloques de coordenadas
+    para no superar _MAX_ELEMENTOS_LOTE elementos por lote. Si f tiene un gradiente
+    analítico registrado se usa ese en su lugar.
+
+    Parámetros:
+    f : función
+        Función escalar de la cual se calculará el gradiente.
+    x : array_like
+        Punto en el cual se evaluará el gradiente.
+    h : float
+        Tamaño del paso para la diferencia central. Por defecto 0.00001.
+    vectorizada : bool o None
+        Modo de evaluación, ver evaluar_puntos. Por defecto None (autodetección).
+    desempaquetar : bool
+        Si es True f recibe las coordenadas como argumentos separados.
+
+    Retorna:
+    numpy.ndarray
+        Gradiente de f evaluado en x.
+    """
+    x = np.asarray(x, dtype=float)
+    registradas = derivadas_registradas(f)
+    if registradas is not None:
+        return np.asarray(_llamar(registradas[0], x, desempaquetar), dtype=float)
+    n = x.size
+    coordenadas_por_lote = max(1, _MAX_ELEMENTOS_LOTE // (2 * n))
+    gradiente = np.empty(n)
+    for inicio in range(0, n, coordenadas_por_lote):
+        i = np.arange(inicio, min(inicio + coordenadas_por_lote, n))
+        puntos = np.repeat(x[None, :], 2 * len(i), axis=0)
+        puntos[np.arange(len(i)), i] += h
+        puntos[np.arange(len(i), 2 * len(i)), i] -= h
+        valores = evaluar_puntos(f, puntos, vectorizada, desempaquetar)
+        gradiente[i] = (valores[:len(i)] - valores[len(i):]) / (2 * h)
+    return gradiente
+
+def derivadas_lote(f, x, h=0.00001, vectorizada=None, desempaquetar=False):
+    """
+    Calcula f(x), el gradiente y la matriz Hessiana de f en x por diferencias centrales
+    compartiendo evaluaciones: f(x) se evalúa una vez, los puntos x +/- h*e_i sirven para
+    el gradiente y para la diagonal, y de los términos cruzados sólo se calcula el
+    triángulo superior. En total son 2N^2 + 1 evaluaciones, que se envían en lotes a
+    evaluar_puntos (uno solo mientras el lote no supere _MAX_ELEMENTOS_LOTE elementos).
+    Si f tiene gradiente y Hessiana analíticos registrados basta con evaluar f(x).
+
+    Parámetros:
+    f : función
+        Función escalar a derivar.
+    x : array_like
+        Punto en el cual se evalúan las derivadas.
+    h : float
+        Tamaño del paso para la diferencia central. Por defecto 0.00001.
+    vectorizada : bool o None
+        Modo de evaluación, ver evaluar_puntos. Por defecto None (autodetección).
+    desempaquetar : bool
+        Si es True f recibe las coordenadas como argumentos separados.
+
+    Retorna:
+    tuple
+        (f(x), gradiente, matriz Hessiana).
+    """
+    x = np.asarray(x, dtype=float)
+    registradas = derivadas_registradas(f)
+    if registradas is not None and registradas[1] is not None:
+        return (float(_llamar(f, x, desempaquetar)),
+                np.asarray(_llamar(registradas[0], x, desempaquetar), dtype=float),
+                np.asarray(_llamar(registradas[1], x, desempaquetar), dtype=float))
+    n = x.size
+    paso = h * np.eye(n)
+    fila_i, fila_j = np.triu_indices(n, 1)
+    signo_i = np.array([1.0, 1.0, -1.0, -1.0])
+    signo_j = np.array([1.0, -1.0, 1.0, -1.0])
+    pares_por_lote = max(1, _MAX_ELEMENTOS_LOTE // (4 * n))
+
+    valores_cruzados = []
+    base = np.concatenate((x[None, :], x + paso, x - paso))
+    for inicio in range(0, max(len(fila_i), 1), pares_por_lote):
+        i = fila_i[inicio:inicio + pares_por_lote]
+        j = fila_j[inicio:inicio + pares_por_lote]
+        esquinas = np.repeat(x[None, :], 4 * len(i), axis=0)
+        filas = np.arange(4 * len(i))
+        esquinas[filas, np.tile(i, 4)] += h * np.repeat(signo_i, len(i))
+        esquinas[filas, np.tile(j, 4)] += h * np.repeat(signo_j, len(i))
+        if base is not None:
+            valores = evaluar_puntos(f, np.concatenate((base, esquinas)), vectorizada, desempaquetar)
+            fx, adelante, atras = valores[0], valores[1:n + 1], valores[n + 1:2 * n + 1]
+            valores = valores[2 * n + 1:]
+            base = None
+        else:
+            valores = evaluar_puntos(f, esquinas, vectorizada, desempaquetar)
+        valores_cruzados.append(valores.reshape(4, len(i)))
+
+    cruzados = np.concatenate(valores_cruzados, axis=1)
+    hessiana = np.zeros((n, n))
+    hessiana[fila_i, fila_j] = (cruzados[0] - cruzados[1] - cruzados[2] + cruzados[3]) / (4 * h ** 2)
+    hessiana += hessiana.T
+    hessiana[np.diag_indices(n)] = (adelante - 2 * fx + atras) / h ** 2
+    return fx, (adelante - atras) / (2 * h), hessiana
+
+def hessiana_lote(f, x, h=0.00001, vectorizada=None, desempaquetar=False):
+    """
+    Calcula la matriz Hessiana de f en x por diferencias centrales, ver derivadas_lote.
+
+    Parámetros:
+    f : función
+        Función escalar a derivar.
+    x : array_like
+        Punto en el cual se evalúa la matriz Hessiana.
+    h : float
+        Tamaño del paso para la diferencia central. Por defecto 0.00001.
+    vectorizada : bool o None
+        Modo de evaluación, ver evaluar_puntos. Por defecto None (autodetección).
+    desempaquetar : bool
+        Si es True f recibe las coordenadas como argumentos separados.
+
+    Retorna:
+    numpy.ndarray
+        Matriz Hessiana simétrica de f evaluada en x.
+    """
+    return derivadas_lote(f, x, h, vectorizada, desempaquetar)[2]
+
+def primera_derivada(f, x, h, vectorizada=None):
     """
     Calcula el gradiente de una función escalar f en un punto x utilizando
     la diferencia central para la primera derivada.
 
     Parámetros:
     f : función
-        Función escalar de la cual se calculará el gradiente.
+        Función escalar de la cual se calculará el gradiente, f(x1, x2, ...).
     x : array_like
         Punto en el cual se evaluará el gradiente.
     h : float
         Tamaño del paso para la diferencia central.
+    vectorizada : bool o None
+        Modo de evaluación, ver evaluar_puntos. Por defecto None (autodetección).
 
     Retorna:
     array_like
         Gradiente de f evaluado en x.
     """
-    n = len(x)
-    grad = np.zeros(n)
-    for i in range(n):
-        x_forward = np.copy(x)
-        x_backward = np.copy(x)
-        x_forward[i] += h
-        x_backward[i] -= h
-        grad[i] = (f(*x_forward) - f(*x_backward)) / (2 * h)
-    return grad
+    return gradiente_lote(f, x, h, vectorizada, desempaquetar=True)
 
-def segunda_derivada(f, x, h):
+def segunda_derivada(f, x, h, vectorizada=None):
     """
     Calcula la matriz Hessiana de una función escalar f en un punto x utilizando
     la diferencia central para la segunda derivada.
@@ -55,47 +287,30 @@ def segunda_derivada(f, x, h):
         Punto en el cual se evaluará la matriz Hessiana.
     h : float
         Tamaño del paso para la diferencia central.
+    vectorizada : bool o None
+        Modo de evaluación, ver evaluar_puntos. Por defecto None (autodetección).
 
     Retorna:
     array_like
         Matriz Hessiana de f evaluada en x.
     """
-    n = len(x)
-    hessian = np.zeros((n, n))
-    for i in range(n):
-        for j in range(n):
-            if i == j:
-                x_forward = np.copy(x)
-                x_backward = np.copy(x)
-                x_forward[i] += h
-                x_backward[i] -= h
-                hessian[i, j] = (f(*x_forward) - 2 * f(*x) + f(*x_backward)) / (h**2)
-            else:
-                x_ij1 = np.copy(x)
-                x_ij2 = np.copy(x)
-                x_ij3 = np.copy(x)
-                x_ij4 = np.copy(x)
-                x_ij1[i] += h
-                x_ij1[j] += h
-                x_ij2[i] += h
-                x_ij2[j] -= h
-                x_ij3[i] -= h
-                x_ij3[j] += h
-                x_ij4[i] -= h
-                x_ij4[j] -= h
-                hessian[i, j] = (f(*x_ij1) - f(*x_ij2) - f(*x_ij3) + f(*x_ij4)) / (4 * h**2)
-    return hessian
-
-# Ejemplo de uso
-x_t = np.array([1.0, 1.0])
-DeltaX = 0.01
-
-# Cálculo del gradiente y la matriz Hessiana
-gradiente = primera_derivada(f, x_t, DeltaX)
-hessiana = segunda_derivada(f, x_t, DeltaX)
-
-np.set_printoptions(precision=16)
-
-print("Gradiente en x_t:", gradiente)
-print("Hessiana en x_t:")
-print(hessiana)
\ No newline at end of file
+    return hessiana_lote(f, x, h, vectorizada, desempaquetar=True)
+
+def main():
+    """Ejecuta el ejemplo de uso del módulo."""
+    # Ejemplo de uso
+    x_t = np.array([1.0, 1.0])
+    DeltaX = 0.01
+
+    # Cálculo del gradiente y la matriz Hessiana
+    gradiente = primera_derivada(f, x_t, DeltaX)
+    hessiana = segunda_derivada(f, x_t, DeltaX)
+
+    np.set_printoptions(precision=16)
+
+    print("Gradiente en x_t:", gradiente)
+    print("Hessiana en x_t:")
+    print(hessiana)
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,13 @@
 import numpy as np
-import math
-
-def gradiente(f, x, deltaX=0.00001):
+try:
+    from .busqueda_linea import regla_eliminacion, w_to_x, busquedaDorada, longitud_paso
+    from .diferenciacentralgradiente import gradiente_lote
+except ImportError:
+    # Ejecutado como script: la carpeta del módulo está en sys.path
+    from busqueda_linea import regla_eliminacion, w_to_x, busquedaDorada, longitud_paso
+    from diferenciacentralgradiente import gradiente_lote
+
+def gradiente(f, x, deltaX=0.00001, vectorizada=None):
     """
     Calcula el gradiente de una función escalar f en un punto x dado.
 
@@ -9,82 +15,41 @@ def gradiente(f, x, deltaX=0.00001):
     - f: función escalar a la que se le calculará el gradiente.
     - x: punto en el que se evalúa el gradiente.
     - deltaX: tamaño del paso para calcular las diferencias finitas.
+    - vectorizada: si f evalúa una matriz de puntos en una sola llamada. Por defecto None
+      (se detecta automáticamente).
 
     Retorna:
     - numpy.array: vector gradiente de la función f en el punto x.
     """
-    grad = []
-    for i in range(0, len(x)):
-        xp = x.copy()
-        xn = x.copy()
-        xp[i] = xp[i] + deltaX
-        xn[i] = xn[i] - deltaX
-        grad.append((f(xp) - f(xn)) / (2 * deltaX))
-    return np.array(grad)
-
-def regla_eliminacion(x1, x2, fx1, fx2, a, b):
-    """
-    Regla de eliminación para comparar dos valores y actualizar un intervalo.
-
-    Parámetros:
-    - x1, x2: valores a comparar.
-    - fx1, fx2: valores de la función evaluados en x1 y x2, respectivamente.
-    - a, b: límites del intervalo actual.
-
-    Retorna:
-    - tuple[float, float]: nuevos límites del intervalo actualizado.
-    """
-    if fx1 > fx2:
-        return x1, b
-
-    if fx1 < fx2:
-        return a, x2
-    
-    return x1, x2
-
-def w_to_x(w: float, a, b) -> float:
-    """
-    Convierte un valor w en el intervalo [0, 1] a un valor en el intervalo [a, b].
+    return gradiente_lote(f, x, deltaX, vectorizada)
 
-    Parámetros:
-    - w: valor a convertir.
-    - a, b: límites del nuevo intervalo.
-
-    Retorna:
-    - float: valor convertido en el nuevo intervalo.
-    """
-    return w * (b - a) + a
-
-def busquedaDorada(funcion, epsilon: float, a: float = None, b: float = None) -> float:
+def beta_conjugado(grad_k1, grad, s, beta="FR"):
     """
-    Realiza una búsqueda con método de la búsqueda dorada para encontrar el mínimo de una función en un intervalo dado.
+    Calcula el coeficiente beta que combina el nuevo gradiente con la dirección anterior.
 
     Parámetros:
-    - funcion: función escalar a minimizar.
-    - epsilon: precisión deseada para la solución.
-    - a, b: límites del intervalo inicial (opcional, por defecto [0, 1]).
+    - grad_k1: gradiente en el nuevo punto.
+    - grad: gradiente en el punto anterior.
+    - s: dirección de búsqueda anterior.
+    - beta: fórmula a usar: "FR" (Fletcher-Reeves), "PR+" (Polak-Ribière truncada en
+      cero) o "HS" (Hestenes-Stiefel). Por defecto "FR".
 
     Retorna:
-    - float: valor aproximado del mínimo de la función en el intervalo [a, b].
+    - float: valor de beta.
     """
-    PHI = (1 + math.sqrt(5)) / 2 - 1
-    aw, bw = 0, 1
-    Lw = 1
-    k = 1
-
-    while Lw > epsilon:
-        w2 = aw + PHI * Lw
-        w1 = bw - PHI * Lw
-        aw, bw = regla_eliminacion(w1, w2, funcion(w_to_x(w1, a, b)),
-                                   funcion(w_to_x(w2, a, b)), aw, bw)
-        k += 1
-        Lw = bw - aw
-
-    return (w_to_x(aw, a, b) + w_to_x(bw, a, b)) / 2
-
-def gradiente_conjugado(funcion, x0, epsilon1, epsilon2, M):
+    if beta == "FR":
+        return np.linalg.norm(grad_k1) ** 2 / np.linalg.norm(grad) ** 2
+    y = grad_k1 - grad
+    if beta == "PR+":
+        return max(0.0, np.dot(grad_k1, y) / np.dot(grad, grad))
+    denominador = np.dot(s, y)
+    return np.dot(grad_k1, y) / denominador if denominador != 0 else 0.0
+
+def gradiente_conjugado(funcion, x0, epsilon1, epsilon2, M, intervalo=(0.0, 1.0), line_search="golden",
+                        beta="FR", reiniciar=True):
     """
-    Implementa el método de gradiente conjugado para minimizar una función escalar.
+    Implementa el método de gradiente conjugado para minimizar una función escalar. Cada
+    gradiente se calcula una sola vez y se reutiliza en la iteración siguiente.
 
     Parámetros:
     - funcion: función escalar a minimizar.
@@ -92,39 +57,67 @@ def gradiente_conjugado(funcion, x0, epsilon1, epsilon2, M):
     - epsilon1: precisión para la norma del gradiente.
     - epsilon2: precisión para la diferencia entre iteraciones.
     - M: máximo número de iteraciones permitidas.
+    - intervalo: intervalo (a, b) en el que se busca el tamaño de paso. Por defecto (0, 1).
+    - line_search: búsqueda de línea: "golden" (búsqueda dorada), "armijo" o "wolfe". Por defecto "golden".
+    - beta: fórmula del coeficiente beta: "FR" (Fletcher-Reeves), "PR+" (Polak-Ribière+)
+      o "HS" (Hestenes-Stiefel). Por defecto "FR".
+    - reiniciar: si es True la dirección se reinicia con el gradiente negativo cada N
+      iteraciones, cuando los gradientes consecutivos dejan de ser casi ortogonales
+      (|g_k+1 . g_k| >= 0.2 ||g_k+1||^2) o cuando la dirección no es de descenso.
+      Por defecto True.
 
     Retorna:
     - numpy.array: punto aproximado donde se minimiza la función.
     """
+    if beta not in ("FR", "PR+", "HS"):
+        raise ValueError('beta debe ser "FR", "PR+" o "HS"')
     terminar = False
     xk = x0
     k = 0
-    s = -1 * (gradiente(funcion, xk))
+    grad = gradiente(funcion, xk)
+    fx = None
+    s = -1 * grad
+    n = np.size(xk)
+    # Iteraciones desde el último reinicio de la dirección
+    ciclo = 0
 
     while not terminar:
 
         if np.linalg.norm(s) < epsilon1 or k >= M:
             terminar = True
         else:
-
-            def alpha_funcion(alpha):
-                return funcion(xk + alpha * s)
-
-            alpha = busquedaDorada(alpha_funcion, epsilon=epsilon2, a=0.0, b=1.0)
+            alpha, fx_k1, grad_k1 = longitud_paso(funcion, gradiente, xk, s, grad, fx,
+                                                  line_search, epsilon2, intervalo, c2=0.1)
             x_k1 = xk + alpha * s
+            if grad_k1 is None:
+                grad_k1 = gradiente(funcion, x_k1)
 
-            s = -1 * (gradiente(funcion, x_k1)) + (np.linalg.norm(gradiente(funcion, x_k1)) ** 2 /
-                                                   np.linalg.norm(gradiente(funcion, xk)) ** 2) * s
+            ciclo += 1
+            if reiniciar and (ciclo >= n or abs(np.dot(grad_k1, grad)) >= 0.2 * np.dot(grad_k1, grad_k1)):
+                s = -1 * grad_k1
+                ciclo = 0
+            else:
+                s = -1 * grad_k1 + beta_conjugado(grad_k1, grad, s, beta) * s
+                if reiniciar and np.dot(grad_k1, s) >= 0:
+                    s = -1 * grad_k1
+                    ciclo = 0
 
             if np.linalg.norm(x_k1 - xk) / (np.linalg.norm(xk) + 0.00001) <= epsilon2:
                 terminar = True
             else:
                 k = k + 1
                 xk = x_k1
+                fx = fx_k1
+                grad = grad_k1
 
     return xk
 
-# Ejemplo de uso con la función de Himmenblau
-himmenblau = lambda x: (((x[0] ** 2) + x[1] - 11) ** 2) + ((x[0] + (x[1] ** 2) - 7) ** 2)
-print(gradiente_conjugado(himmenblau, np.array([1.0, 1.0]), 0.001, 0.001, 100))
-# Debería imprimir un resultado cercano a [3, 2]
+def main():
+    """Ejecuta el ejemplo de uso del módulo."""
+    # Ejemplo de uso con la función de Himmenblau
+    himmenblau = lambda x: (((x[0] ** 2) + x[1] - 11) ** 2) + ((x[0] + (x[1] ** 2) - 7) ** 2)
+    print(gradiente_conjugado(himmenblau, np.array([1.0, 1.0]), 0.001, 0.001, 100))
+    # Debería imprimir un resultado cercano a [3, 2]
+
+if __name__ == '__main__':
+    main()
@@ -1,130 +1,93 @@
 import numpy as np
-import math
+try:
+    from .busqueda_linea import regla_eliminacion, w_to_x, busquedaDorada, longitud_paso
+    from .diferenciacentralgradiente import gradiente_lote, hessiana_lote, derivadas_lote
+except ImportError:
+    # Ejecutado como script: la carpeta del módulo está en sys.path
+    from busqueda_linea import regla_eliminacion, w_to_x, busquedaDorada, longitud_paso
+    from diferenciacentralgradiente import gradiente_lote, hessiana_lote, derivadas_lote
 
 # Definición de la función objetivo
 f = lambda x: (((x[0]**2)+x[1]-11)**2) + ((x[0]+(x[1]**2)-7)**2)
 
-def regla_eliminacion(x1, x2, fx1, fx2, a, b) -> tuple[float, float]:
+def gradiente(f, x, deltaX=0.00001, vectorizada=None):
     """
-    Aplica la regla de eliminación para actualizar los límites de búsqueda.
-
-    Args:
-    - x1, x2: Puntos de prueba en el espacio de búsqueda.
-    - fx1, fx2: Valores de la función objetivo en x1 y x2 respectivamente.
-    - a, b: Límites de búsqueda actuales.
-
-    Returns:
-    - Tupla con los nuevos límites actualizados según la regla de eliminación.
-    """
-    if fx1 > fx2:
-        return x1, b
-    elif fx1 < fx2:
-        return a, x2
-    else:
-        return x1, x2
-
-def w_to_x(w: float, a, b) -> float:
-    """
-    Transforma el parámetro w (en el rango [0, 1]) a un valor en el rango [a, b].
+    Calcula el gradiente de una función en un punto dado utilizando diferencias finitas.
 
     Args:
-    - w: Parámetro en el rango [0, 1].
-    - a, b: Límites del rango deseado.
+    - f: Función objetivo.
+    - x: Punto en el cual se evalúa el gradiente.
+    - deltaX: Tamaño del paso para calcular las diferencias finitas.
+    - vectorizada: Si f evalúa una matriz de puntos en una sola llamada. Por defecto None
+      (se detecta automáticamente).
 
     Returns:
-    - Valor transformado en el rango [a, b].
+    - Arreglo con los componentes del gradiente en el punto x.
     """
-    return w * (b - a) + a
+    return gradiente_lote(f, x, deltaX, vectorizada)
 
-def busquedaDorada(funcion, epsilon: float, a: float = None, b: float = None) -> float:
+def hessian_matrix(f, x, deltaX=0.00001, vectorizada=None):
     """
-    Realiza la búsqueda del mínimo de una función utilizando el método de la búsqueda dorada.
+    Calcula la matriz Hessiana de una función en un punto dado utilizando diferencias finitas.
 
     Args:
-    - funcion: Función objetivo a minimizar.
-    - epsilon: Precisión deseada para la convergencia.
-    - a, b: Límites iniciales de búsqueda (por defecto, 0 y 1 respectivamente).
+    - f: Función objetivo.
+    - x: Punto en el cual se evalúa la matriz Hessiana.
+    - deltaX: Tamaño del paso para calcular las diferencias finitas.
+    - vectorizada: Si f evalúa una matriz de puntos en una sola llamada. Por defecto None
+      (se detecta automáticamente).
 
     Returns:
-    - Valor aproximado del mínimo de la función dentro del rango [a, b].
+    - Matriz Hessiana (simétrica) evaluada en el punto x.
     """
-    PHI = (1 + math.sqrt(5)) / 2 - 1
-    aw, bw = 0, 1
-    Lw = 1
-    k = 1
-
-    while Lw > epsilon:
-        w2 = aw + PHI * Lw
-        w1 = bw - PHI * Lw
-        aw, bw = regla_eliminacion(w1, w2, funcion(w_to_x(w1, a, b)), funcion(w_to_x(w2, a, b)), aw, bw)
-        k += 1
-        Lw = bw - aw
+    return hessiana_lote(f, x, deltaX, vectorizada)
 
-    return (w_to_x(aw, a, b) + w_to_x(bw, a, b)) / 2
-
-def gradiente(f, x, deltaX=0.00001):
+def cholesky_modificado(hessiana, beta=1e-3):
     """
-    Calcula el gradiente de una función en un punto dado utilizando diferencias finitas.
+    Calcula la factorización de Cholesky L de H + tau*I con el menor tau >= 0 (entre los
+    probados) que hace a la matriz definida positiva. Si la Hessiana ya es definida
+    positiva tau es 0 y se obtiene la factorización de Cholesky ordinaria.
 
     Args:
-    - f: Función objetivo.
-    - x: Punto en el cual se evalúa el gradiente.
-    - deltaX: Tamaño del paso para calcular las diferencias finitas.
+    - hessiana: Matriz Hessiana simétrica.
+    - beta: Desplazamiento inicial cuando la Hessiana no es definida positiva.
 
     Returns:
-    - Lista con los componentes del gradiente en el punto x.
+    - Tupla (L, tau) con L triangular inferior tal que L L^T = H + tau*I.
     """
-    grad = []
-    for i in range(0, len(x)):
-        xp = x.copy()
-        xn = x.copy()
-        xp[i] = xp[i] + deltaX
-        xn[i] = xn[i] - deltaX
-        grad.append((f(xp) - f(xn)) / (2 * deltaX))
-    return grad
-
-def hessian_matrix(f, x, deltaX=0.00001):
+    hessiana = np.asarray(hessiana, dtype=float)
+    identidad = np.eye(len(hessiana))
+    diagonal_minima = np.min(np.diag(hessiana))
+    tau = 0.0 if diagonal_minima > 0 else beta - diagonal_minima
+    while True:
+        try:
+            return np.linalg.cholesky(hessiana + tau * identidad), tau
+        except np.linalg.LinAlgError:
+            tau = max(2 * tau, beta)
+
+def direccion_newton(L, grad):
     """
-    Calcula la matriz Hessiana de una función en un punto dado utilizando diferencias finitas.
+    Resuelve L L^T d = -grad por sustitución hacia adelante y hacia atrás, en O(N^2)
+    operaciones por cada gradiente una vez factorizada la Hessiana.
 
     Args:
-    - f: Función objetivo.
-    - x: Punto en el cual se evalúa la matriz Hessiana.
-    - deltaX: Tamaño del paso para calcular las diferencias finitas.
+    - L: Factor de Cholesky triangular inferior de la Hessiana (modificada).
+    - grad: Gradiente en el punto actual.
 
     Returns:
-    - Matriz Hessiana evaluada en el punto x.
+    - Dirección de Newton d.
     """
-    fx = f(x)
-    N = len(x)
-    H = []
-    for i in range(N):
-        hi = []
-        for j in range(N):
-            if i == j:
-                xp = x.copy()
-                xn = x.copy()
-                xp[i] = xp[i] + deltaX
-                xn[i] = xn[i] - deltaX
-                hi.append((f(xp) - 2 * fx + f(xn)) / (deltaX ** 2))
-            else:
-                xpp = x.copy()
-                xpn = x.copy()
-                xnp = x.copy()
-                xnn = x.copy()
-                xpp[i] = xpp[i] + deltaX
-                xpp[j] = xpp[j] + deltaX
-                xpn[i] = xpn[i] + deltaX
-                xpn[j] = xpn[j] - deltaX
-                xnp[i] = xnp[i] - deltaX
-                xnp[j] = xnp[j] + deltaX
-                xnn[i] = xnn[i] - deltaX
-                xnn[j] = xnn[j] - deltaX
-                hi.append((f(xpp) - f(xpn) - f(xnp) + f(xnn)) / (4 * deltaX ** 2))
-        H.append(hi)
-    return H
-
-def newton(funcion, x0, epsilon1, epsilon2, M):
+    n = len(grad)
+    y = np.empty(n)
+    for i in range(n):
+        y[i] = (-grad[i] - np.dot(L[i, :i], y[:i])) / L[i, i]
+    d = np.empty(n)
+    for i in range(n - 1, -1, -1):
+        d[i] = (y[i] - np.dot(L[i + 1:, i], d[i + 1:])) / L[i, i]
+    return d
+
+def newton(funcion, x0, epsilon1, epsilon2, M, intervalo=(0.0, 1.0), line_search="golden",
+           reutilizar_hessiana=1):
     """
     Implementa el método de Newton para encontrar el mínimo de una función.
 
@@ -134,6 +97,11 @@ def newton(funcion, x0, epsilon1, epsilon2, M):
     - epsilon1: Precisión para la norma del gradiente.
     - epsilon2: Precisión para la convergencia del método.
     - M: Máximo número de iteraciones permitidas.
+    - intervalo: Intervalo (a, b) en el que se busca el tamaño de paso. Por defecto (0, 1).
+    - line_search: Búsqueda de línea: "golden" (búsqueda dorada), "armijo" o "wolfe". Por defecto "golden".
+    - reutilizar_hessiana: Número de iteraciones que se reutiliza una misma factorización
+      de la Hessiana (variante de Shamanskii). En las iteraciones intermedias sólo se
+      calcula el gradiente. Por defecto 1 (Newton clásico).
 
     Returns:
     - Punto aproximado donde se alcanza el mínimo local de la función.
@@ -141,32 +109,46 @@ def newton(funcion, x0, epsilon1, epsilon2, M):
     terminar = False
     xk = x0
     k = 0
+    if reutilizar_hessiana < 1:
+        raise ValueError("reutilizar_hessiana debe ser un entero mayor o igual a 1")
+    # f, gradiente y Hessiana salen de las mismas evaluaciones en cada iteración
+    fx, grad, hessiana = derivadas_lote(funcion, xk)
+    L = None
 
     while not terminar:
-        grad = np.array(gradiente(funcion, xk))
-        hessiana = hessian_matrix(funcion, xk)
-        
         if np.linalg.norm(grad) < epsilon1 or k >= M:
             terminar = True
         else:
-            def alpha_funcion(alpha):
-                return funcion(xk - alpha * np.dot(np.linalg.inv(hessiana), grad))
-            
-            alpha = busquedaDorada(alpha_funcion, epsilon=epsilon2, a=0.0, b=1.0)
-            x_k1 = xk - alpha * np.dot(np.linalg.inv(hessiana), grad)
+            if hessiana is not None:
+                # Se factoriza una vez y la misma L sirve hasta la próxima Hessiana
+                L, _ = cholesky_modificado(hessiana)
+                hessiana = None
+            direccion = direccion_newton(L, grad)
+            alpha, _, _ = longitud_paso(funcion, gradiente, xk, direccion, grad, fx,
+                                        line_search, epsilon2, intervalo)
+            x_k1 = xk + alpha * direccion
             
             if np.linalg.norm(x_k1 - xk) / (np.linalg.norm(xk) + 0.00001) <= epsilon2:
                 terminar = True
             else:
                 k += 1
                 xk = x_k1
+                if k % reutilizar_hessiana == 0:
+                    fx, grad, hessiana = derivadas_lote(funcion, xk)
+                else:
+                    fx, grad = None, gradiente(funcion, xk)
 
     return xk
 
-# Ejemplo de uso
-x = np.array([1.0, 1.0])
-print("Gradiente:", gradiente(f, x, 0.01))
-print("Matriz Hessiana:", hessian_matrix(f, x, 0.01))
+def main():
+    """Ejecuta el ejemplo de uso del módulo."""
+    # Ejemplo de uso
+    x = np.array([1.0, 1.0])
+    print("Gradiente:", gradiente(f, x, 0.01))
+    print("Matriz Hessiana:", hessian_matrix(f, x, 0.01))
+
+    himmenblau = lambda x: (((x[0]**2)+x[1]-11)**2) + ((x[0]+(x[1]**2)-7)**2)
+    print("Mínimo local encontrado:", newton(himmenblau, np.array([2.0, 2.0]), 0.001, 0.001, 100))
 
-himmenblau = lambda x: (((x[0]**2)+x[1]-11)**2) + ((x[0]+(x[1]**2)-7)**2)
-print("Mínimo local encontrado:", newton(himmenblau, np.array([2.0, 2.0]), 0.001, 0.001, 100))
\ No newline at end of file
+if __name__ == '__main__':
+    main()
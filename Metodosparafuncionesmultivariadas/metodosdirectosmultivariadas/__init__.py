@@ -1,4 +1,4 @@
 #Metodos directos multivariados
 from .randomwalk import random_walk, sphere_function, himmelblau_function, rastrigin_function, rosenbrock_function
-from .neldermead import nelder_mead, sphere_function, himmelblau_function, rastrigin_function, rosenbrock_function
+from .neldermead import coeficientes_adaptativos, simplex_inicial, simplex_degenerado, nelder_mead, nelder_mead_lote, sphere_function, himmelblau_function, rastrigin_function, rosenbrock_function
 from .hookejeeves import hooke_jeeves, sphere_function, himmelblau_function, rastrigin_function, rosenbrock_function 
@@ -1,11 +1,23 @@
+import os
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
-from PIL import Image
+try:
+    from Metodosparafuncionesmultivariadas.Metodosdirectos.funciones_objetivo import sphere, himmelblau, rastrigin, rosenbrock
+except ModuleNotFoundError:
+    # Ejecutado como script: se agrega la raíz del repositorio a sys.path
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+    from Metodosparafuncionesmultivariadas.Metodosdirectos.funciones_objetivo import sphere, himmelblau, rastrigin, rosenbrock
 
 def hooke_jeeves(f, x0, delta, alpha=2, epsilon=1e-6, max_iter=1000):
     """
     Implementación del método de Hooke-Jeeves para la optimización de funciones sin restricciones.
 
+    Los movimientos reciben el valor de f en su punto base en lugar de recalcularlo, y los
+    valores de los puntos de la malla x0 + delta * Z^n ya probados se guardan en una caché,
+    así que los movimientos de patrón que regresan a puntos conocidos no evalúan f. La
+    caché se vacía cada vez que delta se reduce, de modo que no crece durante toda la
+    búsqueda.
+
     Parameters:
     ----------
     f : callable
@@ -31,7 +43,31 @@ def hooke_jeeves(f, x0, delta, alpha=2, epsilon=1e-6, max_iter=1000):
         Lista que contiene los puntos visitados durante la optimización.
     """
     
-    def exploratory_move(x, delta):
+    def evaluar(x):
+        """
+        Evalúa f en x usando la caché de puntos de la malla x0 + delta * Z^n. Los puntos
+        que no caen en la malla (alpha no entero) se evalúan sin guardarse.
+
+        Parameters:
+        ----------
+        x : np.array
+            Punto a evaluar.
+
+        Returns:
+        -------
+        f_x : float
+            Valor de f en x.
+        """
+        coordenadas = (x - origen) / delta
+        enteras = np.rint(coordenadas)
+        if np.any(np.abs(coordenadas - enteras) > 1e-6):
+            return f(x)
+        clave = tuple(enteras.astype(np.int64))
+        if clave not in cache:
+            cache[clave] = f(x)
+        return cache[clave]
+
+    def exploratory_move(x, f_x, delta):
         """
         Realiza un movimiento exploratorio para encontrar un mejor punto cercano a x.
 
@@ -39,6 +75,8 @@ def hooke_jeeves(f, x0, delta, alpha=2, epsilon=1e-6, max_iter=1000):
         ----------
         x : np.array
             Punto actual desde el cual se realizará el movimiento exploratorio.
+        f_x : float
+            Valor de f en x, ya conocido por quien llama.
         delta : float
             Tamaño del paso para el movimiento exploratorio.
 
@@ -46,194 +84,143 @@ def hooke_jeeves(f, x0, delta, alpha=2, epsilon=1e-6, max_iter=1000):
         -------
         x_new : np.array
             Nuevo punto encontrado después del movimiento exploratorio.
+        f_new : float
+            Valor de f en x_new.
         """
         x_new = np.copy(x)
-        f_current = f(x_new)
+        f_current = f_x
         for i in range(len(x)):
-            x_new[i] += delta
-            f_plus = f(x_new)
+            base = x_new[i]
+            x_new[i] = base + delta
+            f_plus = evaluar(x_new)
             if f_plus < f_current:
                 f_current = f_plus
             else:
-                x_new[i] -= 2 * delta
-                f_minus = f(x_new)
+                x_new[i] = base - delta
+                f_minus = evaluar(x_new)
                 if f_minus < f_current:
                     f_current = f_minus
                 else:
-                    x_new[i] += delta
-        return x_new
+                    x_new[i] = base
+        return x_new, f_current
     
-    x_base = np.array(x0)
+    x_base = np.array(x0, dtype=float)
+    origen = np.copy(x_base)
+    # Valores de f en los puntos ya visitados, indexados por sus coordenadas en la malla
+    cache = {}
     x_best = np.copy(x_base)
-    f_best = f(x_best)
+    f_best = evaluar(x_best)
     history = [np.copy(x_best)]
     
     for _ in range(max_iter):
-        x_new = exploratory_move(np.copy(x_base), delta)
-        f_new = f(x_new)
+        x_new, f_new = exploratory_move(x_base, f_best, delta)
         
         if f_new < f_best:
             while f_new < f_best:
                 x_base = np.copy(x_new)
                 f_best = f_new
                 x_new = x_base + alpha * (x_base - x_best)
-                x_new = exploratory_move(np.copy(x_new), delta)
-                f_new = f(x_new)
+                x_new, f_new = exploratory_move(x_new, evaluar(x_new), delta)
                 history.append(np.copy(x_base))
             x_best = np.copy(x_base)
         else:
             delta *= 0.5
             if delta < epsilon:
                 break
+            # La caché sólo guarda la malla del paso actual; el valor del punto base se conserva
+            cache.clear()
         history.append(np.copy(x_base))
     
     return x_best, f_best, history
 
-# Funciones de prueba
-
-def sphere_function(x):
-    """
-    Función esférica: f(x) = sum(x**2)
-
-    Parameters:
-    ----------
-    x : np.array
-        Vector de variables de entrada.
-
-    Returns:
-    -------
-    float
-        Valor de la función esférica evaluada en x.
-    """
-    x = np.array(x)
-    return np.sum(x**2)
-
-def himmelblau_function(x):
-    """
-    Función de Himmelblau: f(x) = (x[0]**2 + x[1] - 11)**2 + (x[0] + x[1]**2 - 7)**2
-
-    Parameters:
-    ----------
-    x : np.array
-        Vector de variables de entrada.
-
-    Returns:
-    -------
-    float
-        Valor de la función de Himmelblau evaluada en x.
-    """
-    x = np.array(x)
-    return (x[0]**2 + x[1] - 11)**2 + (x[0] + x[1]**2 - 7)**2
-
-def rastrigin_function(x):
-    """
-    Función de Rastrigin: f(x) = A * len(x) + sum(x**2 - A * cos(2 * pi * x))
-
-    Parameters:
-    ----------
-    x : np.array
-        Vector de variables de entrada.
-
-    Returns:
-    -------
-    float
-        Valor de la función de Rastrigin evaluada en x.
-    """
-    x = np.array(x)
-    A = 10
-    return A * len(x) + np.sum(x**2 - A * np.cos(2 * np.pi * x))
-
-def rosenbrock_function(x):
-    """
-    Función de Rosenbrock: f(x) = sum(100 * (x[1:] - x[:-1]**2)**2 + (x[:-1] - 1)**2)
-
-    Parameters:
-    ----------
-    x : np.array
-        Vector de variables de entrada.
-
-    Returns:
-    -------
-    float
-        Valor de la función de Rosenbrock evaluada en x.
-    """
-    x = np.array(x)
-    return np.sum(100 * (x[1:] - x[:-1]**2)**2 + (x[:-1] - 1)**2)
-
-# Parámetros iniciales
-functions = [sphere_function, himmelblau_function, rastrigin_function, rosenbrock_function]
-initial_points = [
-    [5.0, 5.0],   # Punto inicial para sphere_function
-    [0.0, 0.0],   # Punto inicial para himmelblau_function
-    [5.12, 5.12], # Punto inicial para rastrigin_function
-    [1.2, 1.2]    # Punto inicial para rosenbrock_function
-]
-delta = 0.5
-
-# Crear animaciones para cada función
-for f, x0 in zip(functions, initial_points):
-    x_best, f_best, history = hooke_jeeves(f, x0, delta)
-    history = np.array(history)
-
-    # Crear una cuadrícula para trazar la superficie de la función
-    x = np.linspace(-5, 5, 400)
-    y = np.linspace(-5, 5, 400)
-    X, Y = np.meshgrid(x, y)
-    Z = np.array([f([x, y]) for x, y in zip(np.ravel(X), np.ravel(Y))]).reshape(X.shape)
-    
-    fig, ax = plt.subplots(figsize=(7, 6))
-    images = []
-
-    def update(num):
-        ax.clear()
+# Funciones de prueba: alias de las funciones de la biblioteca funciones_objetivo, que
+# evalúan un punto o un arreglo de puntos de forma (..., n)
+sphere_function = sphere
+himmelblau_function = himmelblau
+rastrigin_function = rastrigin
+rosenbrock_function = rosenbrock
+
+def main():
+    """Ejecuta los ejemplos del módulo y grafica los resultados."""
+    import matplotlib.pyplot as plt
+    from PIL import Image
+    # Parámetros iniciales
+    functions = [sphere_function, himmelblau_function, rastrigin_function, rosenbrock_function]
+    initial_points = [
+        [5.0, 5.0],   # Punto inicial para sphere_function
+        [0.0, 0.0],   # Punto inicial para himmelblau_function
+        [5.12, 5.12], # Punto inicial para rastrigin_function
+        [1.2, 1.2]    # Punto inicial para rosenbrock_function
+    ]
+    delta = 0.5
+
+    # Crear animaciones para cada función
+    for f, x0 in zip(functions, initial_points):
+        x_best, f_best, history = hooke_jeeves(f, x0, delta)
+        history = np.array(history)
+
+        # Crear una cuadrícula para trazar la superficie de la función
+        x = np.linspace(-5, 5, 400)
+        y = np.linspace(-5, 5, 400)
+        X, Y = np.meshgrid(x, y)
+        Z = f(np.stack((X, Y), axis=-1))
+
+        fig, ax = plt.subplots(figsize=(7, 6))
+        images = []
+
+        def update(num):
+            ax.clear()
+            ax.contourf(X, Y, Z, levels=50, cmap='viridis', alpha=0.6)
+            ax.plot(history[:num+1, 0], history[:num+1, 1], marker='o', color='red')
+            ax.plot(history[num, 0], history[num, 1], marker='o', color='red', markersize=5)
+            ax.plot(x_best[0], x_best[1], marker='x', color='blue', markersize=10)
+            ax.set_title(f'{f.__name__}\nIteración: {num+1}, Best: {x_best}, f_best: {f_best:.4f}')
+            ax.set_xlabel('x1')
+            ax.set_ylabel('x2')
+            ax.set_xlim(-5, 5)
+            ax.set_ylim(-5, 5)
+
+            # Guardar el frame actual como imagen
+            fig.canvas.draw()
+            image = np.frombuffer(fig.canvas.tostring_rgb(), dtype='uint8')
+            image = image.reshape(fig.canvas.get_width_height()[::-1] + (3,))
+            images.append(Image.fromarray(image))
+
+        for num in range(len(history)):
+            update(num)
+
+        # Guardar la animación como GIF usando Pillow
+        images[0].save(f'{f.__name__}_optimization.gif', save_all=True, append_images=images[1:], duration=100, loop=0)
+
+        plt.close(fig)
+
+    # Mostrar o guardar figuras estáticas (opcional)
+    '''
+    fig, axs = plt.subplots(2, 2, figsize=(14, 12))
+
+    for ax, f, x0 in zip(axs.flatten(), functions, initial_points):
+        x_best, f_best, history = hooke_jeeves(f, x0, delta)
+        history = np.array(history)
+
+        # Crear una cuadrícula para trazar la superficie de la función
+        x = np.linspace(-5, 5, 400)
+        y = np.linspace(-5, 5, 400)
+        X, Y = np.meshgrid(x, y)
+        Z = f(np.stack((X, Y), axis=-1))
+
+        # Plotear la superficie de la función
         ax.contourf(X, Y, Z, levels=50, cmap='viridis', alpha=0.6)
-        ax.plot(history[:num+1, 0], history[:num+1, 1], marker='o', color='red')
-        ax.plot(history[num, 0], history[num, 1], marker='o', color='red', markersize=5)
+        ax.plot(history[:, 0], history[:, 1], marker='o', color='red')
         ax.plot(x_best[0], x_best[1], marker='x', color='blue', markersize=10)
-        ax.set_title(f'{f.__name__}\nIteración: {num+1}, Best: {x_best}, f_best: {f_best:.4f}')
+        ax.set_title(f'{
+
+    f.__name__}\nBest: {x_best}, f_best: {f_best:.4f}')
         ax.set_xlabel('x1')
         ax.set_ylabel('x2')
-        ax.set_xlim(-5, 5)
-        ax.set_ylim(-5, 5)
 
-        # Guardar el frame actual como imagen
-        fig.canvas.draw()
-        image = np.frombuffer(fig.canvas.tostring_rgb(), dtype='uint8')
-        image = image.reshape(fig.canvas.get_width_height()[::-1] + (3,))
-        images.append(Image.fromarray(image))
+    plt.tight_layout()
+    plt.show()
+    '''
 
-    for num in range(len(history)):
-        update(num)
-    
-    # Guardar la animación como GIF usando Pillow
-    images[0].save(f'{f.__name__}_optimization.gif', save_all=True, append_images=images[1:], duration=100, loop=0)
-
-    plt.close(fig)
-
-# Mostrar o guardar figuras estáticas (opcional)
-'''
-fig, axs = plt.subplots(2, 2, figsize=(14, 12))
-
-for ax, f, x0 in zip(axs.flatten(), functions, initial_points):
-    x_best, f_best, history = hooke_jeeves(f, x0, delta)
-    history = np.array(history)
-    
-    # Crear una cuadrícula para trazar la superficie de la función
-    x = np.linspace(-5, 5, 400)
-    y = np.linspace(-5, 5, 400)
-    X, Y = np.meshgrid(x, y)
-    Z = np.array([f([x, y]) for x, y in zip(np.ravel(X), np.ravel(Y))]).reshape(X.shape)
-    
-    # Plotear la superficie de la función
-    ax.contourf(X, Y, Z, levels=50, cmap='viridis', alpha=0.6)
-    ax.plot(history[:, 0], history[:, 1], marker='o', color='red')
-    ax.plot(x_best[0], x_best[1], marker='x', color='blue', markersize=10)
-    ax.set_title(f'{
-
-f.__name__}\nBest: {x_best}, f_best: {f_best:.4f}')
-    ax.set_xlabel('x1')
-    ax.set_ylabel('x2')
-
-plt.tight_layout()
-plt.show()
-'''
\ No newline at end of file
+if __name__ == '__main__':
+    main()
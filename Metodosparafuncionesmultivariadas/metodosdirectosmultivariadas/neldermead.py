@@ -1,9 +1,102 @@
+import os
+import sys
 import numpy as np
+try:
+    from Metodosparafuncionesmultivariadas.Metodosdirectos.funciones_objetivo import sphere, himmelblau, rastrigin, rosenbrock
+    from Metodosparafuncionesmultivariadas.Metodosgradiente.diferenciacentralgradiente import evaluar_puntos
+except ModuleNotFoundError:
+    # Ejecutado como script: se agrega la raíz del repositorio a sys.path
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+    from Metodosparafuncionesmultivariadas.Metodosdirectos.funciones_objetivo import sphere, himmelblau, rastrigin, rosenbrock
+    from Metodosparafuncionesmultivariadas.Metodosgradiente.diferenciacentralgradiente import evaluar_puntos
 
-def nelder_mead(f, x0, gamma=2, beta=0.5, epsilon=1e-5, max_iter=1000):
+def coeficientes_adaptativos(N):
+    """
+    Coeficientes de Nelder-Mead que dependen de la dimensión (Gao y Han, 2012). En dos
+    dimensiones coinciden con los clásicos (2, 0.5, 0.5) y al crecer N hacen la expansión
+    y la reducción más conservadoras, lo que evita que el simplex se estanque.
+
+    Parámetros:
+    ----------
+    N : int
+        Número de variables.
+
+    Retorna:
+    -------
+    tuple
+        (gamma, beta, sigma): coeficientes de expansión, contracción y reducción.
+    """
+    N = max(N, 2)
+    return 1 + 2 / N, 0.75 - 1 / (2 * N), 1 - 1 / N
+
+def simplex_inicial(x0, paso=None):
+    """
+    Construye el simplex inicial desplazando x0 en cada eje coordenado.
+
+    Parámetros:
+    ----------
+    x0 : np.ndarray
+        Primer vértice del simplex.
+    paso : float o np.ndarray, opcional
+        Desplazamiento en cada eje. Por defecto es el 5% de |x0[i]|, o 0.00025 si
+        x0[i] es 0, para que el simplex siga la escala de cada variable.
+
+    Retorna:
+    -------
+    np.ndarray
+        Arreglo (N + 1, N) con un vértice por fila.
+    """
+    x0 = np.asarray(x0, dtype=float)
+    N = len(x0)
+    if paso is None:
+        paso = np.where(x0 != 0, 0.05 * np.abs(x0), 0.00025)
+    simplex = np.tile(x0, (N + 1, 1))
+    simplex[np.arange(1, N + 1), np.arange(N)] += np.broadcast_to(paso, (N,))
+    return simplex
+
+def simplex_degenerado(simplex, l, tol=1e-3):
+    """
+    Indica si el simplex perdió dimensión: sus aristas desde el mejor vértice son casi
+    linealmente dependientes (cociente entre el menor y el mayor valor singular menor
+    que tol).
+
+    Parámetros:
+    ----------
+    simplex : np.ndarray
+        Arreglo (N + 1, N) con los vértices.
+    l : int
+        Índice del mejor vértice.
+    tol : float, opcional
+        Tolerancia del cociente de valores singulares (por defecto 1e-3).
+
+    Retorna:
+    -------
+    bool
+        True si el simplex es degenerado.
+    """
+    aristas = np.delete(simplex, l, axis=0) - simplex[l]
+    valores_singulares = np.linalg.svd(aristas, compute_uv=False)
+    return not valores_singulares[-1] > tol * valores_singulares[0]
+
+def nelder_mead(f, x0, gamma=None, beta=None, epsilon=1e-5, max_iter=1000, sigma=None,
+                paso=None, reiniciar=True, executor=None):
     """
     Implementación del método de Nelder-Mead para la optimización de funciones no lineales.
 
+    Los valores de f en los vértices se guardan en un arreglo paralelo al simplex y la suma
+    de los vértices se actualiza en cada reemplazo, de modo que una iteración sólo evalúa
+    f en los puntos nuevos (1 o 2 normalmente, N en una reducción) y el resto del trabajo
+    es aritmética O(N). Cada N + 1 iteraciones se comprueba si el simplex degeneró sin que
+    el mejor valor haya mejorado en ese intervalo y, en ese caso, se reinicia alrededor del
+    mejor punto con el mismo tamaño.
+
+    Con un executor (concurrent.futures) cada iteración evalúa de forma especulativa y
+    simultánea la reflexión, la expansión y las dos contracciones, y después aplica las
+    reglas habituales a esos valores; los vértices nuevos de una reducción o de un
+    reinicio también se evalúan en paralelo. Se hacen más evaluaciones que en el modo
+    secuencial pero cada iteración espera una sola ronda, lo que conviene cuando f es
+    costosa.
+
     Parámetros:
     ----------
     f : function
@@ -13,154 +106,272 @@ def nelder_mead(f, x0, gamma=2, beta=0.5, epsilon=1e-5, max_iter=1000):
     x0 : np.ndarray
         Punto inicial para comenzar la búsqueda.
     gamma : float, opcional
-        Parámetro de expansión (por defecto 2).
+        Parámetro de expansión (por defecto 1 + 2/N, ver coeficientes_adaptativos).
     beta : float, opcional
-        Parámetro de contracción (por defecto 0.5).
+        Parámetro de contracción (por defecto 0.75 - 1/(2N)).
     epsilon : float, opcional
         Tolerancia para la condición de terminación (por defecto 1e-5).
     max_iter : int, opcional
         Número máximo de iteraciones permitidas (por defecto 1000).
+    sigma : float, opcional
+        Factor de reducción del simplex hacia el mejor punto cuando la contracción
+        falla (por defecto 1 - 1/N).
+    paso : float o np.ndarray, opcional
+        Desplazamientos del simplex inicial, ver simplex_inicial.
+    reiniciar : bool, opcional
+        Si es True (por defecto) el simplex se reconstruye cuando degenera.
+    executor : concurrent.futures.Executor, opcional
+        Pool de trabajadores para la evaluación especulativa. Con ProcessPoolExecutor f
+        debe poder serializarse con pickle. Por defecto None (evaluación secuencial).
 
     Retorna:
     -------
     np.ndarray
         El mejor punto encontrado que minimiza la función objetivo f.
     """
+    x0 = np.asarray(x0, dtype=float)
     N = len(x0)
+    gamma_n, beta_n, sigma_n = coeficientes_adaptativos(N)
+    gamma = gamma_n if gamma is None else gamma
+    beta = beta_n if beta is None else beta
+    sigma = sigma_n if sigma is None else sigma
+    evaluar = map if executor is None else executor.map
     # Crear el simplex inicial
-    simplex = [x0]
-    for i in range(N):
-        x = np.copy(x0)
-        x[i] = x[i] + (x[i] + 1)
-        simplex.append(x)
-    simplex = np.array(simplex)
+    simplex = simplex_inicial(x0, paso)
+    f_values = np.array(list(evaluar(f, simplex)), dtype=float)
+    suma = simplex.sum(axis=0)
+    # Mejor valor en la última comprobación de degeneración
+    f_control = np.min(f_values)
 
     for iteration in range(max_iter):
-        # Ordenar el simplex según los valores de la función objetivo
-        simplex = sorted(simplex, key=lambda x: f(x))
-        xh = simplex[-1]   # El peor punto
-        xl = simplex[0]    # El mejor punto
-        xg = simplex[-2]   # El siguiente peor punto
+        # Índices del mejor y del peor punto, y valor del siguiente peor, en O(N)
+        l = np.argmin(f_values)
+        h = np.argmax(f_values)
+        fl, fh = f_values[l], f_values[h]
+        fg = np.partition(f_values, N - 1)[N - 1]
+        xh = simplex[h]
 
-        # Calcular el centroide
-        xc = np.mean(simplex[:-1], axis=0)
+        # Centroide de todos los puntos excepto el peor
+        xc = (suma - xh) / N
 
-        # Reflejar el punto xh
+        # Reflexión, expansión y contracciones hacia el reflejado (exterior) o hacia el
+        # peor punto (interior) sólo dependen de xc y xh
         xr = 2 * xc - xh
-        if f(xr) < f(xl):
+        xe = (1 + gamma) * xc - gamma * xh
+        x_exterior = xc - beta * (xc - xr)
+        x_interior = xc - beta * (xc - xh)
+        if executor is None:
+            valores = None
+            fr = f(xr)
+        else:
+            # Evaluación especulativa de los cuatro candidatos en una sola ronda
+            valores = list(executor.map(f, (xr, xe, x_exterior, x_interior)))
+            fr = valores[0]
+        if fr < fl:
             # Expansión
-            xe = (1 + gamma) * xc - gamma * xh
-            if f(xe) < f(xr):
-                xnew = xe
-            else:
-                xnew = xr
-        elif f(xr) < f(xg):
-            xnew = xr
+            fe = f(xe) if valores is None else valores[1]
+            xnew, fnew = (xe, fe) if fe < fr else (xr, fr)
+        elif fr < fg:
+            xnew, fnew = xr, fr
         else:
-            if f(xr) < f(xh):
-                xh = xr
-            # Contracción
-            if f(xr) < f(xh):
-                xc = xc - beta * (xc - xr)
+            if fr < fh:
+                xnew = x_exterior
+                fnew = f(xnew) if valores is None else valores[2]
+                aceptar = fnew <= fr
             else:
-                xc = xc - beta * (xc - xh)
-            xnew = xc
+                xnew = x_interior
+                fnew = f(xnew) if valores is None else valores[3]
+                aceptar = fnew < fh
+            if not aceptar:
+                # Reducción: todos los puntos se acercan al mejor
+                simplex = simplex[l] + sigma * (simplex - simplex[l])
+                nuevos = list(evaluar(f, np.delete(simplex, l, axis=0)))
+                f_values = np.insert(np.array(nuevos, dtype=float), l, fl)
+                suma = simplex.sum(axis=0)
+                xnew = None
 
-        # Reemplazar el peor punto con el nuevo punto
-        simplex[-1] = xnew
+        if xnew is not None:
+            # Reemplazar el peor punto con el nuevo punto
+            suma += xnew - xh
+            simplex[h] = xnew
+            f_values[h] = fnew
+            # La suma se recalcula cada N + 1 reemplazos para no acumular redondeo
+            if iteration % (N + 1) == N:
+                suma = simplex.sum(axis=0)
 
         # Comprobar la condición de terminación
-        f_values = np.array([f(x) for x in simplex])
         if np.sqrt(np.sum((f_values - np.mean(f_values)) ** 2) / (N + 1)) <= epsilon:
             break
 
-    return simplex[0]  # Devuelve el mejor punto encontrado
+        if reiniciar and N > 1 and iteration % (N + 1) == N:
+            l = np.argmin(f_values)
+            estancado = f_values[l] > f_control - 1e-6 * (abs(f_control) + 1e-12)
+            f_control = f_values[l]
+            if estancado and simplex_degenerado(simplex, l):
+                # Nuevo simplex alineado con los ejes, del tamaño del actual
+                diametro = np.max(np.linalg.norm(simplex - simplex[l], axis=1))
+                fl = f_values[l]
+                simplex = simplex_inicial(simplex[l], diametro if diametro > 0 else None)
+                f_values = np.array([fl] + list(evaluar(f, simplex[1:])), dtype=float)
+                suma = simplex.sum(axis=0)
 
-# Funciones de prueba
+    return simplex[np.argmin(f_values)]  # Devuelve el mejor punto encontrado
 
-def sphere_function(x):
+def nelder_mead_lote(f, x0, gamma=None, beta=None, epsilon=1e-5, max_iter=1000, sigma=None,
+                     paso=None, vectorizada=None):
     """
-    Función esférica (Sphere function).
+    Ejecuta K búsquedas de Nelder-Mead a la vez, una por cada punto inicial. Los K simplex
+    se guardan en un arreglo (K, N + 1, N) y cada fase (reflexión, luego expansión y
+    contracción juntas, y reducción) se calcula con operaciones vectorizadas y una sola
+    llamada por lotes a f. Las corridas que cumplen la condición de terminación se retiran
+    y dejan de evaluarse. Cada corrida sigue los mismos pasos que nelder_mead con
+    reiniciar=False.
 
     Parámetros:
     ----------
-    x : np.ndarray
-        Arreglo NumPy que representa el punto en el espacio de búsqueda.
+    f : function
+        Función objetivo a minimizar. Si acepta un arreglo (m, N) y retorna (m,) valores
+        se evalúa cada fase en una sola llamada; si no, punto por punto.
+    x0 : np.ndarray
+        Arreglo (K, N) con los puntos iniciales.
+    gamma : float, opcional
+        Parámetro de expansión (por defecto 1 + 2/N, ver coeficientes_adaptativos).
+    beta : float, opcional
+        Parámetro de contracción (por defecto 0.75 - 1/(2N)).
+    epsilon : float, opcional
+        Tolerancia para la condición de terminación (por defecto 1e-5).
+    max_iter : int, opcional
+        Número máximo de iteraciones permitidas (por defecto 1000).
+    sigma : float, opcional
+        Factor de reducción (por defecto 1 - 1/N).
+    paso : float o np.ndarray, opcional
+        Desplazamientos del simplex inicial, ver simplex_inicial.
+    vectorizada : bool, opcional
+        Si f evalúa una matriz de puntos en una sola llamada. Por defecto None (se
+        detecta automáticamente, ver evaluar_puntos).
 
     Retorna:
     -------
-    float
-        Valor de la función esférica evaluada en x.
+    tuple
+        (puntos, valores): arreglo (K, N) con el mejor punto de cada corrida y arreglo
+        (K,) con sus valores de f.
     """
-    return np.sum(x**2)
+    x0 = np.atleast_2d(np.asarray(x0, dtype=float))
+    K, N = x0.shape
+    gamma_n, beta_n, sigma_n = coeficientes_adaptativos(N)
+    gamma = gamma_n if gamma is None else gamma
+    beta = beta_n if beta is None else beta
+    sigma = sigma_n if sigma is None else sigma
+    if paso is None:
+        paso = np.where(x0 != 0, 0.05 * np.abs(x0), 0.00025)
 
-def himmelblau_function(x):
-    """
-    Función de Himmelblau.
+    # Simplex iniciales (K, N + 1, N), como en simplex_inicial
+    simplex = np.repeat(x0[:, None, :], N + 1, axis=1)
+    simplex[:, np.arange(1, N + 1), np.arange(N)] += np.broadcast_to(paso, (K, N))
+    f_values = evaluar_puntos(f, simplex.reshape(-1, N), vectorizada).reshape(K, N + 1)
+    suma = simplex.sum(axis=1)
+    filas = np.arange(N + 1)
+    activos = np.arange(K)
 
-    Parámetros:
-    ----------
-    x : np.ndarray
-        Arreglo NumPy que representa el punto en el espacio de búsqueda.
+    for iteration in range(max_iter):
+        m = len(activos)
+        r = np.arange(m)
+        F = f_values[activos]
+        l = np.argmin(F, axis=1)
+        h = np.argmax(F, axis=1)
+        fl, fh = F[r, l], F[r, h]
+        fg = np.partition(F, N - 1, axis=1)[:, N - 1]
+        xh = simplex[activos, h]
 
-    Retorna:
-    -------
-    float
-        Valor de la función de Himmelblau evaluada en x.
-    """
-    return (x[0]**2 + x[1] - 11)**2 + (x[0] + x[1]**2 - 7)**2
+        # Centroide de cada simplex sin su peor punto y reflexión
+        xc = (suma[activos] - xh) / N
+        xr = 2 * xc - xh
+        fr = evaluar_puntos(f, xr, vectorizada)
 
-def rastrigin_function(x):
-    """
-    Función de Rastrigin.
+        expandir = fr < fl
+        contraer = ~expandir & (fr >= fg)
+        exterior = contraer & (fr < fh)
 
-    Parámetros:
-    ----------
-    x : np.ndarray
-        Arreglo NumPy que representa el punto en el espacio de búsqueda.
+        # Expansión y contracciones sólo dependen de fr: se evalúan en una sola llamada
+        candidatos = np.where(expandir[:, None], xc + gamma * (xc - xh),
+                              np.where(exterior[:, None], xc - beta * (xc - xr), xc - beta * (xc - xh)))
+        evaluar = expandir | contraer
+        f_candidatos = np.full(m, np.inf)
+        if np.any(evaluar):
+            f_candidatos[evaluar] = evaluar_puntos(f, candidatos[evaluar], vectorizada)
 
-    Retorna:
-    -------
-    float
-        Valor de la función de Rastrigin evaluada en x.
-    """
-    A = 10
-    return A * len(x) + np.sum(x**2 - A * np.cos(2 * np.pi * x))
+        tomar = (expandir & (f_candidatos < fr)) | (exterior & (f_candidatos <= fr)) \
+            | (contraer & ~exterior & (f_candidatos < fh))
+        xnew = np.where(tomar[:, None], candidatos, xr)
+        fnew = np.where(tomar, f_candidatos, fr)
+        reducir = contraer & ~tomar
 
-def rosenbrock_function(x):
-    """
-    Función de Rosenbrock.
+        # Reemplazar el peor punto de cada simplex que no se reduce
+        reemplazar = ~reducir
+        k = activos[reemplazar]
+        suma[k] += xnew[reemplazar] - xh[reemplazar]
+        simplex[k, h[reemplazar]] = xnew[reemplazar]
+        f_values[k, h[reemplazar]] = fnew[reemplazar]
 
-    Parámetros:
-    ----------
-    x : np.ndarray
-        Arreglo NumPy que representa el punto en el espacio de búsqueda.
+        # Reducción hacia el mejor punto, evaluando juntos los vértices nuevos
+        if np.any(reducir):
+            k = activos[reducir]
+            mejor = simplex[k, l[reducir]][:, None, :]
+            reducidos = mejor + sigma * (simplex[k] - mejor)
+            nuevos = filas[None, :] != l[reducir][:, None]
+            F = f_values[k]
+            F[nuevos] = evaluar_puntos(f, reducidos[nuevos], vectorizada)
+            simplex[k] = reducidos
+            f_values[k] = F
+            suma[k] = reducidos.sum(axis=1)
 
-    Retorna:
-    -------
-    float
-        Valor de la función de Rosenbrock evaluada en x.
-    """
-    return np.sum(100 * (x[1:] - x[:-1]**2)**2 + (x[:-1] - 1)**2)
+        # La suma se recalcula cada N + 1 iteraciones para no acumular redondeo
+        if iteration % (N + 1) == N:
+            suma = simplex.sum(axis=1)
+
+        # Retirar las corridas que cumplen la condición de terminación
+        activos = activos[np.std(f_values[activos], axis=1) > epsilon]
+        if len(activos) == 0:
+            break
+
+    mejores = np.argmin(f_values, axis=1)
+    return simplex[np.arange(K), mejores], f_values[np.arange(K), mejores]
+
+# Funciones de prueba: alias de las funciones de la biblioteca funciones_objetivo, que
+# evalúan un punto o un arreglo de puntos de forma (..., n)
+sphere_function = sphere
+himmelblau_function = himmelblau
+rastrigin_function = rastrigin
+rosenbrock_function = rosenbrock
+
+def main():
+    """Ejecuta el ejemplo de uso del módulo."""
+    # Pruebas
+
+    # Sphere function
+    x0 = np.array([-1.0, 1.5])
+    resultado_sphere = nelder_mead(sphere_function, x0)
+    print("Sphere function resultado:", resultado_sphere)
 
-# Pruebas
+    # Himmelblau's function
+    x0 = np.array([0.0, 0.0])
+    resultado_himmelblau = nelder_mead(himmelblau_function, x0)
+    print("Himmelblau's function resultado:", resultado_himmelblau)
 
-# Sphere function
-x0 = np.array([-1.0, 1.5])
-resultado_sphere = nelder_mead(sphere_function, x0)
-print("Sphere function resultado:", resultado_sphere)
+    # Rastrigin function
+    x0 = np.array([-2.0, -2.0, -2.0])
+    resultado_rastrigin = nelder_mead(rastrigin_function, x0)
+    print("Rastrigin function resultado:", resultado_rastrigin)
 
-# Himmelblau's function
-x0 = np.array([0.0, 0.0])
-resultado_himmelblau = nelder_mead(himmelblau_function, x0)
-print("Himmelblau's function resultado:", resultado_himmelblau)
+    # Rosenbrock function
+    x0 = np.array([2.0, 1.5, 3.0, -1.5, -2.0])
+    resultado_rosenbrock = nelder_mead(rosenbrock_function, x0)
+    print("Rosenbrock function resultado:", resultado_rosenbrock)
 
-# Rastrigin function
-x0 = np.array([-2.0, -2.0, -2.0])
-resultado_rastrigin = nelder_mead(rastrigin_function, x0)
-print("Rastrigin function resultado:", resultado_rastrigin)
+    # Rastrigin function con varios puntos iniciales a la vez
+    x0s = np.random.default_rng(0).uniform(-5.12, 5.12, (100, 3))
+    puntos, valores = nelder_mead_lote(rastrigin_function, x0s)
+    print("Rastrigin function mejor de 100 inicios:", puntos[np.argmin(valores)], valores.min())
 
-# Rosenbrock function
-x0 = np.array([2.0, 1.5, 3.0, -1.5, -2.0])
-resultado_rosenbrock = nelder_mead(rosenbrock_function, x0)
-print("Rosenbrock function resultado:", resultado_rosenbrock)
\ No newline at end of file
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,12 @@
+import os
+import sys
 import numpy as np
+try:
+    from Metodosparafuncionesmultivariadas.Metodosdirectos.funciones_objetivo import sphere, himmelblau, rastrigin, rosenbrock
+except ModuleNotFoundError:
+    # Ejecutado como script: se agrega la raíz del repositorio a sys.path
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+    from Metodosparafuncionesmultivariadas.Metodosdirectos.funciones_objetivo import sphere, himmelblau, rastrigin, rosenbrock
 
 # Función de caminata aleatoria
 def random_walk(f, terminar, x0, generacion_aleatoria):
@@ -30,67 +38,12 @@ def random_walk(f, terminar, x0, generacion_aleatoria):
     
     return x_mejor
 
-# Funciones de prueba
-def sphere_function(x):
-    """
-    Función esférica (Sphere function).
-
-    Parámetros:
-    x : array_like
-        Vector de entrada.
-
-    Retorna:
-    float
-        Valor de la función esférica evaluada en x.
-    """
-    x = np.array(x)
-    return np.sum(x**2)
-
-def himmelblau_function(x):
-    """
-    Función de Himmelblau.
-
-    Parámetros:
-    x : array_like
-        Vector de entrada.
-
-    Retorna:
-    float
-        Valor de la función de Himmelblau evaluada en x.
-    """
-    x = np.array(x)
-    return (x[0]**2 + x[1] - 11)**2 + (x[0] + x[1]**2 - 7)**2
-
-def rastrigin_function(x):
-    """
-    Función de Rastrigin.
-
-    Parámetros:
-    x : array_like
-        Vector de entrada.
-
-    Retorna:
-    float
-        Valor de la función de Rastrigin evaluada en x.
-    """
-    x = np.array(x)
-    A = 10
-    return A * len(x) + np.sum(x**2 - A * np.cos(2 * np.pi * x))
-
-def rosenbrock_function(x):
-    """
-    Función de Rosenbrock.
-
-    Parámetros:
-    x : array_like
-        Vector de entrada.
-
-    Retorna:
-    float
-        Valor de la función de Rosenbrock evaluada en x.
-    """
-    x = np.array(x)
-    return np.sum(100 * (x[1:] - x[:-1]**2)**2 + (x[:-1] - 1)**2)
+# Funciones de prueba: alias de las funciones de la biblioteca funciones_objetivo, que
+# evalúan un punto o un arreglo de puntos de forma (..., n)
+sphere_function = sphere
+himmelblau_function = himmelblau
+rastrigin_function = rastrigin
+rosenbrock_function = rosenbrock
 
 # Criterio de terminación
 def criterio_terminacion(x, max_iter=100):
@@ -132,23 +85,28 @@ def generacion_aleatoria(x, mu=0, sigma=0.5):
     """
     return x + np.random.normal(mu, sigma, size=len(x))
 
-# Parámetros iniciales
-functions = [sphere_function, himmelblau_function, rastrigin_function, rosenbrock_function]
-initial_points = [
-    [5.0, 5.0],  # Punto inicial para sphere_function
-    [0.0, 0.0],  # Punto inicial para himmelblau_function
-    [5.12, 5.12],  # Punto inicial para rastrigin_function
-    [1.2, 1.2]   # Punto inicial para rosenbrock_function
-]
-
-# Ejecución del algoritmo para cada función de prueba
-mejores_soluciones = []
-for f, x0 in zip(functions, initial_points):
-    # Reiniciar el contador de iteraciones para cada ejecución
-    criterio_terminacion.iteraciones = 0
-    mejor_solucion = random_walk(f, criterio_terminacion, x0, generacion_aleatoria)
-    mejores_soluciones.append(mejor_solucion)
-
-# Imprimir resultados
-for i, mejor_solucion in enumerate(mejores_soluciones):
-    print(f"Mejor solución encontrada para la función {functions[i].__name__}: {mejor_solucion}")
\ No newline at end of file
+def main():
+    """Ejecuta el ejemplo de uso del módulo."""
+    # Parámetros iniciales
+    functions = [sphere_function, himmelblau_function, rastrigin_function, rosenbrock_function]
+    initial_points = [
+        [5.0, 5.0],  # Punto inicial para sphere_function
+        [0.0, 0.0],  # Punto inicial para himmelblau_function
+        [5.12, 5.12],  # Punto inicial para rastrigin_function
+        [1.2, 1.2]   # Punto inicial para rosenbrock_function
+    ]
+
+    # Ejecución del algoritmo para cada función de prueba
+    mejores_soluciones = []
+    for f, x0 in zip(functions, initial_points):
+        # Reiniciar el contador de iteraciones para cada ejecución
+        criterio_terminacion.iteraciones = 0
+        mejor_solucion = random_walk(f, criterio_terminacion, x0, generacion_aleatoria)
+        mejores_soluciones.append(mejor_solucion)
+
+    # Imprimir resultados
+    for i, mejor_solucion in enumerate(mejores_soluciones):
+        print(f"Mejor solución encontrada para la función {functions[i].__name__}: {mejor_solucion}")
+
+if __name__ == '__main__':
+    main()
@@ -1,36 +1,78 @@
-#Introduccion
-from introduccion.latax2 import volumen_lata
-from introduccion.caja import volumen_caja
-from introduccion.cerca import ecuacion_cerca
-
-#-------------------------Metodos para funciones de una variable-------------------------
-from Metodosfuncionesdeunavariable.busqueda_exhaustiva import *
-from Metodosfuncionesdeunavariable.interval_halving_method import *
-
-#Metodos de eliminación de regiones
-from Metodosfuncionesdeunavariable.Metodoseliminacionregiones.bounding_phase_method import bounding_p_m
-from Metodosfuncionesdeunavariable.Metodoseliminacionregiones.fibonacci import fibonacci_search
-from Metodosfuncionesdeunavariable.Metodoseliminacionregiones.golden_search_method import golden_search
-
-#Metodos basados en la derivada
-from Metodosfuncionesdeunavariable.Metodosbasadosderivada.newton_rhapson import newton_method
-from Metodosfuncionesdeunavariable.Metodosbasadosderivada.biseccion import biseccion
-from Metodosfuncionesdeunavariable.Metodosbasadosderivada.secante import secante
-
-#-------------------------------Metodos para funciones multivariadas-------------------------
-
-#Metodos directos | Funciones objetivo
-from Metodosparafuncionesmultivariadas.Metodosdirectos.funciones_objetivo import rastrigin, rosenbrock, ackley, beale, booth, easom
-from Metodosparafuncionesmultivariadas.Metodosdirectos.funciones_objetivo_restriccion import rosenbrock_constrained, rosenbrock_disk, mishra_bird, townsend, gomez_levy, simionescu
-from Metodosparafuncionesmultivariadas.Metodosdirectos.busqueda_unidireccional import busqueda_unidireccional, funcioon, evaluar
-
-#Metodos directos
-from Metodosparafuncionesmultivariadas.metodosdirectosmultivariadas.randomwalk import random_walk
-from Metodosparafuncionesmultivariadas.metodosdirectosmultivariadas.neldermead import nelder_mead
-from Metodosparafuncionesmultivariadas.metodosdirectosmultivariadas.hookejeeves import hooke_jeeves
-
-#Metodos de gradiente
-from Metodosparafuncionesmultivariadas.Metodosgradiente.cauchy import cauchy
-from Metodosparafuncionesmultivariadas.Metodosgradiente.gradiente_conjugado import gradiente
-from Metodosparafuncionesmultivariadas.Metodosgradiente.newton import newton
-from Metodosparafuncionesmultivariadas.Metodosgradiente.diferenciacentralgradiente import *
+import importlib
+
+# Los nombres del paquete se cargan de forma diferida: cada módulo (y sus dependencias)
+# se importa la primera vez que se accede a alguno de sus nombres.
+_MODULOS = {
+    #Introduccion
+    'introduccion.latax2': ['volumen_lata'],
+    'introduccion.caja': ['volumen_caja'],
+    'introduccion.cerca': ['ecuacion_cerca'],
+
+    #-------------------------Metodos para funciones de una variable-------------------------
+    'Metodosfuncionesdeunavariable.busqueda_exhaustiva': [
+        'caja', 'lata', 'fun1', 'fun2', 'fun3', 'fun4', 'calcular_n', 'exhaustive_search',
+        'exhaustive_search_bloques', 'exhaustive_search_vectorizado', 'exhaustive_search_npy',
+        'exhaustive_search_multiresolucion', 'graficar'],
+    'Metodosfuncionesdeunavariable.interval_halving_method': [
+        'linspace', 'caja', 'lata', 'f1', 'f2', 'f3', 'f4', 'interval_halving'],
+
+    #Metodos de eliminación de regiones
+    'Metodosfuncionesdeunavariable.Metodoseliminacionregiones.bounding_phase_method': ['bounding_p_m'],
+    'Metodosfuncionesdeunavariable.Metodoseliminacionregiones.fibonacci': ['fibonacci_search'],
+    'Metodosfuncionesdeunavariable.Metodoseliminacionregiones.golden_search_method': ['golden_search'],
+    'Metodosfuncionesdeunavariable.brent_method': ['brent'],
+
+    #Metodos basados en la derivada
+    'Metodosfuncionesdeunavariable.Metodosbasadosderivada.newton_rhapson': ['newton_method'],
+    'Metodosfuncionesdeunavariable.Metodosbasadosderivada.biseccion': ['biseccion'],
+    'Metodosfuncionesdeunavariable.Metodosbasadosderivada.secante': ['secante'],
+
+    #-------------------------------Metodos para funciones multivariadas-------------------------
+
+    #Metodos directos | Funciones objetivo
+    'Metodosparafuncionesmultivariadas.Metodosdirectos.funciones_objetivo': [
+        'rastrigin', 'rosenbrock', 'ackley', 'beale', 'booth', 'easom'],
+    'Metodosparafuncionesmultivariadas.Metodosdirectos.funciones_objetivo_restriccion': [
+        'rosenbrock_constrained', 'rosenbrock_disk', 'mishra_bird', 'townsend', 'gomez_levy', 'simionescu'],
+    'Metodosparafuncionesmultivariadas.Metodosdirectos.busqueda_unidireccional': [
+        'busqueda_unidireccional', 'funcioon', 'evaluar'],
+
+    #Metodos directos
+    'Metodosparafuncionesmultivariadas.metodosdirectosmultivariadas.randomwalk': ['random_walk'],
+    'Metodosparafuncionesmultivariadas.metodosdirectosmultivariadas.neldermead': ['nelder_mead', 'nelder_mead_lote'],
+    'Metodosparafuncionesmultivariadas.metodosdirectosmultivariadas.hookejeeves': ['hooke_jeeves'],
+
+    #Metodos de gradiente
+    'Metodosparafuncionesmultivariadas.Metodosgradiente.cauchy': ['cauchy'],
+    'Metodosparafuncionesmultivariadas.Metodosgradiente.gradiente_conjugado': ['gradiente'],
+    'Metodosparafuncionesmultivariadas.Metodosgradiente.newton': ['newton'],
+    'Metodosparafuncionesmultivariadas.Metodosgradiente.bfgs': ['bfgs', 'lbfgs'],
+    'Metodosparafuncionesmultivariadas.Metodosgradiente.diferenciacentralgradiente': [
+        'f', 'registrar_derivadas', 'primera_derivada', 'segunda_derivada'],
+}
+
+# Si un nombre aparece en varios módulos gana el último, como con los imports originales
+_ATRIBUTOS = {nombre: modulo for modulo, nombres in _MODULOS.items() for nombre in nombres}
+
+__all__ = list(_ATRIBUTOS)
+
+def __getattr__(nombre):
+    """
+    Importa el módulo que define nombre la primera vez que se accede a él y guarda el
+    valor en el paquete para que los accesos siguientes no pasen por aquí.
+
+    Args:
+        nombre (str): Nombre del atributo solicitado.
+
+    Returns:
+        object: El objeto exportado con ese nombre.
+    """
+    modulo = _ATRIBUTOS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {nombre!r}')
+    valor = getattr(importlib.import_module(modulo), nombre)
+    globals()[nombre] = valor
+    return valor
+
+def __dir__():
+    return sorted(set(globals()) | set(_ATRIBUTOS))
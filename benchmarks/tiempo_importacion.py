@@ -0,0 +1,102 @@
+import os
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Presupuesto en segundos para importar el paquete completo en un intérprete nuevo
+PRESUPUESTO = 1.0
+
+# Bibliotecas de gráficas que ningún módulo debe cargar al importarse
+BIBLIOTECAS_GRAFICAS = ('matplotlib', 'PIL')
+
+CODIGO_IMPORTACION = (
+    "import importlib.util, sys\n"
+    "sys.path.insert(0, {raiz!r})\n"
+    "spec = importlib.util.spec_from_file_location('optimizacion', {init!r}, "
+    "submodule_search_locations=[{raiz!r}])\n"
+    "modulo = importlib.util.module_from_spec(spec)\n"
+    "sys.modules['optimizacion'] = modulo\n"
+    "spec.loader.exec_module(modulo)\n"
+    "import importlib\n"
+    "for nombre in modulo._MODULOS:\n"
+    "    importlib.import_module(nombre)\n"
+    "cargadas = sorted({{n.split('.')[0] for n in sys.modules}} & set({graficas!r}))\n"
+    "if cargadas:\n"
+    "    sys.exit('Bibliotecas de gráficas cargadas al importar: ' + ', '.join(cargadas))\n"
+)
+
+def tiempo_importacion(repeticiones=5):
+    """
+    Mide el tiempo de importar el paquete en un intérprete nuevo de Python. Además de
+    la raíz, que carga sus nombres de forma diferida, se importa directamente cada
+    módulo listado en _MODULOS, y la importación falla si alguno cargó matplotlib o PIL.
+
+    Args:
+        repeticiones (int, opcional): Número de mediciones. Por defecto es 5.
+
+    Returns:
+        tuple: (mejor tiempo en segundos, salida estándar producida por la importación).
+    """
+    codigo = CODIGO_IMPORTACION.format(raiz=RAIZ, init=os.path.join(RAIZ, '__init__.py'),
+                                       graficas=BIBLIOTECAS_GRAFICAS)
+    mejor = float('inf')
+    salida = ''
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = subprocess.run([sys.executable, '-c', codigo], cwd=RAIZ,
+                                   capture_output=True, text=True)
+        transcurrido = time.perf_counter() - inicio
+        if resultado.returncode != 0:
+            raise RuntimeError('La importación del paquete falló:\n' + resultado.stderr)
+        mejor = min(mejor, transcurrido)
+        salida = resultado.stdout
+    return mejor, salida
+
+def tiempo_interprete(repeticiones=5):
+    """
+    Mide el tiempo de arrancar un intérprete vacío, que se descuenta de la importación.
+
+    Args:
+        repeticiones (int, opcional): Número de mediciones. Por defecto es 5.
+
+    Returns:
+        float: Mejor tiempo en segundos.
+    """
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+def main(presupuesto=PRESUPUESTO):
+    """
+    Verifica que importar el paquete y sus módulos no produzca salida, no cargue
+    bibliotecas de gráficas y se mantenga dentro del presupuesto.
+
+    Args:
+        presupuesto (float, opcional): Tiempo máximo permitido en segundos.
+
+    Returns:
+        int: 0 si se cumple el presupuesto, 1 en caso contrario.
+    """
+    base = tiempo_interprete()
+    try:
+        total, salida = tiempo_importacion()
+    except RuntimeError as error:
+        print(error)
+        return 1
+    neto = total - base
+    print(f'Importación del paquete y sus módulos: {neto:.3f} s (presupuesto: {presupuesto:.3f} s)')
+    if salida:
+        print('La importación produjo salida:\n' + salida)
+        return 1
+    if neto > presupuesto:
+        print('Se excedió el presupuesto de tiempo de importación.')
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(float(sys.argv[1]) if len(sys.argv) > 1 else PRESUPUESTO))
@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 def linspace(start, stop, step=1):
     """
@@ -27,22 +26,28 @@ def volumen_caja(x):
     """
     return 200 * x - 60 * x**2 + 4 * x**3
 
-# Generar valores de x desde 2 hasta 3 con un paso de 0.05
-x = linspace(2, 3, 0.05)
+def main():
+    """Ejecuta los ejemplos del módulo y grafica los resultados."""
+    import matplotlib.pyplot as plt
+    # Generar valores de x desde 2 hasta 3 con un paso de 0.05
+    x = linspace(2, 3, 0.05)
 
-# Calcular el volumen de la caja para cada valor de x
-v = volumen_caja(x)
+    # Calcular el volumen de la caja para cada valor de x
+    v = volumen_caja(x)
 
-# Valor específico de L
-L = 2.11
+    # Valor específico de L
+    L = 2.11
 
-# Calcular el volumen de la caja en el punto específico L
-punto = volumen_caja(L)
+    # Calcular el volumen de la caja en el punto específico L
+    punto = volumen_caja(L)
 
-# Graficar el volumen de la caja
-plt.plot(x, v)
-plt.scatter(L, punto, c='pink')
-plt.xlabel('x')
-plt.ylabel('Volumen')
-plt.title('Volumen de la caja en función de x')
-plt.show()
+    # Graficar el volumen de la caja
+    plt.plot(x, v)
+    plt.scatter(L, punto, c='pink')
+    plt.xlabel('x')
+    plt.ylabel('Volumen')
+    plt.title('Volumen de la caja en función de x')
+    plt.show()
+
+if __name__ == '__main__':
+    main()
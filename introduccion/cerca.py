@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 def linspace(start, stop, step=1):
     """
@@ -27,19 +26,25 @@ def ecuacion_cerca(x):
     """
     return (200 * x) - (8 * (x)**2 / 3)
 
-# Generar un conjunto de valores x desde -1 hasta 4 con un paso de 0.05
-x = linspace(-1, 4, 0.05)
+def main():
+    """Ejecuta los ejemplos del módulo y grafica los resultados."""
+    import matplotlib.pyplot as plt
+    # Generar un conjunto de valores x desde -1 hasta 4 con un paso de 0.05
+    x = linspace(-1, 4, 0.05)
 
-# Calcular los valores de la función ecuacion_cerca para los valores de x
-v = ecuacion_cerca(x)
+    # Calcular los valores de la función ecuacion_cerca para los valores de x
+    v = ecuacion_cerca(x)
 
-# Calcular la derivada de la función 200x - (8/3)x^2
-derivada = 200 - ((16 / 3) * x)
+    # Calcular la derivada de la función 200x - (8/3)x^2
+    derivada = 200 - ((16 / 3) * x)
 
-# Graficar la función y su derivada
-plt.plot(x, v, label='Ecuación')
-plt.plot(x, derivada, c='pink', label='Derivada')
+    # Graficar la función y su derivada
+    plt.plot(x, v, label='Ecuación')
+    plt.plot(x, derivada, c='pink', label='Derivada')
 
-# Añadir leyenda y mostrar la gráfica
-plt.legend()
-plt.show()
\ No newline at end of file
+    # Añadir leyenda y mostrar la gráfica
+    plt.legend()
+    plt.show()
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 def linspace(start, stop, step=1):
     """
@@ -27,26 +26,32 @@ def volumen_lata(r):
     """
     return 2 * 3.1416 * (r**2) + 500 / r
 
-# Generar valores de r y h
-r = linspace(0.5, 8, 0.1)
-h = linspace(0.5, 8, 0.1)
-
-# Calcular la superficie lateral y la superficie total de la lata
-sc = 2 * 3.1416 * (r**2)
-sl = 2 * 3.1416 * r * h
-S = 2 * 3.1416 * (r**2) + 500 / r
-
-# Calcular la altura de la lata con un radio específico
-h1 = 250 / (3.1416 * (3.414**2))
-#print("H:", h1)
-
-# Calcular el radio de la lata con un volumen específico (comentado)
-# r1 = np.sqrt((500 / (4 * 3.1416)), 3)
-#print(r1)
-
-# Graficar la relación entre el radio y la superficie total
-plt.plot(r, S)
-plt.xlabel("Radio (r)")
-plt.ylabel("Superficie Total (S)")
-plt.title("Relación entre el Radio y la Superficie Total de una Lata")
-plt.show()
+def main():
+    """Ejecuta los ejemplos del módulo y grafica los resultados."""
+    import matplotlib.pyplot as plt
+    # Generar valores de r y h
+    r = linspace(0.5, 8, 0.1)
+    h = linspace(0.5, 8, 0.1)
+
+    # Calcular la superficie lateral y la superficie total de la lata
+    sc = 2 * 3.1416 * (r**2)
+    sl = 2 * 3.1416 * r * h
+    S = 2 * 3.1416 * (r**2) + 500 / r
+
+    # Calcular la altura de la lata con un radio específico
+    h1 = 250 / (3.1416 * (3.414**2))
+    #print("H:", h1)
+
+    # Calcular el radio de la lata con un volumen específico (comentado)
+    # r1 = np.sqrt((500 / (4 * 3.1416)), 3)
+    #print(r1)
+
+    # Graficar la relación entre el radio y la superficie total
+    plt.plot(r, S)
+    plt.xlabel("Radio (r)")
+    plt.ylabel("Superficie Total (S)")
+    plt.title("Relación entre el Radio y la Superficie Total de una Lata")
+    plt.show()
+
+if __name__ == '__main__':
+    main()